@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+colorutils blend mode benchmark.
+
+Measures the time to compose one layer onto another with each registered blend mode, on 4K-sized (3840 x 2160)
+layers by default: element-wise, with another layer, and with a single color. Mode tables are built before timing.
+
+    python benchmarks/blend.py                           # every mode, on 4K layers
+    python benchmarks/blend.py --size 1920x1080          # on 1080p layers
+    python benchmarks/blend.py multiply screen           # only some modes
+"""
+from __future__ import division
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from colorutils import ArithmeticModel, ColorArray
+
+
+def _layer(n, seed):
+    """ A layer of n pseudo-random colors, generated without a Python object per color. """
+    data = bytearray()
+    state = seed
+    while len(data) < 3 * n:
+        state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        data += state.to_bytes(8, 'big')
+    return ColorArray(bytes(data[:3 * n]))
+
+
+def best(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark colorutils blend modes on image-sized layers.')
+    parser.add_argument('modes', nargs='*', help='blend modes to measure (default: all registered modes)')
+    parser.add_argument('--size', default='3840x2160', help='layer size, WIDTHxHEIGHT (default: 3840x2160)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement (default: 3)')
+    args = parser.parse_args(argv)
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    n = width * height
+    base, top = _layer(n, 1), _layer(n, 2)
+
+    print('{}x{} layers ({:,} colors)'.format(width, height, n))
+    print('{:<14}  {:>12}  {:>10}  {:>12}'.format('mode', 'layer (ms)', 'layers/s', 'color (ms)'))
+    for name in args.modes or sorted(ArithmeticModel.modes):
+        mode = ArithmeticModel.get(name)
+        mode.table()
+        base.arithmetic = mode
+
+        layer = best(lambda: base + top, args.repeat)
+        color = best(lambda: base + (32, 64, 128), args.repeat)
+        print('{:<14}  {:>12.1f}  {:>10.2f}  {:>12.1f}'.format(name, layer * 1000, 1 / layer, color * 1000))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
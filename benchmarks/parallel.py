@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+colorutils parallel scaling benchmark.
+
+Measures the throughput of colorutils.parallel bulk conversions for each number of worker processes from 1 up to the
+number of CPUs, and the speedup over a single process. Each conversion is timed on a pool that is already started.
+
+    python benchmarks/parallel.py                       # rgb -> hsv of 2,000,000 colors
+    python benchmarks/parallel.py --to lab -n 500000    # another conversion and size
+    python benchmarks/parallel.py --workers 1 2 4 8     # specific worker counts
+
+Scaling is bounded by the number of physical cores, and by the serial steps of each conversion: copying the input
+into shared memory and building the result list from the shared output.
+"""
+from __future__ import division
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from colorutils import convert, random_rgb_many
+from colorutils.parallel import ParallelConverter
+
+
+def _values(source, n):
+    """ A collection of n random colors in the source format. """
+    colors = random_rgb_many(n, rng=0)
+    if source == 'rgb':
+        return colors
+    return getattr(convert, 'rgb_to_{}_many'.format(source))(colors)
+
+
+def run(values, source, target, workers, chunk_size, repeat):
+    """ The best time of `repeat` conversions on a pool of `workers` processes. """
+    with ParallelConverter(workers, chunk_size) as converter:
+        # Start the pool, so that its startup is not timed
+        converter.convert(values[:2 * chunk_size], source, target)
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            converter.convert(values, source, target)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Benchmark the scaling of colorutils parallel conversions.')
+    parser.add_argument('--from', dest='source', default='rgb', help='format to convert from (default: rgb)')
+    parser.add_argument('--to', dest='target', default='hsv', help='format to convert to (default: hsv)')
+    parser.add_argument('-n', type=int, default=2000000, help='number of colors (default: 2000000)')
+    parser.add_argument('--chunk-size', type=int, default=1 << 16, help='colors per shard (default: 65536)')
+    parser.add_argument('--workers', type=int, nargs='+', default=list(range(1, cpus + 1)),
+                        help='worker counts to measure (default: 1 to the number of CPUs)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per worker count (default: 3)')
+    args = parser.parse_args(argv)
+
+    values = _values(args.source, args.n)
+    print('{} -> {}, {} colors, {} CPUs'.format(args.source, args.target, args.n, cpus))
+    print('{:>8}  {:>10}  {:>14}  {:>8}'.format('workers', 'time (s)', 'colors/s', 'speedup'))
+
+    serial = None
+    for workers in args.workers:
+        elapsed = run(values, args.source, args.target, workers, args.chunk_size, args.repeat)
+        serial = serial or elapsed
+        print('{:>8}  {:>10.3f}  {:>14,.0f}  {:>7.2f}x'.format(workers, elapsed, args.n / elapsed, serial / elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
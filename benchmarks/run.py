@@ -0,0 +1,374 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+colorutils benchmark suite.
+
+Measures per-call latency of the scalar conversions, Color properties and operators, color_run, text_color and the
+random generators, bulk throughput of the batch conversions, and the import time of the package and its palettes.
+Each benchmark also records the peak memory allocated by a single call.
+
+    python benchmarks/run.py                         # run everything and print a report
+    python benchmarks/run.py -k convert              # only benchmarks whose name contains 'convert'
+    python benchmarks/run.py --save baseline.json    # store the results as a baseline
+    python benchmarks/run.py --compare baseline.json # compare against a stored baseline
+
+The stored baseline in benchmarks/baseline.json was recorded on the reference machine; record a local baseline before
+comparing on other hardware.
+"""
+from __future__ import division
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import colorutils
+from colorutils import convert, memo
+
+
+BULK_SIZE = 100000
+
+benchmarks = []
+
+
+def benchmark(name, items=1, repeat=5):
+    """ Register a benchmark. The decorated function does any setup and returns the callable to be timed. """
+    def register(setup):
+        benchmarks.append({'name': name, 'setup': setup, 'items': items, 'repeat': repeat})
+        return setup
+    return register
+
+
+# -----------------------------------------------
+# Scalar conversions
+# -----------------------------------------------
+
+_samples = {
+    'rgb': (46, 139, 87),
+    'hex': '#2e8b57',
+    'web': 'seagreen',
+    'yiq': (0.413, -0.152, -0.143),
+    'hsv': (146.452, 0.669, 0.545),
+}
+
+for _source in _samples:
+    for _target in _samples:
+        if _source == _target:
+            continue
+        _fn = '{}_to_{}'.format(_source, _target)
+
+        @benchmark('convert.{}'.format(_fn))
+        def _scalar(fn=getattr(convert, _fn), value=_samples[_source]):
+            return lambda: fn(value)
+
+        @benchmark('convert.{}_many'.format(_fn), items=BULK_SIZE, repeat=3)
+        def _bulk(fn=getattr(convert, _fn + '_many'), source=_source):
+            values = _bulk_values(source)
+            return lambda: fn(values)
+
+
+for _fn in ('hex_to_rgb', 'hex_to_hsv', 'web_to_hsv'):
+    @benchmark('convert.{} (memo)'.format(_fn), repeat=3)
+    def _memoized(fn=getattr(convert, _fn), value=_samples[_fn[:3]].upper()):
+        # Timed with memoization enabled, restoring the scalar conversions for the other benchmarks
+        def run():
+            memo.enable()
+            try:
+                fn(value)
+                return min(timeit.repeat(lambda: fn(value), number=10000, repeat=5)) / 10000
+            finally:
+                memo.disable()
+        run.self_timed = True
+        return run
+
+
+def _bulk_values(source):
+    """ BULK_SIZE distinct-ish input values for a bulk conversion. """
+    rgbs = colorutils.random_rgb_many(BULK_SIZE, rng=0).rgb
+    if source == 'rgb':
+        return rgbs
+    if source == 'web':
+        return convert.rgb_to_web_many(rgbs)
+    return getattr(convert, 'rgb_to_{}_many'.format(source))(rgbs)
+
+
+# -----------------------------------------------
+# Color properties and operators
+# -----------------------------------------------
+
+for _prop in ('red', 'green', 'blue', 'rgb', 'hex', 'shorthex', 'web', 'yiq', 'hsv'):
+    @benchmark('Color.{}'.format(_prop))
+    def _getter(prop=_prop):
+        color = colorutils.Color((46, 139, 87), cache=False)
+        return lambda: getattr(color, prop)
+
+    @benchmark('Color.{} (cached)'.format(_prop))
+    def _cached_getter(prop=_prop):
+        color = colorutils.Color((46, 139, 87))
+        return lambda: getattr(color, prop)
+
+
+for _prop in ('hex', 'web', 'yiq', 'hsv'):
+    @benchmark('Color.{} setter'.format(_prop))
+    def _setter(prop=_prop):
+        color = colorutils.Color((46, 139, 87))
+        value = getattr(color, prop)
+        return lambda: setattr(color, prop, value)
+
+
+@benchmark('Color()')
+def _construct():
+    return lambda: colorutils.Color((46, 139, 87))
+
+
+@benchmark('Color.intern')
+def _intern():
+    colorutils.Color.intern((46, 139, 87))
+    return lambda: colorutils.Color.intern((46, 139, 87))
+
+
+@benchmark('Color.__iter__')
+def _iter():
+    color = colorutils.Color((46, 139, 87))
+    return lambda: tuple(color)
+
+
+@benchmark('Color.__add__')
+def _add():
+    c1, c2 = colorutils.Color((46, 139, 87)), colorutils.Color((100, 100, 100))
+    return lambda: c1 + c2
+
+
+@benchmark('Color.__add__ (BLEND)')
+def _add_blend():
+    c1 = colorutils.Color((46, 139, 87), arithmetic=colorutils.ArithmeticModel.BLEND)
+    c2 = colorutils.Color((100, 100, 100))
+    return lambda: c1 + c2
+
+
+for _name, _model in (('LIGHT', 'LIGHT'), ('BLEND', 'BLEND'), ('MULTIPLY', 'MULTIPLY')):
+    @benchmark('ColorArray.__add__ ({})'.format(_name), items=BULK_SIZE, repeat=3)
+    def _array_add(model=_model):
+        a1 = colorutils.random_rgb_many(BULK_SIZE, rng=0)
+        a1.arithmetic = getattr(colorutils.ArithmeticModel, model)
+        a2 = colorutils.random_rgb_many(BULK_SIZE, rng=1)
+        return lambda: a1 + a2
+
+
+@benchmark('ColorArray.__add__ (color)', items=BULK_SIZE, repeat=3)
+def _array_add_color():
+    a1 = colorutils.random_rgb_many(BULK_SIZE, rng=0)
+    return lambda: a1 + (10, 20, 30)
+
+
+@benchmark('ColorArray.__sub__', items=BULK_SIZE, repeat=3)
+def _array_sub():
+    a1, a2 = colorutils.random_rgb_many(BULK_SIZE, rng=0), colorutils.random_rgb_many(BULK_SIZE, rng=1)
+    return lambda: a1 - a2
+
+
+@benchmark('RGBAArray.over', items=BULK_SIZE, repeat=3)
+def _rgba_over():
+    top = colorutils.RGBAArray(bytes(range(256)) * (BULK_SIZE // 64), premultiplied=True)
+    bottom = colorutils.RGBAArray(bytes(range(255, -1, -1)) * (BULK_SIZE // 64), premultiplied=True)
+    return lambda: top.over(bottom)
+
+
+@benchmark('RGBAArray.over (straight)', items=BULK_SIZE, repeat=3)
+def _rgba_over_straight():
+    top = colorutils.RGBAArray(bytes(range(256)) * (BULK_SIZE // 64))
+    bottom = colorutils.RGBAArray(bytes(range(255, -1, -1)) * (BULK_SIZE // 64))
+    return lambda: top.over(bottom)
+
+
+@benchmark('RGBAColor.over')
+def _rgba_color_over():
+    c1, c2 = colorutils.RGBAColor((255, 0, 0, 128)), colorutils.RGBAColor((46, 139, 87))
+    return lambda: c1.over(c2)
+
+
+@benchmark('Color.__sub__')
+def _sub():
+    c1, c2 = colorutils.Color((46, 139, 87)), colorutils.Color((10, 10, 10))
+    return lambda: c1 - c2
+
+
+@benchmark('Color.__eq__')
+def _eq():
+    c1, c2 = colorutils.Color((46, 139, 87)), colorutils.Color((46, 139, 87))
+    return lambda: c1 == c2
+
+
+@benchmark('Color.__ne__')
+def _ne():
+    c1, c2 = colorutils.Color((46, 139, 87)), colorutils.Color((46, 139, 88))
+    return lambda: c1 != c2
+
+
+# -----------------------------------------------
+# Utility functions
+# -----------------------------------------------
+
+for _steps in (10, 1000, 100000):
+    @benchmark('color_run({})'.format(_steps), items=_steps + 1, repeat=3)
+    def _run(steps=_steps):
+        return lambda: colorutils.color_run((0, 0, 0), (255, 128, 64), steps)
+
+
+@benchmark('text_color')
+def _text_color():
+    return lambda: colorutils.text_color((46, 139, 87))
+
+
+@benchmark('contrast_ratio')
+def _contrast_ratio():
+    from colorutils.contrast import contrast_ratio
+    return lambda: contrast_ratio((46, 139, 87), (255, 255, 255))
+
+
+@benchmark('best_contrast_many', items=BULK_SIZE, repeat=3)
+def _best_contrast_many():
+    from colorutils.contrast import best_contrast_many
+    # A dashboard's worth of cells, over a limited set of background colors
+    backgrounds = colorutils.random_rgb_many(1000, rng=0).rgb * (BULK_SIZE // 1000)
+    candidates = [(0, 0, 0), (255, 255, 255), (0, 51, 102), (255, 255, 204)]
+    return lambda: best_contrast_many(backgrounds, candidates, level='AA')
+
+
+@benchmark('random_rgb')
+def _random_rgb():
+    return colorutils.random_rgb
+
+
+@benchmark('random_hex')
+def _random_hex():
+    return colorutils.random_hex
+
+
+@benchmark('random_web')
+def _random_web():
+    return colorutils.random_web
+
+
+@benchmark('offset_random_rgb')
+def _offset_random_rgb():
+    return lambda: colorutils.offset_random_rgb((46, 139, 87))
+
+
+@benchmark('random_rgb_many', items=BULK_SIZE, repeat=3)
+def _random_rgb_many():
+    return lambda: colorutils.random_rgb_many(BULK_SIZE, rng=0)
+
+
+@benchmark('random_hex_many', items=BULK_SIZE, repeat=3)
+def _random_hex_many():
+    return lambda: colorutils.random_hex_many(BULK_SIZE, rng=0)
+
+
+# -----------------------------------------------
+# Import time
+# -----------------------------------------------
+
+for _module in ('colorutils', 'colorutils.palettes.grayscale', 'colorutils.palettes.primary', 'colorutils.palettes.rgb',
+                'colorutils.palettes.roygbv', 'colorutils.palettes.secondary'):
+    @benchmark('import {}'.format(_module), repeat=3)
+    def _import(module=_module):
+        code = 'import time; t = time.perf_counter(); import {}; print(time.perf_counter() - t)'.format(module)
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        def run():
+            return float(subprocess.check_output([sys.executable, '-c', code], cwd=root))
+        run.self_timed = True
+        return run
+
+
+# -----------------------------------------------
+# Runner
+# -----------------------------------------------
+
+
+def measure(bench):
+    """ Time a benchmark, returning the best time per call (and per item) and the peak memory of one call. """
+    fn = bench['setup']()
+
+    if getattr(fn, 'self_timed', False):
+        best = min(fn() for _ in range(bench['repeat']))
+        return {'seconds': best, 'per_item': best / bench['items'], 'peak_bytes': None}
+
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=bench['repeat'], number=number)) / number
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'seconds': best, 'per_item': best / bench['items'], 'peak_bytes': peak}
+
+
+def _format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return '{:.2f} {}'.format(seconds / scale, unit)
+    return '{:.0f} ns'.format(seconds / 1e-9)
+
+
+def report(results, baseline=None, threshold=0.1):
+    """ Format the results as a table, with the change against a baseline if given. Returns (text, regressions). """
+    lines = ['{:<40} {:>12} {:>14} {:>12}{}'.format('benchmark', 'time/call', 'throughput', 'peak mem',
+                                                      '  vs baseline' if baseline else '')]
+    regressions = []
+    for name, r in results.items():
+        items = r['seconds'] / r['per_item'] if r['per_item'] else 1
+        throughput = '{:.0f}/s'.format(items / r['seconds']) if items > 1 else ''
+        peak = '{:.1f} KiB'.format(r['peak_bytes'] / 1024) if r['peak_bytes'] is not None else ''
+        line = '{:<40} {:>12} {:>14} {:>12}'.format(name, _format_time(r['seconds']), throughput, peak)
+
+        if baseline and name in baseline:
+            change = r['seconds'] / baseline[name]['seconds'] - 1
+            flag = ' REGRESSION' if change > threshold else (' improved' if change < -threshold else '')
+            line += '  {:+.1%}{}'.format(change, flag)
+            if change > threshold:
+                regressions.append(name)
+        lines.append(line)
+    return '\n'.join(lines), regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the colorutils benchmark suite.')
+    parser.add_argument('-k', dest='filter', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--save', metavar='PATH', help='save the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare the results against a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.1, help='slowdown reported as a regression (0.1)')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for bench in benchmarks:
+        if args.filter and args.filter not in bench['name']:
+            continue
+        results[bench['name']] = measure(bench)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+    text, regressions = report(results, baseline, args.threshold)
+    print(text)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'python': platform.python_version(), 'version': colorutils.__version__, 'results': results},
+                      f, indent=2, sort_keys=True)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+colorutils conversion server load generator.
+
+Opens a number of concurrent connections to a conversion server, each sending requests of a few colors and waiting for
+each response before sending the next, and reports the throughput, the client-side latency percentiles and the
+server's batching metrics.
+
+    python benchmarks/serve_load.py                        # against a server started in this process
+    python benchmarks/serve_load.py --port 8765            # against a running server
+    python benchmarks/serve_load.py --unix /tmp/cu.sock    # against a running server on a Unix socket
+    python benchmarks/serve_load.py -c 64 --size 4 --window 1
+
+With an in-process server, the client and server share one event loop (and CPU), as they would on a loaded host.
+"""
+from __future__ import division
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from colorutils import convert, random_rgb_many
+from colorutils.server import BatchConverter, _percentile, start_server
+
+
+async def _connect(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def client(args, values, latencies):
+    """ Send `args.requests` requests on one connection, recording the latency of each. """
+    reader, writer = await _connect(args)
+    try:
+        for i in range(args.requests):
+            start = i * args.size % (len(values) - args.size)
+            line = json.dumps({'id': i, 'from': args.source, 'to': args.target,
+                               'values': values[start:start + args.size]})
+            sent = time.perf_counter()
+            writer.write(line.encode('utf-8') + b'\n')
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent)
+            if 'error' in response:
+                raise RuntimeError(response['error'])
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def server_metrics(args):
+    reader, writer = await _connect(args)
+    try:
+        writer.write(b'{"metrics": true}\n')
+        return json.loads(await reader.readline())['metrics']
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run(args):
+    server = None
+    if args.port is None and not args.unix:
+        server = await start_server(BatchConverter(args.window / 1000, args.max_batch), args.host, 0)
+        args.port = server.sockets[0].getsockname()[1]
+
+    colors = random_rgb_many(10000, rng=0).rgb
+    values = colors if args.source == 'rgb' else getattr(convert, 'rgb_to_{}_many'.format(args.source))(colors)
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*[client(args, values, latencies) for _ in range(args.connections)])
+    elapsed = time.perf_counter() - start
+    metrics = await server_metrics(args)
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    latencies.sort()
+    requests = len(latencies)
+    print('{} -> {}: {} connections x {} requests of {} colors'.format(
+        args.source, args.target, args.connections, args.requests, args.size))
+    print('  {:,.0f} requests/s, {:,.0f} colors/s'.format(requests / elapsed, requests * args.size / elapsed))
+    print('  client latency p50 {:.3f} ms, p99 {:.3f} ms'.format(_percentile(latencies, 0.50) * 1000,
+                                                                 _percentile(latencies, 0.99) * 1000))
+    print('  server: {}'.format(json.dumps(metrics)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate load against a colorutils conversion server.')
+    parser.add_argument('--host', default='127.0.0.1', help='server address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, help='server port (default: start a server in this process)')
+    parser.add_argument('--unix', metavar='PATH', help='server Unix socket')
+    parser.add_argument('--from', dest='source', default='hex', help='format to convert from (default: hex)')
+    parser.add_argument('--to', dest='target', default='hsv', help='format to convert to (default: hsv)')
+    parser.add_argument('-c', '--connections', type=int, default=32, help='concurrent connections (default: 32)')
+    parser.add_argument('-n', '--requests', type=int, default=500, help='requests per connection (default: 500)')
+    parser.add_argument('--size', type=int, default=8, help='colors per request (default: 8)')
+    parser.add_argument('--window', type=float, default=2.0, help='in-process server latency window in ms (default: 2)')
+    parser.add_argument('--max-batch', type=int, default=4096, help='in-process server batch size (default: 4096)')
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,30 @@
 from .colorutils import *
+from .colorutils import __getattr__
+
+__all__ = [
+    # Colors
+    'Color', 'PackedColor', 'ColorArray', 'RGBAColor', 'RGBAArray', 'Format', 'ArithmeticModel', 'ColorException',
+    'RGB_eq', 'web_colors', 'rgb_min', 'rgb_max', 'rgb_min_val', 'rgb_max_val',
+    # Conversions
+    'rgb_to_hex', 'rgb_to_web', 'rgb_to_yiq', 'rgb_to_hsv', 'hex_to_rgb', 'hex_to_web', 'hex_to_yiq', 'hex_to_hsv',
+    'web_to_rgb', 'web_to_hex', 'web_to_yiq', 'web_to_hsv', 'yiq_to_rgb', 'yiq_to_hex', 'yiq_to_web', 'yiq_to_hsv',
+    'hsv_to_rgb', 'hsv_to_hex', 'hsv_to_web', 'hsv_to_yiq', 'rgb_to_xyz', 'xyz_to_lab', 'rgb_to_lab', 'rgba_to_hex',
+    'hex_to_rgba',
+    # Bulk conversions
+    'rgb_to_hex_many', 'rgb_to_web_many', 'rgb_to_yiq_many', 'rgb_to_hsv_many', 'hex_to_rgb_many', 'hex_to_web_many',
+    'hex_to_yiq_many', 'hex_to_hsv_many', 'web_to_rgb_many', 'web_to_hex_many', 'web_to_yiq_many', 'web_to_hsv_many',
+    'yiq_to_rgb_many', 'yiq_to_hex_many', 'yiq_to_web_many', 'yiq_to_hsv_many', 'hsv_to_rgb_many', 'hsv_to_hex_many',
+    'hsv_to_web_many', 'hsv_to_yiq_many', 'rgb_to_xyz_many', 'xyz_to_lab_many', 'rgb_to_lab_many', 'rgba_to_hex_many',
+    'hex_to_rgba_many',
+    # Random colors
+    'random_rgb', 'random_hex', 'random_web', 'offset_random_rgb', 'offset_random_hex', 'offset_random_web',
+    'iter_random_rgb', 'iter_offset_random_rgb', 'random_streams', 'random_rgb_many', 'random_hex_many',
+    'random_web_many', 'offset_random_rgb_many', 'offset_random_hex_many', 'offset_random_web_many',
+    # Other color functions
+    'color_run', 'iter_color_run', 'text_color', 'minify_hex',
+    # Modules, as exported before the list was explicit
+    'colorutils', 'convert', 'equality', 'exceptions', 'static',
+]
 
 __author__ = "Erick Daniszewski"
 __email__ = "edaniszewski@gmail.com"
@@ -0,0 +1,618 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Blend modes for color arithmetic.
+
+A blend mode combines a base color with another color, channel by channel. Each mode has a scalar kernel, a function
+of two channel values used by Color addition, and a vectorized kernel combining packed buffers of 8-bit channels, used
+by ColorArray addition. The vectorized kernel of most modes is a lookup in a 256 x 256 table of the scalar kernel's
+results; the LIGHT, BLEND, darken, lighten and difference modes instead operate on a whole buffer at once, as a
+single large integer.
+
+The modes are registered with the ArithmeticModel class:
+
+    >>> Color((200, 100, 50), arithmetic=ArithmeticModel.MULTIPLY) + (128, 128, 128)
+    <Color (100, 50, 25)>
+
+New modes can be registered from their scalar kernel:
+
+    >>> ArithmeticModel.register('average-up', lambda a, b: (a + b + 1) // 2)
+"""
+from __future__ import division
+import array
+import math
+import sys
+
+from .static import rgb_min_val, rgb_max_val
+from .exceptions import ColorException
+
+
+def _clamp_channel(value):
+    """ Round a channel value to the nearest integer in [0, 255]. """
+    return min(max(int(round(value)), rgb_min_val), rgb_max_val)
+
+
+# -----------------------------------------------
+# Packed kernels
+# -----------------------------------------------
+
+# Maps the high byte of a 16-bit lane (0 or 1) to a mask of its low byte
+_lane_masks = bytes((0, 255)) + bytes(254)
+
+# Maps each byte to its negation, modulo 256
+_negations = bytes(-v & 0xff for v in range(256))
+
+
+def _lanes(packed):
+    """
+    Widen packed 8-bit channel values into the 16-bit big-endian lanes of a single integer, so that a whole buffer
+    can be added or subtracted in one integer operation without carries crossing between channels.
+    """
+    words = bytearray(2 * len(packed))
+    words[1::2] = packed
+    return int.from_bytes(words, 'big')
+
+
+def _compare(a, b):
+    """
+    Subtract two packed buffers element-wise, as the low bytes of (a - b) modulo 256 and a mask which is 255 where
+    a >= b and 0 elsewhere.
+    """
+    n = len(a)
+    # Offset each lane by 256, so no lane borrows from the next; the high byte of a lane is then 1 unless it underflowed
+    words = (_lanes(a) + int.from_bytes(b'\x01\x00' * n, 'big') - _lanes(b)).to_bytes(2 * n, 'big')
+    return words[1::2], words[0::2].translate(_lane_masks)
+
+
+def _light_packed(a, b):
+    """ Add two packed buffers element-wise, saturating at 255. """
+    n = len(a)
+    words = (_lanes(a) + _lanes(b)).to_bytes(2 * n, 'big')
+    saturated = int.from_bytes(words[1::2], 'big') | int.from_bytes(words[0::2].translate(_lane_masks), 'big')
+    return saturated.to_bytes(n, 'big')
+
+
+def _blend_packed(a, b):
+    """ Average two packed buffers element-wise, rounding down. """
+    # The low byte of each halved lane is exact; the bit shifted in from the lane above lands in the high byte
+    return ((_lanes(a) + _lanes(b)) >> 1).to_bytes(2 * len(a), 'big')[1::2]
+
+
+def _subtract_packed(a, b):
+    """ Subtract two packed buffers element-wise, saturating at 0. """
+    difference, mask = _compare(a, b)
+    return (int.from_bytes(difference, 'big') & int.from_bytes(mask, 'big')).to_bytes(len(a), 'big')
+
+
+def _select(a, b, mask):
+    """ Select the channels of a where the mask is 255, and of b elsewhere. """
+    mask = int.from_bytes(mask, 'big')
+    return ((int.from_bytes(a, 'big') & mask) | (int.from_bytes(b, 'big') & ~mask)).to_bytes(len(a), 'big')
+
+
+def _darken_packed(a, b):
+    return _select(b, a, _compare(a, b)[1])
+
+
+def _lighten_packed(a, b):
+    return _select(a, b, _compare(a, b)[1])
+
+
+def _difference_packed(a, b):
+    difference, mask = _compare(a, b)
+    return _select(difference, difference.translate(_negations), mask)
+
+
+# -----------------------------------------------
+# Blend Modes
+# -----------------------------------------------
+
+
+class BlendMode(object):
+    """
+    BlendMode is a way of combining two colors, given by its scalar kernel: a function of a base channel value and
+    another channel value. For 8-bit channel values the result is rounded and clamped to [0, 255].
+    """
+    def __init__(self, name, fn, packed=None):
+        """
+        Initialization
+
+        :param name: The name of the mode.
+        :param fn: The scalar kernel, a function of a base channel value and another channel value.
+        :param packed: An optional vectorized kernel, a function of two equal-length bytes-like objects of 8-bit
+                       channel values, returning the combined channel values as bytes (default a table lookup).
+        """
+        self.name = name
+        self.fn = fn
+        self._packed = packed
+        self._table = None
+        self._rows = {}
+
+    def __repr__(self):
+        return '<BlendMode {}>'.format(self.name)
+
+    def __call__(self, rgb1, rgb2):
+        """
+        Blend two colors.
+
+        :param rgb1: The base RGB 3-tuple.
+        :param rgb2: The other RGB 3-tuple.
+        :return: The blended RGB 3-tuple.
+        :rtype: tuple
+        """
+        fn = self.fn
+        return fn(rgb1[0], rgb2[0]), fn(rgb1[1], rgb2[1]), fn(rgb1[2], rgb2[2])
+
+    def table(self):
+        """
+        Get the 256 x 256 table of the mode's results for every pair of 8-bit channel values, indexed by
+        base * 256 + other.
+
+        :return: The table.
+        :rtype: bytes
+        """
+        if self._table is None:
+            fn = self.fn
+            self._table = bytes(_clamp_channel(fn(a, b)) for a in range(256) for b in range(256))
+        return self._table
+
+    def row(self, value, base=False):
+        """
+        Get the translation table blending each 8-bit base channel value with a single other channel value, or with
+        `base` set, a single base channel value with each 8-bit other channel value.
+
+        :param value: The other channel value, or with `base` set, the base channel value.
+        :param base: Flag indicating the value is the base channel value (default False).
+        :return: The translation table, for bytes.translate.
+        :rtype: bytes
+        """
+        key = (value, base)
+        try:
+            return self._rows[key]
+        except KeyError:
+            pass
+        fn = self.fn
+        if isinstance(value, int) and 0 <= value <= 255:
+            row = self.table()[value * 256:value * 256 + 256] if base else self.table()[value::256]
+        elif base:
+            row = bytes(_clamp_channel(fn(value, b)) for b in range(256))
+        else:
+            row = bytes(_clamp_channel(fn(a, value)) for a in range(256))
+        if len(self._rows) >= 1024:
+            self._rows.clear()
+        self._rows[key] = row
+        return row
+
+    def blend_packed(self, base, other):
+        """
+        Blend two bytes-like objects of 8-bit channel values element-wise.
+
+        :param base: The base channel values.
+        :param other: The other channel values, as many as the base.
+        :return: The blended channel values.
+        :rtype: bytes
+        """
+        if len(base) != len(other):
+            raise ColorException('Cannot blend {} channel values with {}'.format(len(base), len(other)))
+        if self._packed is not None:
+            return self._packed(base, other)
+
+        # Pair the channel values into native 16-bit table indices, base * 256 + other
+        words = bytearray(2 * len(base))
+        if sys.byteorder == 'big':
+            words[0::2], words[1::2] = base, other
+        else:
+            words[1::2], words[0::2] = base, other
+        return bytes(map(self.table().__getitem__, memoryview(words).cast('H')))
+
+
+# -----------------------------------------------
+# Scalar kernels
+# -----------------------------------------------
+
+
+def _multiply(a, b):
+    return (a * b + 127) // 255
+
+
+def _screen(a, b):
+    return a + b - (a * b + 127) // 255
+
+
+def _overlay(a, b):
+    if a < 128:
+        return (2 * a * b + 127) // 255
+    return 255 - (2 * (255 - a) * (255 - b) + 127) // 255
+
+
+def _soft_light(a, b):
+    """ The W3C soft-light formula, on 8-bit channel values. """
+    cb, cs = min(max(a / 255, 0), 1), min(max(b / 255, 0), 1)
+    if cs <= 0.5:
+        result = cb - (1 - 2 * cs) * cb * (1 - cb)
+    else:
+        d = ((16 * cb - 12) * cb + 4) * cb if cb <= 0.25 else math.sqrt(cb)
+        result = cb + (2 * cs - 1) * (d - cb)
+    return int(round(result * 255))
+
+
+# -----------------------------------------------
+# Arithmetic Models
+# -----------------------------------------------
+
+
+class ArithmeticModel(object):
+    """
+    ArithmeticModel contains well-known arithmetic models which determine the additive behavior of the Color class. The
+    default model is the light model (behaves similar to adding light). The blend model averages the colors, and the
+    further blend modes (MULTIPLY, SCREEN, OVERLAY, DARKEN, LIGHTEN, DIFFERENCE, SOFT_LIGHT and ALPHA_OVER) follow the
+    usual compositing formulae, with the first color as the base. Each model is a BlendMode, registered by name in
+    ArithmeticModel.modes.
+
+    Note that Color subtraction happens in the same manner, regardless of the arithmetic model chosen.
+
+    Reference: http://stackoverflow.com/questions/726549/algorithm-for-additive-color-mixing-for-rgb-values
+    """
+    modes = {}
+
+    @classmethod
+    def register(cls, name, fn, packed=None):
+        """
+        Register a blend mode, also available as the upper-cased attribute of its name (e.g. 'soft-light' as
+        ArithmeticModel.SOFT_LIGHT).
+
+        :param name: The name of the mode.
+        :param fn: The scalar kernel, a function of a base channel value and another channel value.
+        :param packed: An optional vectorized kernel, a function of two equal-length bytes-like objects of 8-bit
+                       channel values, returning the combined channel values as bytes (default a table lookup).
+        :return: The blend mode.
+        :rtype: BlendMode
+        """
+        mode = BlendMode(name, fn, packed)
+        cls.modes[name] = mode
+        setattr(cls, name.upper().replace('-', '_'), mode)
+        return mode
+
+    @classmethod
+    def get(cls, model):
+        """
+        Get a blend mode.
+
+        :param model: A BlendMode, the name of a registered mode, or the index of LIGHT (0) or BLEND (1).
+        :return: The blend mode.
+        :rtype: BlendMode
+        """
+        if isinstance(model, BlendMode):
+            return model
+        try:
+            if isinstance(model, int):
+                return {0: cls.LIGHT, 1: cls.BLEND}[model]
+            return cls.modes[model]
+        except (KeyError, TypeError):
+            raise ColorException('Unknown arithmetic model: {}'.format(model))
+
+    @staticmethod
+    def alpha_over(opacity):
+        """
+        Get the blend mode placing the other color over the base color with the given opacity.
+
+        :param opacity: The opacity of the other color, in [0, 1].
+        :return: The blend mode.
+        :rtype: BlendMode
+        """
+        if not 0 <= opacity <= 1:
+            raise ColorException('Opacity must be in [0, 1], got {}'.format(opacity))
+        return BlendMode('alpha-over({})'.format(opacity), lambda a, b: int(round(b * opacity + a * (1 - opacity))))
+
+
+ArithmeticModel.register('light', lambda a, b: min(a + b, rgb_max_val), _light_packed)
+ArithmeticModel.register('blend', lambda a, b: (a + b) // 2, _blend_packed)
+ArithmeticModel.register('multiply', _multiply)
+ArithmeticModel.register('screen', _screen)
+ArithmeticModel.register('overlay', _overlay)
+ArithmeticModel.register('darken', min, _darken_packed)
+ArithmeticModel.register('lighten', max, _lighten_packed)
+ArithmeticModel.register('difference', lambda a, b: abs(a - b), _difference_packed)
+ArithmeticModel.register('soft-light', _soft_light)
+ArithmeticModel.register('alpha-over', ArithmeticModel.alpha_over(0.5).fn)
+
+# Subtraction, the inverse of the LIGHT model; not an arithmetic model of its own
+SUBTRACT = BlendMode('subtract', lambda a, b: max(a - b, rgb_min_val), _subtract_packed)
+
+
+# -----------------------------------------------
+# Porter-Duff Compositing
+# -----------------------------------------------
+#
+# Compositing operates on RGBA colors with premultiplied alpha, where each color channel is scaled by the alpha of
+# the color. Each Porter-Duff operator scales the source color by a factor Fa and the destination color by a factor
+# Fb, and adds the results; the factors are 0, 1, the alpha of the source or destination (as) and (ad), or their
+# complements. Packed buffers hold 8-bit RGBA quads.
+#
+# Colors stored premultiplied are composited as they are, in 8-bit premultiplied values (composite and
+# composite_packed). Colors stored straight are composited without storing their premultiplied values, so the result
+# is exact up to a single rounding (composite_straight and composite_straight_packed): 8-bit premultiplied values
+# lose the color of nearly transparent colors, e.g. (200, 100, 50) at alpha 10 is stored as (8, 4, 2).
+
+porter_duff = {
+    'clear': ('0', '0'),
+    'src': ('1', '0'),
+    'dst': ('0', '1'),
+    'over': ('1', '1-as'),
+    'dest-over': ('1-ad', '1'),
+    'in': ('ad', '0'),
+    'dest-in': ('0', 'as'),
+    'out': ('1-ad', '0'),
+    'dest-out': ('0', '1-as'),
+    'atop': ('ad', '1-as'),
+    'dest-atop': ('1-ad', 'as'),
+    'xor': ('1-ad', '1-as'),
+}
+
+# Maps each byte to its complement, 255 - v
+_complements = bytes(255 - v for v in range(256))
+
+# The tables of composite_straight_packed, by operator, and the number of colors it composites at a time
+_straight_tables = {}
+_straight_chunk = 16384
+
+# Divides a premultiplied channel value by an alpha value, to recover the straight channel value
+UNPREMULTIPLY = BlendMode('unpremultiply', lambda c, a: min((c * 255 + a // 2) // a, rgb_max_val) if a else 0)
+
+
+def _operator(op):
+    """ Get the factors of a Porter-Duff operator. """
+    try:
+        return porter_duff[op]
+    except KeyError:
+        raise ColorException('Unknown compositing operator: {}'.format(op))
+
+
+def _factor(factor, sa, da):
+    """ The 8-bit value of a Porter-Duff factor, given the source and destination alpha. """
+    if factor in ('0', '1'):
+        return 255 * int(factor)
+    value = sa if factor[-1] == 's' else da
+    return 255 - value if factor.startswith('1-') else value
+
+
+def premultiply(rgba):
+    """
+    Scale the color channels of a straight RGBA color by its alpha.
+
+    :param rgba: An RGBA 4-tuple of 8-bit values.
+    :return: The premultiplied RGBA 4-tuple.
+    :rtype: tuple
+    """
+    r, g, b, a = rgba
+    return _multiply(r, a), _multiply(g, a), _multiply(b, a), a
+
+
+def unpremultiply(rgba):
+    """
+    Recover the straight RGBA color of a premultiplied RGBA color.
+
+    :param rgba: A premultiplied RGBA 4-tuple of 8-bit values.
+    :return: The straight RGBA 4-tuple.
+    :rtype: tuple
+    """
+    fn = UNPREMULTIPLY.fn
+    r, g, b, a = rgba
+    return fn(r, a), fn(g, a), fn(b, a), a
+
+
+def composite(src, dst, op='over'):
+    """
+    Composite two premultiplied RGBA colors with a Porter-Duff operator.
+
+    :param src: The premultiplied source RGBA 4-tuple (e.g. the upper layer, for 'over').
+    :param dst: The premultiplied destination RGBA 4-tuple.
+    :param op: The operator, one of colorutils.blend.porter_duff (default 'over').
+    :return: The premultiplied RGBA 4-tuple of the result.
+    :rtype: tuple
+    """
+    fa, fb = _operator(op)
+    fa, fb = _factor(fa, src[3], dst[3]), _factor(fb, src[3], dst[3])
+    return tuple(min(_multiply(s, fa) + _multiply(d, fb), rgb_max_val) for s, d in zip(src, dst))
+
+
+def _weights(op):
+    """
+    Get a function of the source and destination alpha giving the weights of the source and destination colors,
+    as * Fa and ad * Fb, scaled by 255 * 255.
+    """
+    fa, fb = _operator(op)
+    return lambda sa, da: (sa * _factor(fa, sa, da), da * _factor(fb, sa, da))
+
+
+def composite_straight(src, dst, op='over'):
+    """
+    Composite two straight RGBA colors with a Porter-Duff operator. The result is computed from the full precision
+    premultiplied colors, and rounded once.
+
+    :param src: The straight source RGBA 4-tuple (e.g. the upper layer, for 'over').
+    :param dst: The straight destination RGBA 4-tuple.
+    :param op: The operator, one of colorutils.blend.porter_duff (default 'over').
+    :return: The straight RGBA 4-tuple of the result.
+    :rtype: tuple
+    """
+    ws, wd = _weights(op)(src[3], dst[3])
+    w = ws + wd
+    if not w:
+        return 0, 0, 0, 0
+    half = w // 2
+    return ((src[0] * ws + dst[0] * wd + half) // w, (src[1] * ws + dst[1] * wd + half) // w,
+            (src[2] * ws + dst[2] * wd + half) // w, (w + 127) // 255)
+
+
+def _alpha_lanes(packed, complement=False, opaque=False):
+    """
+    Spread the alpha of each packed RGBA quad over the quad (or only its color channels, with `opaque`, leaving 255
+    for the alpha channel), optionally as its complement.
+    """
+    alpha = bytes(packed[3::4])
+    if complement:
+        alpha = alpha.translate(_complements)
+    lanes = bytearray(len(packed))
+    for k in range(3 if opaque else 4):
+        lanes[k::4] = alpha
+    if opaque:
+        lanes[3::4] = b'\xff' * len(alpha)
+    return lanes
+
+
+def premultiply_packed(packed):
+    """
+    Scale the color channels of packed straight RGBA quads by their alpha.
+
+    :param packed: A bytes-like object of straight RGBA quads.
+    :return: The premultiplied RGBA quads.
+    :rtype: bytes
+    """
+    return ArithmeticModel.MULTIPLY.blend_packed(packed, _alpha_lanes(packed, opaque=True))
+
+
+def unpremultiply_packed(packed):
+    """
+    Recover the straight RGBA quads of packed premultiplied RGBA quads.
+
+    :param packed: A bytes-like object of premultiplied RGBA quads.
+    :return: The straight RGBA quads.
+    :rtype: bytes
+    """
+    return UNPREMULTIPLY.blend_packed(packed, _alpha_lanes(packed, opaque=True))
+
+
+def composite_packed(src, dst, op='over'):
+    """
+    Composite packed premultiplied RGBA quads with a Porter-Duff operator, element-wise.
+
+    :param src: A bytes-like object of premultiplied source RGBA quads.
+    :param dst: A bytes-like object of as many premultiplied destination RGBA quads.
+    :param op: The operator, one of colorutils.blend.porter_duff (default 'over').
+    :return: The premultiplied RGBA quads of the result.
+    :rtype: bytes
+    """
+    if len(src) != len(dst):
+        raise ColorException('Cannot composite {} colors with {}'.format(len(src) // 4, len(dst) // 4))
+
+    terms = []
+    for colors, factor in zip((src, dst), _operator(op)):
+        if factor == '1':
+            terms.append(bytes(colors))
+        elif factor != '0':
+            lanes = _alpha_lanes(src if factor[-1] == 's' else dst, complement=factor.startswith('1-'))
+            terms.append(ArithmeticModel.MULTIPLY.blend_packed(colors, lanes))
+
+    if not terms:
+        return bytes(len(src))
+    if len(terms) == 1:
+        return terms[0]
+    return _light_packed(terms[0], terms[1])
+
+
+def _straight_table(op):
+    """
+    Get the table of a Porter-Duff operator for composite_straight_packed, indexed by sa * 256 + da: each entry packs
+    the 8-bit alpha of the result, the total weight w = ws + wd (1 where it is 0) and the weights ws and wd, as 16-bit
+    fields from the high end down.
+    """
+    try:
+        return _straight_tables[op]
+    except KeyError:
+        pass
+    weights = _weights(op)
+    table = []
+    for sa in range(256):
+        for da in range(256):
+            ws, wd = weights(sa, da)
+            w = ws + wd
+            table.append(((w + 127) // 255) << 48 | (w or 1) << 32 | ws << 16 | wd)
+    _straight_tables[op] = table
+    return table
+
+
+def _wide_lanes(count, *fields):
+    """
+    Place bytes-like objects of count values each, from the high byte down, in the low bytes of the 32-bit big-endian
+    lanes of a single integer.
+    """
+    words = bytearray(4 * count)
+    for k, field in enumerate(fields, 4 - len(fields)):
+        words[k::4] = field
+    return int.from_bytes(words, 'big')
+
+
+def _composite_straight_chunk(src, dst, table):
+    """ Composite packed straight RGBA quads, as composite_straight_packed, with the table of the operator. """
+    n = len(src) // 4
+    m = 3 * n
+
+    # Look up the alpha and weights of each pair of alpha values, as big-endian 64-bit entries
+    words = bytearray(2 * n)
+    if sys.byteorder == 'big':
+        words[0::2], words[1::2] = src[3::4], dst[3::4]
+    else:
+        words[1::2], words[0::2] = src[3::4], dst[3::4]
+    entries = array.array('Q', map(table.__getitem__, memoryview(words).cast('H')))
+    if sys.byteorder != 'big':
+        entries.byteswap()
+    entries = entries.tobytes()
+
+    # One 32-bit lane for each color channel, the red channels of the colors first, then the green, then the blue
+    w = _wide_lanes(m, entries[2::8] * 3, entries[3::8] * 3)
+    ws = _wide_lanes(m, entries[4::8] * 3, entries[5::8] * 3)
+    wd = _wide_lanes(m, entries[6::8] * 3, entries[7::8] * 3)
+    s = _wide_lanes(m, bytes(src[0::4]) + bytes(src[1::4]) + bytes(src[2::4]))
+    d = _wide_lanes(m, bytes(dst[0::4]) + bytes(dst[1::4]) + bytes(dst[2::4]))
+    ones = int.from_bytes(b'\x00\x00\x00\x01' * m, 'big')
+
+    # The numerators s * ws + d * wd + w // 2 (below 2 ** 25), multiplying by the bits of s and d, from the highest
+    numerator = 0
+    for bit in range(7, -1, -1):
+        numerator <<= 1
+        if ws:
+            numerator += ws & ((s >> bit) & ones) * 0xffff
+        if wd:
+            numerator += wd & ((d >> bit) & ones) * 0xffff
+    numerator += (w >> 1) & ones * 0x7fff
+
+    # Long division by w, one bit of the 8-bit quotient at a time; a lane keeps its guard bit where the remainder is
+    # at least the shifted divisor
+    guard = ones << 31
+    quotient = 0
+    w <<= 8
+    for _ in range(8):
+        w >>= 1
+        bits = (((numerator | guard) - w) & guard) >> 31
+        numerator -= w & bits * 0x7fffffff
+        quotient = (quotient << 1) | bits
+
+    channels = quotient.to_bytes(4 * m, 'big')[3::4]
+    out = bytearray(4 * n)
+    for c in range(3):
+        out[c::4] = channels[c * n:(c + 1) * n]
+    out[3::4] = entries[1::8]
+    return out
+
+
+def composite_straight_packed(src, dst, op='over'):
+    """
+    Composite packed straight RGBA quads with a Porter-Duff operator, element-wise, as composite_straight. The
+    weighted sums and divisions of every color channel are computed at once, in the 32-bit lanes of large integers,
+    which takes about twice as long as composite_packed.
+
+    :param src: A bytes-like object of straight source RGBA quads.
+    :param dst: A bytes-like object of as many straight destination RGBA quads.
+    :param op: The operator, one of colorutils.blend.porter_duff (default 'over').
+    :return: The straight RGBA quads of the result.
+    :rtype: bytes
+    """
+    if len(src) != len(dst):
+        raise ColorException('Cannot composite {} colors with {}'.format(len(src) // 4, len(dst) // 4))
+
+    table = _straight_table(op)
+    out = bytearray()
+    for i in range(0, len(src), 4 * _straight_chunk):
+        out += _composite_straight_chunk(src[i:i + 4 * _straight_chunk], dst[i:i + 4 * _straight_chunk], table)
+    return bytes(out)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The colorutils command line interface.
+
+    python -m colorutils convert --from hex --to hsv colors.txt
+    python -m colorutils serve --port 8765
+
+Input is read from files (or stdin) in chunks of lines, each chunk is converted with the bulk conversion functions in
+colorutils.convert, and the output is written incrementally, so memory use is bounded by the chunk size regardless of
+the size of the input.
+"""
+from __future__ import division
+import argparse
+import collections
+import csv
+import io
+import itertools
+import json
+import sys
+import time
+
+from . import convert
+from .exceptions import ColorException
+
+
+formats = ('rgb', 'hex', 'web', 'yiq', 'hsv')
+string_formats = ('hex', 'web')
+
+
+# -----------------------------------------------
+# Parsing and Formatting
+# -----------------------------------------------
+
+
+def _number(value):
+    """ Parse a numeric string, preferring an int where the value is integral. """
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def parse_lines(lines, source, layout):
+    """
+    Parse lines of input into color values of the given format.
+
+    :param lines: An iterable of lines of text.
+    :param source: The color format of the values (one of colorutils.cli.formats).
+    :param layout: The input layout: 'lines', 'csv' or 'jsonl'.
+    :return: The parsed color values; strings for HEX and WEB, tuples otherwise.
+    :rtype: list
+    """
+    lines = [line for line in lines if line.strip()]
+
+    if layout == 'jsonl':
+        values = [json.loads(line) for line in lines]
+    elif layout == 'csv':
+        values = [row[0].strip() if len(row) == 1 else [v.strip() for v in row] for row in csv.reader(lines)]
+    else:
+        values = [line.strip() if source in string_formats else line.replace(',', ' ').split() for line in lines]
+
+    if source in string_formats:
+        return values
+
+    values = [tuple(v if isinstance(v, (int, float)) else _number(v) for v in value) for value in values]
+    for value in values:
+        if len(value) != 3:
+            raise ColorException('Expected 3 values for {}, got {}'.format(source, value))
+    return values
+
+
+def format_values(values, target, layout):
+    """
+    Format converted color values as a block of output text, one value per line.
+
+    :param values: The color values to format.
+    :param target: The color format of the values (one of colorutils.cli.formats).
+    :param layout: The output layout: 'lines', 'csv' or 'jsonl'.
+    :return: The formatted output, with a trailing newline for each value.
+    :rtype: str
+    """
+    if layout == 'jsonl':
+        return ''.join(json.dumps(v) + '\n' for v in values)
+
+    if layout == 'csv':
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerows([v] if target in string_formats else v for v in values)
+        return out.getvalue()
+
+    if target in string_formats:
+        return ''.join(v + '\n' for v in values)
+    return ''.join(' '.join(repr(n) for n in v) + '\n' for v in values)
+
+
+def convert_lines(lines, source, target, layout='lines'):
+    """
+    Parse, convert and format a chunk of input lines.
+
+    :param lines: A list of lines of text.
+    :param source: The color format to convert from.
+    :param target: The color format to convert to.
+    :param layout: The input and output layout: 'lines', 'csv' or 'jsonl' (default 'lines').
+    :return: The converted output text and the number of values converted.
+    :rtype: tuple
+    """
+    values = parse_lines(lines, source, layout)
+    converted = getattr(convert, '{}_to_{}_many'.format(source, target))(values)
+    return format_values(converted, target, layout), len(values)
+
+
+def _convert_chunk(args):
+    """ Worker process entry point for convert_lines. """
+    return convert_lines(*args)
+
+
+# -----------------------------------------------
+# Commands
+# -----------------------------------------------
+
+
+def _read_chunks(paths, chunk_size):
+    """ Yield lists of at most `chunk_size` lines from the given files, or stdin. """
+    for path in paths or ['-']:
+        stream = sys.stdin if path == '-' else io.open(path, 'r')
+        try:
+            lines = iter(stream)
+            while True:
+                chunk = list(itertools.islice(lines, chunk_size))
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def _convert_serial(chunks, source, target, layout):
+    """ Convert chunks in this process. """
+    for chunk in chunks:
+        yield convert_lines(chunk, source, target, layout)
+
+
+def _convert_parallel(chunks, source, target, layout, workers):
+    """ Convert chunks across a process pool, keeping a bounded number of chunks in flight, in input order. """
+    import multiprocessing
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(_convert_chunk, ((chunk, source, target, layout),)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+
+
+def run_convert(args, stdout=None, stderr=None):
+    """ Run the convert command for parsed command line arguments. """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    if args.source == args.target:
+        raise ColorException('Cannot convert from {0} to {0}'.format(args.source))
+
+    out = stdout if args.output in (None, '-') else io.open(args.output, 'w')
+    chunks = _read_chunks(args.inputs, args.chunk_size)
+    if args.workers > 1:
+        results = _convert_parallel(chunks, args.source, args.target, args.format, args.workers)
+    else:
+        results = _convert_serial(chunks, args.source, args.target, args.format)
+
+    count = 0
+    start = time.time()
+    try:
+        for text, n in results:
+            out.write(text)
+            count += n
+    finally:
+        if out is not stdout:
+            out.close()
+        else:
+            out.flush()
+
+    elapsed = time.time() - start
+    if not args.quiet:
+        rate = count / elapsed if elapsed > 0 else float('inf')
+        stderr.write('Converted {} colors in {:.3f}s ({:.0f} colors/s)\n'.format(count, elapsed, rate))
+    return 0
+
+
+def run_serve(args, stdout=None, stderr=None):
+    """ Run the serve command for parsed command line arguments. """
+    import asyncio
+    from .server import serve
+
+    stderr = stderr or sys.stderr
+    if not args.quiet:
+        address = args.unix or '{}:{}'.format(args.host, args.port)
+        stderr.write('Serving conversions on {}\n'.format(address))
+        stderr.flush()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.window / 1000, args.max_batch,
+                          args.metrics_interval, stderr, args.limit))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _positive_int(value):
+    """ Parse an integer argument of at least 1. """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError('expected a positive integer, got {!r}'.format(value))
+    return number
+
+
+def build_parser():
+    """ Build the argument parser for the colorutils command line interface. """
+    parser = argparse.ArgumentParser(prog='python -m colorutils', description='colorutils command line tools')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    conv = commands.add_parser('convert', help='convert colors between formats')
+    conv.add_argument('--from', dest='source', choices=formats, required=True, help='the input color format')
+    conv.add_argument('--to', dest='target', choices=formats, required=True, help='the output color format')
+    conv.add_argument('--format', choices=('lines', 'csv', 'jsonl'), default='lines',
+                      help='input and output layout (default: lines)')
+    conv.add_argument('-o', '--output', help='output file (default: stdout)')
+    conv.add_argument('--workers', type=int, default=1, help='number of worker processes (default: 1)')
+    conv.add_argument('--chunk-size', type=_positive_int, default=65536, help='lines per chunk (default: 65536)')
+    conv.add_argument('-q', '--quiet', action='store_true', help='do not report throughput')
+    conv.add_argument('inputs', nargs='*', metavar='FILE', help='input files (default: stdin)')
+    conv.set_defaults(run=run_convert)
+
+    srv = commands.add_parser('serve', help='serve conversions to clients, in micro-batches')
+    srv.add_argument('--host', default='127.0.0.1', help='address to listen on (default: 127.0.0.1)')
+    srv.add_argument('--port', type=int, default=8765, help='TCP port to listen on (default: 8765)')
+    srv.add_argument('--unix', metavar='PATH', help='listen on a Unix socket instead of TCP')
+    srv.add_argument('--window', type=float, default=2.0, help='batch latency window in ms (default: 2)')
+    srv.add_argument('--max-batch', type=int, default=4096, help='values per batch (default: 4096)')
+    srv.add_argument('--limit', type=int, default=2 ** 20,
+                     help='longest request line accepted, in bytes (default: 1048576)')
+    srv.add_argument('--metrics-interval', type=float, default=0,
+                     help='seconds between metrics reports on stderr (default: 0, none)')
+    srv.add_argument('-q', '--quiet', action='store_true', help='do not report the listening address')
+    srv.set_defaults(run=run_serve)
+
+    return parser
+
+
+def main(argv=None):
+    """ Command line entry point. """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.run(args)
+    except (ColorException, ValueError, OSError) as e:
+        parser.exit(1, '{}: error: {}\n'.format(parser.prog, e))
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Bulk HEX encoding and decoding of packed 8-bit RGB buffers.
+
+These functions convert between a bytes-like object of packed RGB triples and a contiguous block of '#rrggbb'
+strings, without creating an intermediate string per color. The per-byte work is done by the table-driven hex codec
+in `binascii`, and the '#' prefixes and separators are interleaved with strided slice assignment.
+"""
+import binascii
+
+from .exceptions import ColorException
+
+
+_separators = b'[\\s,]+'
+_separator_bytes = frozenset(b' \t\n\r\x0b\x0c,')
+
+
+def encode_hex(packed, sep=b''):
+    """
+    Encode a buffer of packed 8-bit RGB triples as a block of 6-char HEX values, each with a prepended octothorpe.
+
+    :param packed: A bytes-like object of packed RGB triples.
+    :param sep: Bytes to place between consecutive HEX values (default none).
+    :return: The HEX values as a single block, e.g. b'#000000#ffffff'.
+    :rtype: bytes
+    """
+    packed = bytes(packed)
+    if len(packed) % 3:
+        raise ColorException('Packed RGB buffer size must be a multiple of 3, got {}'.format(len(packed)))
+
+    n = len(packed) // 3
+    stride = 7 + len(sep)
+    digits = binascii.hexlify(packed)
+
+    block = bytearray(stride * n)
+    block[0::stride] = b'#' * n
+    for i in range(6):
+        block[i + 1::stride] = digits[i::6]
+    for i in range(len(sep)):
+        block[i + 7::stride] = sep[i:i + 1] * n
+
+    return bytes(block[:len(block) - len(sep)] if n else block)
+
+
+def decode_hex(block):
+    """
+    Decode a block of HEX values into a buffer of packed 8-bit RGB triples.
+
+    The HEX values may be 3- or 6-char, with or without a prepended octothorpe, and must be separated by whitespace
+    and/or commas; any other byte between values is an error. Blocks where every value is 6-char and prefixed with an
+    octothorpe, with a uniform separator (or none, as produced by encode_hex), are decoded in a single pass.
+
+    :param block: A bytes-like object (or ASCII string) of HEX values.
+    :return: The packed RGB triples.
+    :rtype: bytearray
+    """
+    try:
+        if not isinstance(block, bytes):
+            block = block.encode('ascii') if hasattr(block, 'encode') else bytes(block)
+        block = block.strip()
+        if not block:
+            return bytearray()
+        return bytearray(binascii.unhexlify(_uniform_digits(block) or _token_digits(block)))
+    except (binascii.Error, TypeError, ValueError):
+        raise ColorException('Unable to decode HEX block')
+
+
+def _uniform_digits(block):
+    """ If the block is a uniformly separated run of '#rrggbb' values, return its hex digits, otherwise None. """
+    second = block.find(b'#', 1)
+    stride = second if second > 0 else len(block) + 1
+    n = (len(block) + stride - 7) // stride
+
+    if stride < 7 or n * stride - (stride - 7) != len(block) or block[0::stride] != b'#' * n:
+        return None
+
+    sep = block[7:stride]
+    if not _separator_bytes.issuperset(bytearray(sep)):
+        return None
+    for i in range(len(sep)):
+        if block[i + 7::stride] != sep[i:i + 1] * (n - 1):
+            return None
+
+    digits = bytearray(6 * n)
+    for i in range(6):
+        digits[i::6] = block[i + 1::stride]
+    return bytes(digits)
+
+
+def _token_digits(block):
+    """ Split the block into HEX values and normalize each to 6-char, returning the concatenated hex digits. """
+    import re
+
+    digits = []
+    for token in re.split(_separators, block):
+        if token.startswith(b'#'):
+            token = token[1:]
+        if len(token) == 3:
+            token = bytes(bytearray((c for c in bytearray(token) for _ in range(2))))
+        elif len(token) != 6:
+            raise ColorException('Unexpected HEX size when decoding: {}'.format(len(token)))
+        digits.append(token)
+    return b''.join(digits)
+
+
+def encode_hex_list(packed):
+    """
+    Encode a buffer of packed 8-bit RGB triples as a list of 6-char HEX strings, each with a prepended octothorpe.
+    Equivalent to applying `rgb_to_hex` to each triple.
+
+    :param packed: A bytes-like object of packed RGB triples.
+    :return: HEX representations of the packed RGB values.
+    :rtype: list
+    """
+    if not len(packed):
+        return []
+    return encode_hex(packed, b'\n').decode('ascii').split('\n')
+
+
+def decode_hex_list(hexes):
+    """
+    Decode a list of 3- or 6-char HEX strings into a buffer of packed 8-bit RGB triples.
+
+    :param hexes: An iterable of HEX strings, one color each (surrounding whitespace is ignored).
+    :return: The packed RGB triples.
+    :rtype: bytearray
+    """
+    hexes = list(hexes)
+    for value in hexes:
+        if not isinstance(value, str) or any(c in value.strip() for c in ', \t\n\r\x0b\x0c'):
+            raise ColorException('Invalid HEX value: {!r}'.format(value))
+
+    packed = decode_hex(' '.join(hexes))
+    if len(packed) != 3 * len(hexes):
+        raise ColorException('Expected {} HEX values, decoded {}'.format(len(hexes), len(packed) // 3))
+    return packed
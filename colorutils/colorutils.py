@@ -7,11 +7,26 @@ colorutils provides utilities for working with colors, which are abstractly mode
 currently uses an internal RGB representation, but has allowances for RGB, HEX, and WEB formats.
 """
 from __future__ import division
+import collections
+import itertools
 import random
+import sys
+import threading
 
-from .static import *
+from .static import rgb_min_val, rgb_max_val, rgb_min, rgb_max
 from .equality import RGB_eq
 from .convert import *
+from .codec import decode_hex_list
+from . import blend
+from .blend import ArithmeticModel, SUBTRACT, _clamp_channel
+
+
+def __getattr__(name):
+    """ Forward the lazily constructed tables of colorutils.static. """
+    if name == 'web_colors':
+        from . import static
+        return static.web_colors
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
 
 class Format:
@@ -22,19 +37,6 @@ class Format:
     RGB, HEX, WEB, YIQ, HSV = range(5)
 
 
-class ArithmeticModel:
-    """
-    ArithmeticModel contains well-known arithmetic models which determine the additive behavior of the Color class. The
-    default model is the light model (behaves similar to adding light). The alternative is the blend model, which
-    averages the colors. This class is effectively an implementation of Enum for Python 2.7
-
-    Note that Color subtraction happens in the same manner, regardless of the arithmetic model chosen.
-
-    Reference: http://stackoverflow.com/questions/726549/algorithm-for-additive-color-mixing-for-rgb-values
-    """
-    LIGHT, BLEND = range(2)
-
-
 class Color(object):
     """
     Color is the model which maintains the information for a color. If no color is specified on class instantiation,
@@ -48,14 +50,36 @@ class Color(object):
 
     The default additive model for Color instances behaves like the light model. Different additive models may be
     specified. The supported models are found in the ArithmeticModel class.
+
+    Derived representations (hex, shorthex, web, yiq, hsv) are cached per instance after they are first computed, and
+    the cache is cleared whenever the color is changed through one of its setters. Caching can be disabled for an
+    instance with `cache=False`, or for all instances by setting `Color.cache = False`. Note that changes made to the
+    color without going through a setter (e.g. mutating a list passed in as the RGB value) are not detected. Cache
+    hit and miss counts, across all instances, are available from `Color.cache_info()`.
+
+    Frequently used colors can be interned with `Color.intern(...)`, which returns a single shared (immutable)
+    PackedColor per RGB value from a bounded, least recently used pool of `Color.intern_size` colors.
     """
+    cache = True
+    # The derived representations of an instance, created on first use
+    _cache = None
+    _cache_stats = {'hits': 0, 'misses': 0}
+
+    intern_size = 4096
+    _interned = collections.OrderedDict()
+    _intern_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+    _intern_lock = threading.Lock()
+
     def __init__(self, color=None, **kwargs):
         """ Initialization """
         self.equality_fn = RGB_eq
         self.arithmetic = ArithmeticModel.LIGHT
 
         if isinstance(color, Color):
-            self._color = color._color
+            # A mutable RGB value is copied, so that changing one Color does not change the other behind its cache
+            self._color = list(color._color) if isinstance(color._color, list) else color._color
+        elif isinstance(color, PackedColor):
+            self._color = color.rgb
         else:
             self._color = color if color else rgb_min
 
@@ -64,7 +88,10 @@ class Color(object):
 
     def __eq__(self, other):
         """ Equals """
-        if isinstance(other, Color):
+        if isinstance(other, PackedColor) and self.equality_fn is RGB_eq:
+            # A list-backed RGB value never equals the tuple of a PackedColor
+            return tuple(self.rgb) == other.rgb
+        if isinstance(other, (Color, PackedColor)):
             return self.equality_fn(self, other)
         return False
 
@@ -74,30 +101,30 @@ class Color(object):
 
     def __add__(self, other):
         """ Addition """
-        if isinstance(other, Color):
+        if isinstance(other, (Color, PackedColor)):
             r1, g1, b1 = self.rgb
             r2, g2, b2 = other.rgb
         elif isinstance(other, tuple) and len(other) == 3:
             r1, g1, b1 = self.rgb
             r2, g2, b2 = other
         else:
-            raise TypeError("Unsupported operand type(s) for +: '{0}' and '{1}'".format(type(self), type(other)))
+            # Left to the other operand, e.g. a ColorArray, or to a TypeError
+            return NotImplemented
 
-        if self.arithmetic is ArithmeticModel.LIGHT:
-            return Color((min(r1 + r2, rgb_max_val), min(g1 + g2, rgb_max_val), min(b1 + b2, rgb_max_val)))
-        else:
-            return Color(((r1 + r2 // 2), (g1 + g2 // 2), (b1 + b2 // 2)))
+        fn = ArithmeticModel.get(self.arithmetic).fn
+        return Color((fn(r1, r2), fn(g1, g2), fn(b1, b2)))
 
     def __sub__(self, other):
         """ Subtraction """
-        if isinstance(other, Color):
+        if isinstance(other, (Color, PackedColor)):
             r1, g1, b1 = self.rgb
             r2, g2, b2 = other.rgb
         elif isinstance(other, tuple) and len(other) == 3:
             r1, g1, b1 = self.rgb
             r2, g2, b2 = other
         else:
-            raise TypeError("Unsupported operand type(s) for -: '{0}' and '{1}'".format(type(self), type(other)))
+            # Left to the other operand, e.g. a ColorArray, or to a TypeError
+            return NotImplemented
 
         return Color((max(r1 - r2, rgb_min_val), max(g1 - g2, rgb_min_val), max(b1 - b2, rgb_min_val)))
 
@@ -144,6 +171,7 @@ class Color(object):
     @red.setter
     def red(self, value):
         self._color[0] = value
+        self._invalidate()
 
     @property
     def green(self):
@@ -153,6 +181,7 @@ class Color(object):
     @green.setter
     def green(self, value):
         self._color[1] = value
+        self._invalidate()
 
     @property
     def blue(self):
@@ -162,6 +191,7 @@ class Color(object):
     @blue.setter
     def blue(self, value):
         self._color[2] = value
+        self._invalidate()
 
     @property
     def rgb(self):
@@ -171,47 +201,882 @@ class Color(object):
     @rgb.setter
     def rgb(self, value):
         self._color = value
+        self._invalidate()
 
     @property
     def hex(self):
         """ A 6-char HEX representation of the color, with a prepended octothorpe. """
-        return rgb_to_hex(self.rgb)
+        return self._derived('hex', rgb_to_hex)
 
     @hex.setter
     def hex(self, value):
-        self._color = hex_to_rgb(value)
+        self.rgb = hex_to_rgb(value)
 
     @property
     def shorthex(self):
         """ The same as Color.hex, however, HEX values that can be minified to 3-char are returned as such. """
-        return minify_hex(self.hex)
+        return self._derived('shorthex', lambda rgb: minify_hex(self.hex))
 
     @property
     def web(self):
         """ A WEB representation of the color. """
-        return rgb_to_web(self.rgb)
+        return self._derived('web', rgb_to_web)
 
     @web.setter
     def web(self, value):
-        self._color = web_to_rgb(value)
+        self.rgb = web_to_rgb(value)
 
     @property
     def yiq(self):
         """ A YIQ representation of the color. """
-        return rgb_to_yiq(self.rgb)
+        return self._derived('yiq', rgb_to_yiq)
 
     @yiq.setter
     def yiq(self, value):
-        self._color = yiq_to_rgb(value)
+        self.rgb = yiq_to_rgb(value)
 
     @property
     def hsv(self):
         """ An HSV representation of the color """
-        return rgb_to_hsv(self.rgb)
+        return self._derived('hsv', rgb_to_hsv)
 
     @hsv.setter
     def hsv(self, value):
-        self._color = hsv_to_rgb(value)
+        self.rgb = hsv_to_rgb(value)
+
+    def _derived(self, key, convert):
+        """ Get a derived representation of the color from the cache, computing and caching it on a miss. """
+        if not self.cache:
+            return convert(self._color)
+
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = {}
+        try:
+            value = cache[key]
+        except KeyError:
+            Color._cache_stats['misses'] += 1
+            value = cache[key] = convert(self._color)
+        else:
+            Color._cache_stats['hits'] += 1
+        return value
+
+    def _invalidate(self):
+        """ Drop the cached derived representations. """
+        self.__dict__.pop('_cache', None)
+
+    @classmethod
+    def cache_info(cls):
+        """
+        Get the derived representation cache statistics, across all Color instances.
+
+        :return: A dictionary with the number of cache hits and misses, and the hit rate.
+        :rtype: dict
+        """
+        hits, misses = cls._cache_stats['hits'], cls._cache_stats['misses']
+        return {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses) if hits + misses else 0.0}
+
+    @classmethod
+    def reset_cache_info(cls):
+        """ Reset the derived representation cache statistics. """
+        cls._cache_stats['hits'] = cls._cache_stats['misses'] = 0
+
+    @classmethod
+    def intern(cls, color=None, **kwargs):
+        """
+        Get the shared instance of a color. Interned colors are immutable PackedColors, so the same instance can be
+        handed out wherever the color is used; the least recently used colors are evicted once the pool holds
+        `Color.intern_size` colors.
+
+        :param color: The color, as accepted by PackedColor: an RGB 3-tuple, Color or PackedColor (default black).
+        :param kwargs: Alternatively, a single hex, web, yiq or hsv keyword argument, as accepted by PackedColor.
+        :return: The shared instance of the color.
+        :rtype: PackedColor
+        """
+        packed = None
+        if type(color) is tuple and not kwargs and len(color) == 3:
+            r, g, b = color
+            if type(r) is int and type(g) is int and type(b) is int and 0 <= r < 256 and 0 <= g < 256 and 0 <= b < 256:
+                key = (r << 16) | (g << 8) | b
+            else:
+                packed = PackedColor(color)
+        else:
+            packed = PackedColor(color, **kwargs)
+        if packed is not None:
+            key = packed._value
+
+        stats, interned = cls._intern_stats, cls._interned
+        with cls._intern_lock:
+            try:
+                instance = interned[key]
+            except KeyError:
+                stats['misses'] += 1
+                instance = interned[key] = packed or PackedColor((r, g, b))
+                while len(interned) > max(cls.intern_size, 0):
+                    interned.popitem(last=False)
+                    stats['evictions'] += 1
+            else:
+                stats['hits'] += 1
+                interned.move_to_end(key)
+        return instance
+
+    @classmethod
+    def intern_info(cls):
+        """
+        Get the interning statistics.
+
+        :return: A dictionary with the number of hits, misses and evictions, the hit rate, the number of interned
+                 colors and the maximum, and the approximate memory held by the pool in bytes.
+        :rtype: dict
+        """
+        with cls._intern_lock:
+            stats, interned = dict(cls._intern_stats), cls._interned
+            size = len(interned)
+            memory = sys.getsizeof(interned) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in interned.items())
+        hits, misses = stats['hits'], stats['misses']
+        stats.update(hit_rate=hits / (hits + misses) if hits + misses else 0.0, size=size, maxsize=cls.intern_size,
+                     memory=memory)
+        return stats
+
+    @classmethod
+    def clear_interned(cls):
+        """ Clear the interned colors and reset the interning statistics. """
+        with cls._intern_lock:
+            cls._interned.clear()
+            for k in cls._intern_stats:
+                cls._intern_stats[k] = 0
+
+
+class PackedColor(object):
+    """
+    PackedColor is a compact, immutable alternative to the Color class. The color is stored as a single 24-bit integer
+    (0xRRGGBB), so instances are small and cheap to create, and, being immutable, they are hashable and can be used as
+    dictionary keys or set members.
+
+    A PackedColor can be created from an RGB 3-tuple, a Color, another PackedColor, or from the hex, web, yiq or hsv
+    keyword arguments. Channel values are stored as integers in [0, 255]; non-integer values are rounded and clamped.
+    PackedColor equality is RGB equality, except against a Color, which is compared under the Color's equality function
+    (either way around).
+    """
+    __slots__ = ('_value',)
+
+    def __init__(self, color=None, **kwargs):
+        """ Initialization """
+        if len(kwargs) > 1 or (kwargs and color is not None):
+            raise ColorException('PackedColor takes a single color value')
+
+        if isinstance(color, PackedColor):
+            value = color._value
+        else:
+            if kwargs:
+                fmt, color = kwargs.popitem()
+                if fmt not in _packed_parsers:
+                    raise TypeError("PackedColor got an unexpected keyword argument '{}'".format(fmt))
+                color = _packed_parsers[fmt](color)
+            elif isinstance(color, Color):
+                color = color.rgb
+            elif color is None:
+                color = rgb_min
+
+            r, g, b = color
+            value = (_clamp_channel(r) << 16) | (_clamp_channel(g) << 8) | _clamp_channel(b)
+
+        object.__setattr__(self, '_value', value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('PackedColor is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('PackedColor is immutable')
+
+    def __hash__(self):
+        """ Hash """
+        return hash(self._value)
+
+    def __eq__(self, other):
+        """ Equals """
+        if isinstance(other, PackedColor):
+            return self._value == other._value
+        if isinstance(other, Color):
+            return other == self
+        return False
+
+    def __ne__(self, other):
+        """ Not Equals """
+        return not self.__eq__(other)
+
+    def __add__(self, other):
+        """ Addition, following the default (LIGHT) arithmetic model of the Color class. """
+        result = Color(self.rgb).__add__(other.rgb if isinstance(other, PackedColor) else other)
+        return result if result is NotImplemented else PackedColor(result)
+
+    def __sub__(self, other):
+        """ Subtraction """
+        result = Color(self.rgb).__sub__(other.rgb if isinstance(other, PackedColor) else other)
+        return result if result is NotImplemented else PackedColor(result)
+
+    def __iter__(self):
+        """ Iterator """
+        return iter(self.rgb)
+
+    def __int__(self):
+        """ The packed 0xRRGGBB value """
+        return self._value
+
+    def __str__(self):
+        """ String representation """
+        return "{}".format(self.rgb)
+
+    def __repr__(self):
+        """ General representation """
+        return "<PackedColor {}>".format(self.rgb)
+
+    def __reduce__(self):
+        return PackedColor, (self.rgb,)
+
+    @property
+    def red(self):
+        """ The red component of the RGB color representation. """
+        return self._value >> 16
+
+    @property
+    def green(self):
+        """ The green component of the RGB color representation. """
+        return (self._value >> 8) & 0xff
+
+    @property
+    def blue(self):
+        """ The blue component of the RGB color representation. """
+        return self._value & 0xff
+
+    @property
+    def rgb(self):
+        """ An RGB representation of the color. """
+        v = self._value
+        return v >> 16, (v >> 8) & 0xff, v & 0xff
+
+    @property
+    def hex(self):
+        """ A 6-char HEX representation of the color, with a prepended octothorpe. """
+        return '#{0:06x}'.format(self._value)
+
+    @property
+    def shorthex(self):
+        """ The same as PackedColor.hex, however, HEX values that can be minified to 3-char are returned as such. """
+        return minify_hex(self.hex)
+
+    @property
+    def web(self):
+        """ A WEB representation of the color. """
+        return rgb_to_web(self.rgb)
+
+    @property
+    def yiq(self):
+        """ A YIQ representation of the color. """
+        return rgb_to_yiq(self.rgb)
+
+    @property
+    def hsv(self):
+        """ An HSV representation of the color """
+        return rgb_to_hsv(self.rgb)
+
+
+_packed_parsers = {
+    'rgb': lambda v: v,
+    'hex': hex_to_rgb,
+    'web': web_to_rgb,
+    'yiq': yiq_to_rgb,
+    'hsv': hsv_to_rgb,
+}
+
+
+class ColorArray(object):
+    """
+    ColorArray is a batch container for many colors. Where a Color wraps a single RGB 3-tuple, a ColorArray holds
+    any number of colors in one contiguous buffer of 8-bit RGB triples, so that large collections of colors (e.g. the
+    pixels of an image) do not require a Python object per color.
+
+    A ColorArray exposes the same representations as the Color class (rgb, hex, shorthex, web, yiq, hsv), each
+    returning a list with one entry per color, and the same setters, each taking a sequence of values. Channel values
+    are stored as integers in [0, 255]; non-integer values (e.g. the result of an HSV or YIQ conversion) are rounded
+    and clamped on assignment.
+
+    A ColorArray can be created from an iterable of RGB 3-tuples or Colors, from another ColorArray, or from a
+    bytes-like object of packed RGB triples.
+
+    ColorArrays support addition and subtraction, following the arithmetic model of the array (see ArithmeticModel).
+    The other operand is either a single color (a Color, PackedColor or RGB 3-tuple), which is applied to every color
+    of the array, or a collection of colors of the same length, applied element-wise. The augmented operators (+= and
+    -=) update the array in place.
+    """
+    arithmetic = ArithmeticModel.LIGHT
+
+    def __init__(self, colors=None, **kwargs):
+        """ Initialization """
+        if colors is None:
+            self._buffer = bytearray()
+        elif isinstance(colors, ColorArray):
+            self._buffer = bytearray(colors._buffer)
+        elif isinstance(colors, (bytes, bytearray, memoryview)):
+            self._buffer = bytearray(colors)
+        else:
+            self._buffer = _pack_rgb(colors)
+
+        if len(self._buffer) % 3:
+            raise ColorException('Packed RGB buffer size must be a multiple of 3, got {}'.format(len(self._buffer)))
+
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+    def __len__(self):
+        """ Number of colors """
+        return len(self._buffer) // 3
+
+    def __eq__(self, other):
+        """ Equals """
+        if isinstance(other, ColorArray):
+            return self._buffer == other._buffer
+        return False
+
+    def __ne__(self, other):
+        """ Not Equals """
+        return not self.__eq__(other)
+
+    def __iter__(self):
+        """ Iterator """
+        return (Color(c) for c in self.rgb)
+
+    def __getitem__(self, key):
+        """ Index or slice """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return ColorArray(self._buffer[start * 3:max(start, stop) * 3])
+            b = self._buffer
+            return ColorArray(bytearray(v for i in range(start, stop, step) for v in b[i * 3:i * 3 + 3]))
+
+        i = range(len(self))[key] * 3
+        return Color(tuple(self._buffer[i:i + 3]))
+
+    def __setitem__(self, key, value):
+        """ Assign a color to an index, or colors to a slice """
+        if isinstance(key, slice):
+            indices = range(len(self))[key]
+            packed = value._buffer if isinstance(value, ColorArray) else _pack_rgb(value)
+            if len(packed) != len(indices) * 3:
+                raise ColorException('Cannot assign {} colors to a slice of {}'.format(len(packed) // 3, len(indices)))
+            for n, i in enumerate(indices):
+                self._buffer[i * 3:i * 3 + 3] = packed[n * 3:n * 3 + 3]
+        else:
+            i = range(len(self))[key] * 3
+            self._buffer[i:i + 3] = _pack_rgb([value])
+
+    def _operand(self, other, op):
+        """ Get the other operand of an arithmetic operation, as a single RGB 3-tuple or a packed buffer. """
+        if isinstance(other, (Color, PackedColor)):
+            return tuple(other.rgb), None
+        # A 3-tuple (or list) of channel values is a single color; a sequence of colors holds tuples or Colors
+        if isinstance(other, (tuple, list)) and len(other) == 3 and all(isinstance(v, (int, float)) for v in other):
+            return tuple(other), None
+
+        if isinstance(other, ColorArray):
+            packed = other._buffer
+        elif isinstance(other, (bytes, bytearray, memoryview)):
+            packed = bytes(other)
+        elif isinstance(other, (list, tuple)):
+            packed = _pack_rgb(other)
+        else:
+            raise TypeError("Unsupported operand type(s) for {0}: '{1}' and '{2}'".format(op, type(self), type(other)))
+
+        if len(packed) != len(self._buffer):
+            raise ColorException('Cannot combine arrays of {} and {} colors'.format(len(self), len(packed) // 3))
+        return None, packed
+
+    def _apply(self, other, op, buffer, reflected=False):
+        """
+        Add or subtract the other operand into a packed buffer of the same length as the array. The buffer holds the
+        base colors, unless `reflected` is set, in which case the other operand is the base (as in `other + self`).
+        """
+        rgb, packed = self._operand(other, op)
+        mode = SUBTRACT if op == '-' else ArithmeticModel.get(self.arithmetic)
+
+        if packed is None:
+            for c in range(3):
+                buffer[c::3] = buffer[c::3].translate(mode.row(rgb[c], base=reflected))
+        elif reflected:
+            buffer[:] = mode.blend_packed(packed, buffer)
+        else:
+            buffer[:] = mode.blend_packed(buffer, packed)
+        return buffer
+
+    def __add__(self, other):
+        """ Addition """
+        return ColorArray(self._apply(other, '+', bytearray(self._buffer)), arithmetic=self.arithmetic)
+
+    def __radd__(self, other):
+        """ Addition, with the other operand first (as the base colors) """
+        return ColorArray(self._apply(other, '+', bytearray(self._buffer), reflected=True), arithmetic=self.arithmetic)
+
+    def __iadd__(self, other):
+        """ In-place addition """
+        self._apply(other, '+', self._buffer)
+        return self
+
+    def __sub__(self, other):
+        """ Subtraction """
+        return ColorArray(self._apply(other, '-', bytearray(self._buffer)), arithmetic=self.arithmetic)
+
+    def __rsub__(self, other):
+        """ Subtraction, with the other operand first (as the base colors) """
+        return ColorArray(self._apply(other, '-', bytearray(self._buffer), reflected=True), arithmetic=self.arithmetic)
+
+    def __isub__(self, other):
+        """ In-place subtraction """
+        self._apply(other, '-', self._buffer)
+        return self
+
+    def __str__(self):
+        """ String representation """
+        return "{}".format(self.rgb)
+
+    def __repr__(self):
+        """ General representation """
+        return "<ColorArray ({} colors)>".format(len(self))
+
+    def tobytes(self):
+        """ The packed RGB triples backing the array, as bytes. """
+        return bytes(self._buffer)
+
+    def append(self, color):
+        """ Append a single color (an RGB 3-tuple or a Color) to the end of the array. """
+        self._buffer.extend(_pack_rgb([color]))
+
+    def extend(self, colors):
+        """ Append an iterable of colors (or another ColorArray) to the end of the array. """
+        self._buffer.extend(colors._buffer if isinstance(colors, ColorArray) else _pack_rgb(colors))
+
+    def _set_channel(self, offset, values):
+        values = bytearray(_clamp_channel(v) for v in values)
+        if len(values) != len(self):
+            raise ColorException('Expected {} channel values, got {}'.format(len(self), len(values)))
+        self._buffer[offset::3] = values
+
+    @property
+    def red(self):
+        """ The red components of the RGB color representations. """
+        return list(self._buffer[0::3])
+
+    @red.setter
+    def red(self, values):
+        self._set_channel(0, values)
+
+    @property
+    def green(self):
+        """ The green components of the RGB color representations. """
+        return list(self._buffer[1::3])
+
+    @green.setter
+    def green(self, values):
+        self._set_channel(1, values)
+
+    @property
+    def blue(self):
+        """ The blue components of the RGB color representations. """
+        return list(self._buffer[2::3])
+
+    @blue.setter
+    def blue(self, values):
+        self._set_channel(2, values)
+
+    @property
+    def rgb(self):
+        """ RGB representations of the colors. """
+        b = self._buffer
+        return list(zip(b[0::3], b[1::3], b[2::3]))
+
+    @rgb.setter
+    def rgb(self, values):
+        self._buffer = _pack_rgb(values)
+
+    @property
+    def hex(self):
+        """ 6-char HEX representations of the colors, with a prepended octothorpe. """
+        return rgb_to_hex_many(self._buffer)
+
+    @hex.setter
+    def hex(self, values):
+        self._buffer = decode_hex_list(values)
+
+    @property
+    def shorthex(self):
+        """ The same as ColorArray.hex, however, HEX values that can be minified to 3-char are returned as such. """
+        return list(map(minify_hex, self.hex))
+
+    @property
+    def web(self):
+        """ WEB representations of the colors. """
+        return rgb_to_web_many(self._buffer)
+
+    @web.setter
+    def web(self, values):
+        self._buffer = _pack_rgb(web_to_rgb_many(values))
+
+    @property
+    def yiq(self):
+        """ YIQ representations of the colors. """
+        return rgb_to_yiq_many(self._buffer)
+
+    @yiq.setter
+    def yiq(self, values):
+        self._buffer = _pack_rgb(yiq_to_rgb_many(values))
+
+    @property
+    def hsv(self):
+        """ HSV representations of the colors. """
+        return rgb_to_hsv_many(self._buffer)
+
+    @hsv.setter
+    def hsv(self, values):
+        self._buffer = _pack_rgb(hsv_to_rgb_many(values))
+
+
+class RGBAColor(object):
+    """
+    RGBAColor is an immutable color with an alpha (opacity) channel, from 0 (transparent) to 255 (opaque). The color
+    is stored as a straight (not premultiplied) RGBA 4-tuple of integers in [0, 255].
+
+    An RGBAColor can be created from an RGBA 4-tuple or another RGBAColor, from an RGB 3-tuple, Color or PackedColor
+    (opaque unless an alpha is given), or from a HEX value with or without an alpha channel:
+
+        RGBAColor((0, 255, 255, 128))
+        RGBAColor(Color((0, 255, 255)), alpha=128)
+        RGBAColor(hex='#00ffff80')
+
+    Colors are composited with the Porter-Duff operators of colorutils.blend.porter_duff, e.g. `top.over(bottom)`.
+    """
+    __slots__ = ('_rgba',)
+
+    def __init__(self, color=None, alpha=None, hex=None):
+        """ Initialization """
+        if hex is not None:
+            rgba = hex_to_rgba(hex)
+        elif isinstance(color, RGBAColor):
+            rgba = color._rgba
+        elif color is None:
+            rgba = rgb_min + (rgb_max_val,)
+        else:
+            rgba = tuple(getattr(color, 'rgb', color))
+            if len(rgba) == 3:
+                rgba += (rgb_max_val,)
+            elif len(rgba) != 4:
+                raise ColorException('Expected an RGB 3-tuple or RGBA 4-tuple, got {}'.format(rgba))
+
+        if alpha is not None:
+            rgba = rgba[:3] + (alpha,)
+        object.__setattr__(self, '_rgba', tuple(_clamp_channel(v) for v in rgba))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('RGBAColor is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('RGBAColor is immutable')
+
+    def __hash__(self):
+        """ Hash """
+        return hash(self._rgba)
+
+    def __eq__(self, other):
+        """ Equals """
+        if isinstance(other, RGBAColor):
+            return self._rgba == other._rgba
+        return False
+
+    def __ne__(self, other):
+        """ Not Equals """
+        return not self.__eq__(other)
+
+    def __iter__(self):
+        """ Iterator """
+        return iter(self._rgba)
+
+    def __str__(self):
+        """ String representation """
+        return "{}".format(self._rgba)
+
+    def __repr__(self):
+        """ General representation """
+        return "<RGBAColor {}>".format(self._rgba)
+
+    def __reduce__(self):
+        return RGBAColor, (self._rgba,)
+
+    @property
+    def red(self):
+        """ The red component of the RGBA color representation. """
+        return self._rgba[0]
+
+    @property
+    def green(self):
+        """ The green component of the RGBA color representation. """
+        return self._rgba[1]
+
+    @property
+    def blue(self):
+        """ The blue component of the RGBA color representation. """
+        return self._rgba[2]
+
+    @property
+    def alpha(self):
+        """ The alpha component of the RGBA color representation, from 0 (transparent) to 255 (opaque). """
+        return self._rgba[3]
+
+    @property
+    def opacity(self):
+        """ The alpha component as a fraction, from 0 (transparent) to 1 (opaque). """
+        return self._rgba[3] / rgb_max_val
+
+    @property
+    def rgba(self):
+        """ An RGBA representation of the color. """
+        return self._rgba
+
+    @property
+    def rgb(self):
+        """ An RGB representation of the color, without its alpha. """
+        return self._rgba[:3]
+
+    @property
+    def hex(self):
+        """ An 8-char HEX representation of the color, with a prepended octothorpe (#rrggbbaa). """
+        return rgba_to_hex(self._rgba)
+
+    @property
+    def premultiplied(self):
+        """ The RGBA representation of the color with its color channels scaled by its alpha. """
+        return blend.premultiply(self._rgba)
+
+    @property
+    def color(self):
+        """ The color without its alpha, as a Color. """
+        return Color(self.rgb)
+
+    def composite(self, other, op='over'):
+        """
+        Composite this color, as the source, with another color, as the destination.
+
+        :param other: The destination color: an RGBAColor, RGBA 4-tuple or opaque color.
+        :param op: The Porter-Duff operator, one of colorutils.blend.porter_duff (default 'over').
+        :return: The resulting color.
+        :rtype: RGBAColor
+        """
+        other = other if isinstance(other, RGBAColor) else RGBAColor(other)
+        return RGBAColor(blend.composite_straight(self._rgba, other._rgba, op))
+
+    def over(self, other):
+        """
+        Place this color over another color.
+
+        :param other: The color beneath: an RGBAColor, RGBA 4-tuple or opaque color.
+        :return: The resulting color.
+        :rtype: RGBAColor
+        """
+        return self.composite(other, 'over')
+
+
+class RGBAArray(object):
+    """
+    RGBAArray is a batch container for many RGBA colors, held in one contiguous buffer of 8-bit RGBA quads. The quads
+    are stored straight, or with `premultiplied=True`, premultiplied (each color channel scaled by the alpha), which
+    saves converting the colors before and after each compositing operation; the rgba, rgb and hex representations
+    are always straight.
+
+    An RGBAArray can be created from an iterable of RGBA 4-tuples, RGBAColors, RGB 3-tuples or Colors (which are
+    opaque), from a ColorArray (opaque), from another RGBAArray, or from a bytes-like object of packed RGBA quads,
+    already in the storage of the new array.
+
+    Layers are composited element-wise with the Porter-Duff operators of colorutils.blend.porter_duff, e.g.
+    `top.over(bottom)`, or stacked with RGBAArray.flatten.
+    """
+    def __init__(self, colors=None, premultiplied=False):
+        """ Initialization """
+        self.premultiplied = premultiplied
+        if colors is None:
+            self._buffer = bytearray()
+        elif isinstance(colors, RGBAArray):
+            self._buffer = bytearray(colors._packed(premultiplied))
+        elif isinstance(colors, (bytes, bytearray, memoryview)):
+            self._buffer = bytearray(colors)
+        else:
+            if isinstance(colors, ColorArray):
+                rgb = colors._buffer
+                straight = bytearray(4 * len(colors))
+                for c in range(3):
+                    straight[c::4] = rgb[c::3]
+                straight[3::4] = b'\xff' * len(colors)
+            else:
+                straight = _pack_rgba(colors)
+            self._buffer = bytearray(blend.premultiply_packed(straight)) if premultiplied else straight
+
+        if len(self._buffer) % 4:
+            raise ColorException('Packed RGBA buffer size must be a multiple of 4, got {}'.format(len(self._buffer)))
+
+    def _packed(self, premultiplied):
+        """ The packed RGBA quads of the array, in the given storage. """
+        if premultiplied == self.premultiplied:
+            return self._buffer
+        if premultiplied:
+            return blend.premultiply_packed(self._buffer)
+        return blend.unpremultiply_packed(self._buffer)
+
+    def __len__(self):
+        """ Number of colors """
+        return len(self._buffer) // 4
+
+    def __eq__(self, other):
+        """ Equals """
+        if isinstance(other, RGBAArray):
+            return self._packed(False) == other._packed(False)
+        return False
+
+    def __ne__(self, other):
+        """ Not Equals """
+        return not self.__eq__(other)
+
+    def __iter__(self):
+        """ Iterator """
+        return (RGBAColor(c) for c in self.rgba)
+
+    def __getitem__(self, key):
+        """ Index or slice """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            b = self._buffer
+            if step == 1:
+                return RGBAArray(b[start * 4:max(start, stop) * 4], self.premultiplied)
+            return RGBAArray(bytearray(v for i in range(start, stop, step) for v in b[i * 4:i * 4 + 4]),
+                             self.premultiplied)
+
+        i = range(len(self))[key] * 4
+        rgba = tuple(self._buffer[i:i + 4])
+        return RGBAColor(blend.unpremultiply(rgba) if self.premultiplied else rgba)
+
+    def __str__(self):
+        """ String representation """
+        return "{}".format(self.rgba)
+
+    def __repr__(self):
+        """ General representation """
+        return "<RGBAArray ({} colors{})>".format(len(self), ', premultiplied' if self.premultiplied else '')
+
+    def tobytes(self):
+        """ The packed RGBA quads backing the array, in its storage, as bytes. """
+        return bytes(self._buffer)
+
+    @property
+    def rgba(self):
+        """ Straight RGBA representations of the colors. """
+        b = self._packed(False)
+        return list(zip(b[0::4], b[1::4], b[2::4], b[3::4]))
+
+    @property
+    def rgb(self):
+        """ RGB representations of the colors, without their alpha. """
+        b = self._packed(False)
+        return list(zip(b[0::4], b[1::4], b[2::4]))
+
+    @property
+    def alpha(self):
+        """ The alpha components of the colors. """
+        return list(self._buffer[3::4])
+
+    @property
+    def hex(self):
+        """ 8-char HEX representations of the colors, with a prepended octothorpe (#rrggbbaa). """
+        return rgba_to_hex_many(self.rgba)
+
+    def composite(self, other, op='over'):
+        """
+        Composite the colors of this array, as the source, with other colors, as the destination, element-wise.
+
+        :param other: The destination colors: an RGBAArray of the same length, or a single color (an RGBAColor,
+                      RGBA 4-tuple or opaque color) for every element.
+        :param op: The Porter-Duff operator, one of colorutils.blend.porter_duff (default 'over').
+        :return: The resulting colors, in the storage of this array.
+        :rtype: RGBAArray
+        """
+        premultiplied = self.premultiplied
+        if isinstance(other, RGBAArray):
+            dst = other._packed(premultiplied)
+        else:
+            other = RGBAColor(other)
+            dst = bytes(other.premultiplied if premultiplied else other.rgba) * len(self)
+        if premultiplied:
+            return RGBAArray(blend.composite_packed(self._buffer, dst, op), True)
+        return RGBAArray(blend.composite_straight_packed(self._buffer, dst, op))
+
+    def over(self, other):
+        """
+        Place the colors of this array over other colors, element-wise.
+
+        :param other: The colors beneath: an RGBAArray of the same length, or a single color for every element.
+        :return: The resulting colors, in the storage of this array.
+        :rtype: RGBAArray
+        """
+        return self.composite(other, 'over')
+
+    @classmethod
+    def flatten(cls, layers, premultiplied=False):
+        """
+        Stack layers of colors, each placed over the layers before it. The layers are composited in the storage of
+        the result, converting each layer at most once.
+
+        :param layers: The RGBAArrays to stack, of the same length, from the bottom layer up.
+        :param premultiplied: Flag indicating the result is stored premultiplied (default False).
+        :return: The flattened colors.
+        :rtype: RGBAArray
+        """
+        composite = blend.composite_packed if premultiplied else blend.composite_straight_packed
+        result = None
+        for layer in layers:
+            packed = layer._packed(premultiplied)
+            result = packed if result is None else composite(packed, result, 'over')
+        if result is None:
+            raise ColorException('At least one layer is required')
+        return RGBAArray(result, premultiplied)
+
+
+def _pack_rgb(colors):
+    """
+    Pack an iterable of RGB 3-tuples (or Colors) into a bytearray of RGB triples. Integral channel values are packed
+    directly; any other values are rounded and clamped to [0, 255].
+    """
+    colors = [c.rgb if isinstance(c, Color) else c for c in colors]
+    try:
+        packed = bytearray(v for c in colors for v in c)
+    except (TypeError, ValueError):
+        packed = bytearray(_clamp_channel(v) for c in colors for v in c)
+
+    if len(packed) != len(colors) * 3:
+        raise ColorException('Expected RGB 3-tuples when packing colors')
+    return packed
+
+
+def _pack_rgba(colors):
+    """
+    Pack an iterable of straight RGBA 4-tuples, RGBAColors, or opaque RGB 3-tuples or Colors into a bytearray of RGBA
+    quads. Channel values are rounded and clamped to [0, 255].
+    """
+    packed = bytearray()
+    for c in colors:
+        c = c.rgba if isinstance(c, RGBAColor) else tuple(getattr(c, 'rgb', c))
+        if len(c) == 3:
+            packed.extend(_clamp_channel(v) for v in c)
+            packed.append(rgb_max_val)
+        elif len(c) == 4:
+            packed.extend(_clamp_channel(v) for v in c)
+        else:
+            raise ColorException('Expected RGB 3-tuples or RGBA 4-tuples when packing colors')
+    return packed
 
 
 # -----------------------------------------------
@@ -259,16 +1124,17 @@ def offset_random_rgb(seed, amount=1):
     :param amount:
     :return:
     """
-    r, g, b = seed
+    results = [_offset_rgb(seed, random.random()) for _ in range(amount)]
+    return results[0] if len(results) > 1 else results
 
-    results = []
-    for _ in range(amount):
-        base_val = ((r + g + b) / 3) + 1  # Add one to eliminate case where the base value would otherwise be 0
-        new_val = base_val + (random.random() * rgb_max_val / 5)  # Randomly offset with an arbitrary multiplier
-        ratio = new_val / base_val
-        results.append((min(int(r*ratio), rgb_max_val), min(int(g*ratio), rgb_max_val), min(int(b*ratio), rgb_max_val)))
 
-    return results[0] if len(results) > 1 else results
+def _offset_rgb(seed, offset):
+    """ Offset a seed color by a fraction in [0, 1) of the maximum random offset. """
+    r, g, b = seed
+    base_val = ((r + g + b) / 3) + 1  # Add one to eliminate case where the base value would otherwise be 0
+    new_val = base_val + (offset * rgb_max_val / 5)  # Randomly offset with an arbitrary multiplier
+    ratio = new_val / base_val
+    return min(int(r*ratio), rgb_max_val), min(int(g*ratio), rgb_max_val), min(int(b*ratio), rgb_max_val)
 
 
 def offset_random_hex(seed, amount=1):
@@ -295,6 +1161,170 @@ def offset_random_web(seed, amount=1):
     return rgb_to_web(offset_random_rgb(seed, amount))
 
 
+def iter_random_rgb(count=None, chunk_size=None):
+    """
+    Lazily generate uniformly random RGB values.
+
+    :param count: The number of colors to generate (default None, generating indefinitely)
+    :param chunk_size: If set, yield ColorArrays of up to this many colors instead of single colors (default None)
+    :return: A generator of RGB 3-tuples, or of ColorArrays if chunk_size is set
+    :rtype: generator
+    """
+    colors = (random_rgb() for _ in _repeat(count))
+    return _iter_chunks(colors, chunk_size) if chunk_size else colors
+
+
+def iter_offset_random_rgb(seed, count=None, chunk_size=None):
+    """
+    Lazily generate random colors determined by a randomized offset from a seed color, as in offset_random_rgb.
+
+    :param seed: The seed color, as an RGB 3-tuple
+    :param count: The number of colors to generate (default None, generating indefinitely)
+    :param chunk_size: If set, yield ColorArrays of up to this many colors instead of single colors (default None)
+    :return: A generator of RGB 3-tuples, or of ColorArrays if chunk_size is set
+    :rtype: generator
+    """
+    colors = (_offset_rgb(seed, random.random()) for _ in _repeat(count))
+    return _iter_chunks(colors, chunk_size) if chunk_size else colors
+
+
+# - - - - - - - - - - - - - - -
+# Bulk Random Color Functions
+# - - - - - - - - - - - - - - -
+#
+# The bulk random functions take an `rng` argument which may be None (a freshly seeded generator), a seed (int, str
+# or bytes), or a random.Random instance. Given the same seed, they produce the same colors. For parallel generation,
+# random_streams provides independent, reproducible generators, one per worker.
+
+_random_block = 1 << 20
+
+
+def _rng(rng):
+    """ Get a random.Random instance from a seed, an existing instance, or None. """
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
+
+
+def random_streams(seed, count):
+    """
+    Create independent random generators, deterministically derived from a seed, e.g. one per worker process.
+
+    :param seed: The seed (int, str or bytes) the generators are derived from
+    :param count: The number of generators to create
+    :return: A list of random.Random instances
+    :rtype: list
+    """
+    import hashlib
+
+    seed = seed if isinstance(seed, bytes) else str(seed).encode('utf-8')
+    return [random.Random(int(hashlib.sha256(seed + b':' + str(i).encode('ascii')).hexdigest(), 16))
+            for i in range(count)]
+
+
+def random_rgb_many(count, rng=None, packed=False):
+    """
+    Generate many uniformly random RGB values.
+
+    :param count: The number of colors to generate
+    :param rng: A seed or random.Random instance (default None)
+    :param packed: Flag indicating the colors should be returned as packed RGB bytes (default False)
+    :return: The random colors
+    :rtype: ColorArray or bytes
+    """
+    rng = _rng(rng)
+    blocks = []
+    for start in range(0, 3 * count, _random_block):
+        size = min(_random_block, 3 * count - start)
+        blocks.append(rng.getrandbits(8 * size).to_bytes(size, 'little'))
+    data = b''.join(blocks)
+    return data if packed else ColorArray(data)
+
+
+def random_hex_many(count, rng=None):
+    """
+    Generate many uniformly random HEX values.
+
+    :param count: The number of colors to generate
+    :param rng: A seed or random.Random instance (default None)
+    :return: The random HEX values
+    :rtype: list
+    """
+    return rgb_to_hex_many(random_rgb_many(count, rng, packed=True))
+
+
+def random_web_many(count, rng=None):
+    """
+    Generate many uniformly random WEB values.
+
+    :param count: The number of colors to generate
+    :param rng: A seed or random.Random instance (default None)
+    :return: The random WEB values
+    :rtype: list
+    """
+    return rgb_to_web_many(random_rgb_many(count, rng, packed=True))
+
+
+def offset_random_rgb_many(seed, count, rng=None, packed=False):
+    """
+    Generate many random colors determined by a randomized offset from a seed color, as in offset_random_rgb.
+
+    :param seed: The seed color, as an RGB 3-tuple
+    :param count: The number of colors to generate
+    :param rng: A seed or random.Random instance (default None)
+    :param packed: Flag indicating the colors should be returned as packed RGB bytes (default False)
+    :return: The random colors
+    :rtype: ColorArray or bytes
+    """
+    rand = _rng(rng).random
+    colors = ColorArray([_offset_rgb(seed, rand()) for _ in range(count)])
+    return colors.tobytes() if packed else colors
+
+
+def offset_random_hex_many(seed, count, rng=None):
+    """
+    Generate many random HEX values determined by a randomized offset from a seed color.
+
+    :param seed: The seed color, as an RGB 3-tuple
+    :param count: The number of colors to generate
+    :param rng: A seed or random.Random instance (default None)
+    :return: The random HEX values
+    :rtype: list
+    """
+    return rgb_to_hex_many(offset_random_rgb_many(seed, count, rng, packed=True))
+
+
+def offset_random_web_many(seed, count, rng=None):
+    """
+    Generate many random WEB values determined by a randomized offset from a seed color.
+
+    :param seed: The seed color, as an RGB 3-tuple
+    :param count: The number of colors to generate
+    :param rng: A seed or random.Random instance (default None)
+    :return: The random WEB values
+    :rtype: list
+    """
+    return rgb_to_web_many(offset_random_rgb_many(seed, count, rng, packed=True))
+
+
+def _repeat(count):
+    """ An iterator of count items, or an endless one if count is None. """
+    return itertools.repeat(None) if count is None else itertools.repeat(None, count)
+
+
+def _iter_chunks(colors, chunk_size):
+    """ Group an iterable of colors into ColorArrays of up to chunk_size colors. """
+    if chunk_size < 1:
+        raise ColorException('Chunk size must be at least 1')
+
+    colors = iter(colors)
+    while True:
+        chunk = ColorArray(itertools.islice(colors, chunk_size))
+        if not len(chunk):
+            return
+        yield chunk
+
+
 # - - - - - - - - - - - - - - -
 # Other Color Functions
 # - - - - - - - - - - - - - - -
@@ -313,23 +1343,35 @@ def color_run(start_color, end_color, step_count, inclusive=True, to_color=True)
     :return: List of colors between the start and end color
     :rtype: list
     """
-    if isinstance(start_color, Color):
-        start_color = start_color.rgb
+    from .gradient import gradient
 
-    if isinstance(end_color, Color):
-        end_color = end_color.rgb
+    run = gradient([start_color, end_color], step_count, inclusive=inclusive)
+    return run if not to_color else [Color(c) for c in run]
 
-    step = tuple((end_color[i] - start_color[i])/step_count for i in range(3))
 
-    add = lambda x, y: tuple(sum(z) for z in zip(x, y))
-    mult = lambda x, y: tuple(y * z for z in x)
+def iter_color_run(start_color, end_color, step_count, inclusive=True, to_color=True, chunk_size=None):
+    """
+    Lazily generate the colors of a color run (see color_run), without building the full list.
 
-    run = [add(start_color, mult(step, i)) for i in range(1, step_count)]
+    :param start_color: The color starting the run
+    :param end_color: The color ending the run
+    :param step_count: The number of colors to have between the start and end color
+    :param inclusive: Flag determining whether to include start and end values in run (default True)
+    :param to_color: Flag indicating yielded values should be Color objects (default True)
+    :param chunk_size: If set, yield ColorArrays of up to this many colors instead of single colors (default None)
+    :return: A generator of colors between the start and end color
+    :rtype: generator
+    """
+    from .gradient import iter_gradient
 
-    if inclusive:
-        run = [start_color] + run + [end_color]
+    run = iter_gradient([start_color, end_color], step_count, inclusive=inclusive)
+    if chunk_size:
+        return _iter_chunks(run, chunk_size)
+    return (Color(c) for c in run) if to_color else run
 
-    return run if not to_color else [Color(c) for c in run]
+
+# Half the luma of white, above which a background takes dark text
+_text_threshold = rgb_to_yiq(rgb_max)[0] / 2
 
 
 def text_color(background, dark_color=rgb_min, light_color=rgb_max):
@@ -343,8 +1385,7 @@ def text_color(background, dark_color=rgb_min, light_color=rgb_max):
     :param light_color:
     :return:
     """
-    max_y = rgb_to_yiq(rgb_max)[0]
-    return light_color if rgb_to_yiq(background)[0] <= max_y / 2 else dark_color
+    return light_color if rgb_to_yiq(background)[0] <= _text_threshold else dark_color
 
 
 def minify_hex(_hex):
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+WCAG 2.x relative luminance and contrast.
+
+The contrast ratio of two colors is (L1 + 0.05) / (L2 + 0.05), where L1 and L2 are the relative luminances of the
+lighter and the darker color. The ratio ranges from 1 (no contrast) to 21 (black on white). WCAG requires a ratio of at
+least 4.5 (AA) or 7 (AAA) for normal text, and 3 (AA) or 4.5 (AAA) for large text.
+
+The relative luminance of each color is cached, so repeated colors (e.g. the backgrounds of a dashboard) are only
+computed once:
+
+    >>> from colorutils.contrast import best_contrast_many
+    >>> best_contrast_many(backgrounds, candidates=[(0, 0, 0), (255, 255, 255), (0, 51, 102)], level='AA')
+"""
+from __future__ import division
+
+from .convert import _is_color, _linear, _rgbs
+from .exceptions import ColorException
+from .static import rgb_min, rgb_max
+
+
+# The minimum contrast ratio of each WCAG conformance level
+levels = {
+    'AA': 4.5,
+    'AAA': 7.0,
+    'AA-large': 3.0,
+    'AAA-large': 4.5,
+}
+
+# The relative luminance of each 8-bit channel value, for each channel
+_channels = []
+
+# The relative luminance of recently seen colors, by RGB 3-tuple
+_luminances = {}
+_cache_size = 1 << 16
+
+
+def _channel_tables():
+    """ Build the per-channel luminance tables. """
+    if not _channels:
+        linear = [_linear(c) for c in range(256)]
+        _channels.extend([[0.2126 * v for v in linear], [0.7152 * v for v in linear], [0.0722 * v for v in linear]])
+    return _channels
+
+
+def _luminance(rgb):
+    """ The relative luminance of an RGB 3-tuple, through the luminance cache. """
+    try:
+        return _luminances[rgb]
+    except KeyError:
+        pass
+
+    r, g, b = rgb
+    try:
+        tr, tg, tb = _channels or _channel_tables()
+        value = tr[r] + tg[g] + tb[b] if r >= 0 and g >= 0 and b >= 0 else None
+    except (IndexError, TypeError):
+        value = None
+    if value is None:
+        value = 0.2126 * _linear(r) + 0.7152 * _linear(g) + 0.0722 * _linear(b)
+
+    if len(_luminances) >= _cache_size:
+        _luminances.clear()
+    _luminances[rgb] = value
+    return value
+
+
+def _rgb(color):
+    """ The RGB 3-tuple of a color. """
+    rgb = getattr(color, 'rgb', color)
+    return rgb if isinstance(rgb, tuple) else tuple(rgb)
+
+
+def _threshold(level):
+    """ Get the minimum contrast ratio of a conformance level (or None). """
+    if level is None:
+        return None
+    try:
+        return levels[level]
+    except KeyError:
+        raise ColorException('Unknown WCAG conformance level: {}'.format(level))
+
+
+def clear_cache():
+    """ Clear the cached relative luminances. """
+    _luminances.clear()
+
+
+# -----------------------------------------------
+# Luminance and Contrast
+# -----------------------------------------------
+
+
+def relative_luminance(color):
+    """
+    The WCAG relative luminance of a color.
+
+    :param color: A Color, PackedColor or RGB 3-tuple.
+    :return: The relative luminance, from 0 (black) to 1 (white).
+    :rtype: float
+    """
+    return _luminance(_rgb(color))
+
+
+def relative_luminance_many(colors):
+    """
+    The WCAG relative luminance of each color of a collection.
+
+    :param colors: A ColorArray, a bytes-like object of packed RGB triples, or a collection of Colors, PackedColors or
+                   RGB 3-tuples.
+    :return: The relative luminance of each color.
+    :rtype: list
+    """
+    return [_luminance(rgb) for rgb in _rgbs(colors)]
+
+
+def _ratio(l1, l2):
+    """ The contrast ratio of two relative luminances. """
+    return (l1 + 0.05) / (l2 + 0.05) if l1 > l2 else (l2 + 0.05) / (l1 + 0.05)
+
+
+def contrast_ratio(color1, color2):
+    """
+    The WCAG contrast ratio of two colors.
+
+    :param color1: A Color, PackedColor or RGB 3-tuple.
+    :param color2: A Color, PackedColor or RGB 3-tuple.
+    :return: The contrast ratio, from 1 to 21.
+    :rtype: float
+    """
+    return _ratio(_luminance(_rgb(color1)), _luminance(_rgb(color2)))
+
+
+def contrast_ratio_many(colors1, colors2):
+    """
+    The WCAG contrast ratios of corresponding colors of two collections. Either argument may also be a single color,
+    which is compared against every color of the other.
+
+    :param colors1: A ColorArray, or a collection of Colors, PackedColors or RGB 3-tuples, or a single color.
+    :param colors2: A ColorArray, or a collection of Colors, PackedColors or RGB 3-tuples, or a single color.
+    :return: The contrast ratio of each pair.
+    :rtype: list
+    """
+    single1, single2 = _is_color(colors1), _is_color(colors2)
+    if single1 and single2:
+        return [contrast_ratio(colors1, colors2)]
+    if single1 or single2:
+        color, colors = (colors1, colors2) if single1 else (colors2, colors1)
+        luminance = _luminance(_rgb(color))
+        return [_ratio(luminance, _luminance(rgb)) for rgb in _rgbs(colors)]
+
+    luminances1, luminances2 = relative_luminance_many(colors1), relative_luminance_many(colors2)
+    if len(luminances1) != len(luminances2):
+        raise ColorException('Cannot compare collections of {} and {} colors'.format(len(luminances1),
+                                                                                      len(luminances2)))
+    return [_ratio(a, b) for a, b in zip(luminances1, luminances2)]
+
+
+# -----------------------------------------------
+# Choosing Foregrounds
+# -----------------------------------------------
+
+
+def _chooser(candidates, level):
+    """ Build a function choosing a candidate for a background luminance. """
+    candidates = list(candidates)
+    if not candidates:
+        raise ColorException('At least one candidate color is required')
+    luminances = [_luminance(_rgb(c)) for c in candidates]
+    threshold = _threshold(level)
+
+    def choose(background):
+        best, best_ratio = 0, 0
+        for i, luminance in enumerate(luminances):
+            ratio = _ratio(background, luminance)
+            if threshold is not None and ratio >= threshold:
+                return candidates[i]
+            if ratio > best_ratio:
+                best, best_ratio = i, ratio
+        return candidates[best]
+    return choose
+
+
+def best_contrast(background, candidates=(rgb_min, rgb_max), level=None):
+    """
+    Choose the foreground color with the most contrast against a background, or with `level` set, the first
+    candidate meeting that conformance level (falling back to the most contrast if none does).
+
+    :param background: A Color, PackedColor or RGB 3-tuple.
+    :param candidates: The candidate foreground colors (default black and white).
+    :param level: A WCAG conformance level, one of colorutils.contrast.levels (default None).
+    :return: The chosen candidate.
+    """
+    return _chooser(candidates, level)(_luminance(_rgb(background)))
+
+
+def best_contrast_many(backgrounds, candidates=(rgb_min, rgb_max), level=None):
+    """
+    Choose a foreground color for each background of a collection, as best_contrast. The choice is made once per
+    distinct background.
+
+    :param backgrounds: A ColorArray, a bytes-like object of packed RGB triples, or a collection of Colors,
+                        PackedColors or RGB 3-tuples.
+    :param candidates: The candidate foreground colors (default black and white).
+    :param level: A WCAG conformance level, one of colorutils.contrast.levels (default None).
+    :return: The chosen candidate for each background.
+    :rtype: list
+    """
+    choose = _chooser(candidates, level)
+    memo = {}
+    results = []
+    append = results.append
+    for rgb in _rgbs(backgrounds):
+        try:
+            append(memo[rgb])
+        except KeyError:
+            append(memo.setdefault(rgb, choose(_luminance(rgb))))
+    return results
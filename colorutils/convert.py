@@ -4,8 +4,26 @@
 A collection of color-space conversion functions.
 """
 from __future__ import division
-from .static import web_colors
+from . import static
 from .exceptions import *
+from .codec import encode_hex_list
+
+
+# Conversion tables in use, by kind (see colorutils.tables)
+_tables = {}
+
+# Memoized parsing of HEX and WEB values, when in use (see colorutils.memo)
+_memo = None
+
+
+def _nearest_web(rgb, metric):
+    """ The nearest named web color, loading the k-d tree lookup on first use. """
+    if metric == 'euclidean' and 'web' in _tables:
+        name = _tables['web'].lookup(rgb)
+        if name is not None:
+            return name
+    from .nearest import nearest_web
+    return nearest_web(rgb, metric)
 
 
 # --------------------
@@ -29,22 +47,27 @@ def rgb_to_hex(rgb):
     return "#{0}{1}{2}".format(hex(int(r))[2:].zfill(2), hex(int(g))[2:].zfill(2), hex(int(b))[2:].zfill(2))
 
 
-def rgb_to_web(rgb):
+def rgb_to_web(rgb, nearest=False, metric='euclidean'):
     """
     Convert an RGB color representation to a WEB color representation.
 
+    If the RGB value is not a named web color, its HEX representation is returned, unless `nearest` is set, in which
+    case the name of the nearest named web color (under the given distance metric) is returned.
+
     (r, g, b) :: r -> [0, 255]
                  g -> [0, 255]
                  b -> [0, 255]
 
     :param rgb: A tuple of three numeric values corresponding to the red, green, and blue value.
+    :param nearest: Flag indicating unnamed colors should map to the nearest named color (default False)
+    :param metric: The distance metric for nearest matching, one of colorutils.nearest.metrics (default 'euclidean')
     :return: WEB representation of the input RGB value.
     :rtype: str
     """
     try:
-        return web_colors[rgb]
+        return static.web_colors[rgb]
     except KeyError:
-        return rgb_to_hex(rgb)
+        return _nearest_web(rgb, metric) if nearest else rgb_to_hex(rgb)
 
 
 def rgb_to_yiq(rgb):
@@ -59,6 +82,15 @@ def rgb_to_yiq(rgb):
     :return: YIQ representation of the input RGB value.
     :rtype: tuple
     """
+    if _tables:
+        value = _tables['yiq'].lookup(rgb) if 'yiq' in _tables else None
+        if value is not None:
+            return value
+    return _rgb_to_yiq(rgb)
+
+
+def _rgb_to_yiq(rgb):
+    """ rgb_to_yiq, computed without conversion tables. """
     r, g, b = rgb[0] / 255, rgb[1] / 255, rgb[2] / 255
     y = (0.299 * r) + (0.587 * g) + (0.114 * b)
     i = (0.596 * r) - (0.275 * g) - (0.321 * b)
@@ -78,6 +110,15 @@ def rgb_to_hsv(rgb):
     :return: HSV representation of the input RGB value.
     :rtype: tuple
     """
+    if _tables:
+        value = _tables['hsv'].lookup(rgb) if 'hsv' in _tables else None
+        if value is not None:
+            return value
+    return _rgb_to_hsv(rgb)
+
+
+def _rgb_to_hsv(rgb):
+    """ rgb_to_hsv, computed without conversion tables. """
     r, g, b = rgb[0] / 255, rgb[1] / 255, rgb[2] / 255
     _min = min(r, g, b)
     _max = max(r, g, b)
@@ -119,6 +160,14 @@ def hex_to_rgb(_hex):
     :return: RGB representation of the input HEX value.
     :rtype: tuple
     """
+    memo = _memo
+    if memo is not None:
+        return memo('rgb', _hex_key(_hex))
+    return _hex_to_rgb(_hex)
+
+
+def _hex_to_rgb(_hex):
+    """ Parse a HEX color representation to an RGB color representation, without memoization. """
     _hex = _hex.strip('#')
     n = len(_hex) // 3
     if len(_hex) == 3:
@@ -132,20 +181,26 @@ def hex_to_rgb(_hex):
     return r, g, b
 
 
-def hex_to_web(_hex):
+def hex_to_web(_hex, nearest=False, metric='euclidean'):
     """
     Convert a HEX color representation to a WEB color representation.
 
+    If the HEX value is not a named web color, it is returned unchanged, unless `nearest` is set, in which case the
+    name of the nearest named web color (under the given distance metric) is returned.
+
     hex :: hex -> [000000, FFFFFF]
 
     :param _hex: The 3- or 6-char hexadecimal string representing the color value.
+    :param nearest: Flag indicating unnamed colors should map to the nearest named color (default False)
+    :param metric: The distance metric for nearest matching, one of colorutils.nearest.metrics (default 'euclidean')
     :return: WEB representation of the input HEX value.
     :rtype: str
     """
+    rgb = hex_to_rgb(_hex)
     try:
-        return web_colors[hex_to_rgb(_hex)]
+        return static.web_colors[rgb]
     except KeyError:
-        return _hex
+        return _nearest_web(rgb, metric) if nearest else _hex
 
 
 def hex_to_yiq(_hex):
@@ -158,6 +213,9 @@ def hex_to_yiq(_hex):
     :return: YIQ representation of the input HEX value.
     :rtype: tuple
     """
+    memo = _memo
+    if memo is not None:
+        return memo('yiq', _hex_key(_hex))
     return rgb_to_yiq(hex_to_rgb(_hex))
 
 
@@ -171,6 +229,9 @@ def hex_to_hsv(_hex):
     :return: HSV representation of the input HEX value.
     :rtype: tuple
     """
+    memo = _memo
+    if memo is not None:
+        return memo('hsv', _hex_key(_hex))
     return rgb_to_hsv(hex_to_rgb(_hex))
 
 
@@ -191,7 +252,7 @@ def web_to_rgb(web):
     :rtype: tuple
     """
     try:
-        return web_colors[web.lower()]
+        return static.web_colors[web.lower()]
     except KeyError:
         return hex_to_rgb(web)
 
@@ -208,7 +269,7 @@ def web_to_hex(web):
     :rtype: str
     """
     try:
-        return rgb_to_hex(web_colors[web])
+        return rgb_to_hex(static.web_colors[web])
     except KeyError:
         return web
 
@@ -224,6 +285,9 @@ def web_to_yiq(web):
     :return: YIQ representation of the input WEB value.
     :rtype: tuple
     """
+    memo = _memo
+    if memo is not None:
+        return memo('yiq', _web_key(web))
     return rgb_to_yiq(web_to_rgb(web))
 
 
@@ -238,9 +302,48 @@ def web_to_hsv(web):
     :return: HSV representation of the input WEB value.
     :rtype: tuple
     """
+    memo = _memo
+    if memo is not None:
+        return memo('hsv', _web_key(web))
     return rgb_to_hsv(web_to_rgb(web))
 
 
+# --------------------
+# Memoized Parsing
+# --------------------
+
+# With memoization enabled (see colorutils.memo), HEX and WEB values are parsed through a bounded LRU cache. Values are
+# cached under a normalized key, so that equivalent spellings (e.g. '#FFF', 'fff' and '#ffffff') share an entry: HEX
+# values are lowercased, stripped of octothorpes and expanded from 3 chars; named WEB values are keyed by their RGB
+# value. hex_to_web and web_to_hex are not memoized, as they may return their (unnormalized) input.
+
+
+def _hex_key(_hex):
+    """ The normalized spelling of a HEX value. """
+    key = _hex.strip('#').lower()
+    if len(key) == 3:
+        key = key[0] * 2 + key[1] * 2 + key[2] * 2
+    return key
+
+
+def _web_key(web):
+    """ The normalized key of a WEB value: the RGB value of a named color, or else the normalized HEX value. """
+    try:
+        return static.web_colors[web.lower()]
+    except KeyError:
+        return _hex_key(web)
+
+
+def _parse(kind, key):
+    """ Convert a normalized HEX or WEB key to the RGB, YIQ or HSV color representation. """
+    rgb = key if isinstance(key, tuple) else _hex_to_rgb(key)
+    if kind == 'yiq':
+        return rgb_to_yiq(rgb)
+    if kind == 'hsv':
+        return rgb_to_hsv(rgb)
+    return rgb
+
+
 # --------------------
 # Conversions from YIQ
 # --------------------
@@ -399,4 +502,662 @@ def hsv_to_yiq(hsv):
     :return: YIQ representation of the input HSV value.
     :rtype: tuple
     """
-    return rgb_to_yiq(hsv_to_rgb(hsv))
\ No newline at end of file
+    return rgb_to_yiq(hsv_to_rgb(hsv))
+
+
+# ------------------------------
+# Conversions to XYZ and CIELAB
+# ------------------------------
+#
+# XYZ and CIELAB values are relative to the D65 white point, with XYZ scaled so that the Y of white is 100.
+
+_d65 = (95.047, 100.0, 108.883)
+
+
+def _linear(c):
+    """ Convert an sRGB channel value in [0, 255] to linear light in [0, 1]. """
+    c /= 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def rgb_to_xyz(rgb):
+    """
+    Convert an RGB color representation to a CIE XYZ color representation.
+
+    (r, g, b) :: r -> [0, 255]
+                 g -> [0, 255]
+                 b -> [0, 255]
+
+    :param rgb: A tuple of three numeric values corresponding to the red, green, and blue value.
+    :return: XYZ representation of the input RGB value.
+    :rtype: tuple
+    """
+    r, g, b = _linear(rgb[0]), _linear(rgb[1]), _linear(rgb[2])
+    x = (0.4124564 * r) + (0.3575761 * g) + (0.1804375 * b)
+    y = (0.2126729 * r) + (0.7151522 * g) + (0.0721750 * b)
+    z = (0.0193339 * r) + (0.1191920 * g) + (0.9503041 * b)
+    return round(x * 100, 3), round(y * 100, 3), round(z * 100, 3)
+
+
+def xyz_to_lab(xyz):
+    """
+    Convert a CIE XYZ color representation to a CIELAB color representation.
+
+    (x, y, z) :: x -> [0, 95.047]
+                 y -> [0, 100]
+                 z -> [0, 108.883]
+
+    :param xyz: A tuple of three numeric values corresponding to the X, Y, and Z value.
+    :return: CIELAB representation of the input XYZ value.
+    :rtype: tuple
+    """
+    def f(t):
+        return t ** (1 / 3) if t > 216 / 24389 else (t * 24389 / 27 + 16) / 116
+
+    fx, fy, fz = f(xyz[0] / _d65[0]), f(xyz[1] / _d65[1]), f(xyz[2] / _d65[2])
+    return round(116 * fy - 16, 3), round(500 * (fx - fy), 3), round(200 * (fy - fz), 3)
+
+
+def rgb_to_lab(rgb):
+    """
+    Convert an RGB color representation to a CIELAB color representation.
+
+    (r, g, b) :: r -> [0, 255]
+                 g -> [0, 255]
+                 b -> [0, 255]
+
+    :param rgb: A tuple of three numeric values corresponding to the red, green, and blue value.
+    :return: CIELAB representation of the input RGB value.
+    :rtype: tuple
+    """
+    return xyz_to_lab(rgb_to_xyz(rgb))
+
+
+def rgba_to_hex(rgba):
+    """
+    Convert an RGBA color representation to an 8-char HEX color representation.
+
+    (r, g, b, a) :: r -> [0, 255]
+                    g -> [0, 255]
+                    b -> [0, 255]
+                    a -> [0, 255]
+
+    :param rgba: A tuple of four numeric values corresponding to the red, green, blue and alpha value.
+    :return: HEX representation of the input RGBA value, as #rrggbbaa.
+    :rtype: str
+    """
+    return rgb_to_hex(rgba[:3]) + hex(int(rgba[3]))[2:].zfill(2)
+
+
+def hex_to_rgba(_hex):
+    """
+    Convert a HEX color representation, with or without an alpha channel, to an RGBA color representation. HEX values
+    without an alpha channel are opaque (alpha 255).
+
+    hex :: hex -> [000000, FFFFFF]
+                | [00000000, FFFFFFFF]
+
+    :param _hex: The 3-, 4-, 6- or 8-char hexadecimal string representing the color value.
+    :return: RGBA representation of the input HEX value.
+    :rtype: tuple
+    """
+    digits = _hex.strip('#')
+    if len(digits) == 4:
+        return hex_to_rgb(digits[:3]) + (int(digits[3] * 2, 16),)
+    if len(digits) == 8:
+        return hex_to_rgb(digits[:6]) + (int(digits[6:], 16),)
+    return hex_to_rgb(digits) + (255,)
+
+
+# --------------------
+# Bulk Conversions
+# --------------------
+#
+# Each scalar conversion above has a bulk counterpart (suffixed with `_many`) which takes a collection of colors and
+# returns a list of the converted values, in order. The results are identical to calling the scalar conversion on
+# each element. Bulk conversions from RGB additionally accept a bytes-like object of packed 8-bit RGB triples.
+#
+# Collections of at least _plane_size 8-bit RGB colors (packed buffers, or integer 3-tuples) are converted to YIQ and
+# HSV a channel plane at a time, with map() over operator functions and table lookups in place of per-color Python
+# code. The rounded components are computed in integers (see _yiq_tables and _hsv_tables), and the few colors where
+# the float arithmetic of the scalar conversion decides the result (I or Q rounding to a signed zero, hues exactly
+# on a rounding tie, black) are converted by the scalar conversion, so the results are identical for every 8-bit
+# color. Measured on 1M distinct colors, this is about 2x (YIQ) and 1.5-2x (HSV) faster than calling the scalar
+# conversion per color; the gain is bounded by the cost of creating the result tuples and floats, which dominates.
+# The tables take about 4 MB and 0.15s to create, on first use. When full-gamut conversion tables are enabled
+# (see colorutils.tables), the colors are looked up in those instead.
+#
+# The other bulk conversions apply the scalar conversion per color. They memoize the results while the values show
+# repeats (as the pixels of an image do), up to a bounded number of distinct values; runs of mostly distinct values
+# are converted without the memo, whose lookups would only add to the cost, so they run about as fast as a scalar
+# loop. HEX encoding of 8-bit RGB values also uses a precomputed table of hex digits in place of per-channel string
+# formatting, and packed buffers are HEX encoded in a single pass by colorutils.codec.
+
+_hex_digits = dict((i, '{0:02x}'.format(i)) for i in range(256))
+
+
+def _rgb_values(rgbs):
+    """ Normalize a collection of RGB values to an iterable of hashable 3-tuples. """
+    if isinstance(rgbs, (bytes, bytearray, memoryview)):
+        rgbs = bytearray(rgbs)
+        return zip(rgbs[0::3], rgbs[1::3], rgbs[2::3])
+    return _tuple_values(rgbs)
+
+
+def _tuple_values(values):
+    """ Normalize a collection of multi-value color representations to an iterable of hashable tuples. """
+    return (v if isinstance(v, tuple) else tuple(v) for v in values)
+
+
+def _rgbs(colors):
+    """ The RGB 3-tuples of a ColorArray, a bytes-like object of packed RGB triples, or a collection of colors. """
+    if hasattr(colors, 'tobytes'):
+        colors = colors.tobytes()
+    if isinstance(colors, (bytes, bytearray, memoryview)):
+        return list(_rgb_values(colors))
+    return list(_tuple_values(getattr(c, 'rgb', c) for c in colors))
+
+
+def _is_color(value):
+    """ Whether a value is a single color, rather than a collection of colors. """
+    if hasattr(value, 'red'):
+        return not hasattr(value, 'tobytes')
+    return isinstance(value, tuple) and len(value) == 3 and not isinstance(value[0], (tuple, list))
+
+
+_memo_probe = 1024
+_memo_size = 65536
+_plane_size = 4096
+
+
+def _bulk(fn, values):
+    """
+    Apply a conversion to each value. The values are converted in chunks of _memo_probe, memoizing the results while
+    at least a quarter of the values of a chunk repeat earlier ones, up to _memo_size distinct values. Otherwise the
+    chunks are converted without the memo, probing every 16th chunk for repeats again.
+    """
+    import itertools
+
+    values = iter(values)
+    memo = {}
+    get = memo.get
+    results = []
+    append = results.append
+    memoize = True
+    for n in itertools.count():
+        chunk = list(itertools.islice(values, _memo_probe))
+        if not chunk:
+            return results
+        if not (memoize or n % 16 == 0):
+            results.extend(map(fn, chunk))
+            continue
+
+        misses = 0
+        for value in chunk:
+            result = get(value)
+            if result is None:
+                misses += 1
+                result = fn(value)
+                if len(memo) < _memo_size:
+                    memo[value] = result
+            append(result)
+        memoize = 4 * misses <= 3 * len(chunk)
+
+
+def _packed_rgb(rgbs):
+    """ A list or tuple of RGB colors as packed 8-bit RGB triples, or None if a color is not 3 8-bit integers. """
+    import itertools
+
+    try:
+        if any(len(rgb) != 3 for rgb in rgbs):
+            return None
+        return bytes(itertools.chain.from_iterable(rgbs))
+    except (TypeError, ValueError):
+        return None
+
+
+def _bulk_planes(kind, convert, fn, rgbs):
+    """
+    Apply a conversion from RGB in bulk: 8-bit colors are looked up in its conversion table if enabled, or converted
+    a plane at a time if there are at least _plane_size of them; other colors are converted one at a time.
+    """
+    if isinstance(rgbs, (bytes, bytearray, memoryview)):
+        packed = bytes(rgbs)
+    else:
+        rgbs = rgbs if isinstance(rgbs, (list, tuple)) else list(rgbs)
+        packed = _packed_rgb(rgbs)
+        if packed is None:
+            return _bulk(fn, _tuple_values(rgbs))
+    if kind in _tables:
+        values = _tables[kind].lookup_packed(packed)
+        if values is not None:
+            return values
+    n = len(packed) // 3
+    if n < _plane_size:
+        return _bulk(fn, _rgb_values(packed))
+    return convert(packed[0:3 * n:3], packed[1:3 * n:3], packed[2:3 * n:3])
+
+
+_plane_tables = {}
+
+
+def _yiq_tables():
+    """
+    The tables of rgb_to_yiq_many for 8-bit colors, created on first use: for each component, the red-green and blue
+    parts of 2 * K + 255 (offset to be non-negative) for the integer K = 255000 * component, and the values k / 1000
+    indexed by k = (2 * K + 255) // 510 (plus the offset). This k is the component rounded to 3 places, since K / 255
+    is never closer than 1/510 to a rounding tie, far more than the error of the scalar float arithmetic.
+    """
+    import array
+
+    if 'yiq' not in _plane_tables:
+        tables = []
+        for weights in ((299, 587, 114), (596, -275, -321), (212, -528, 311)):
+            offset = -sum(w for w in weights if w < 0)
+            top = (2 * 255 * (sum(w for w in weights if w > 0) + offset) + 255) // 510
+            wr, wg, wb = (2 * w for w in weights)
+            rg = array.array('i', (wr * r + wg * g + 510 * offset + 255 for r in range(256) for g in range(256)))
+            b = [wb * c for c in range(256)]
+            tables.append((rg, b, [(k - offset) / 1000 for k in range(top + 1)]))
+        _plane_tables['yiq'] = tables
+    return _plane_tables['yiq']
+
+
+def _hsv_tables():
+    """
+    The tables of rgb_to_hsv_many for 8-bit colors, created on first use. The hue of a color is 60 * (n / d + 2 * c)
+    degrees, where d is the difference of its largest and smallest channel, and n the difference of the other two
+    channels (g - b, b - r or r - g, for c = 0, 1 or 2 as red, green or blue is the largest), plus 360 for a negative
+    n with c = 0. The hue table holds 1000 times the hue rounded, by c, n and d, or -1 where it lies exactly on a
+    rounding tie, which the float arithmetic of the scalar conversion may round either way. The saturation and value
+    are tables of the largest and smallest channel, computed as in the scalar conversion.
+    """
+    import array
+
+    if 'hsv' not in _plane_tables:
+        # 1000 * 60 * n / d rounded, or None on a tie, for d >= |n| (a channel difference never exceeds d)
+        rows = [[0] * max(abs(n), 1) + [None if 120000 * n % (2 * d) == d else (120000 * n + d) // (2 * d)
+                                        for d in range(max(abs(n), 1), 256)] for n in range(-255, 256)]
+        hues = array.array('i')
+        for c in range(3):
+            for n, row in zip(range(-255, 256), rows):
+                shift = 120000 * c + (360000 if c == 0 and n < 0 else 0)
+                hues.extend(-1 if k is None else k + shift for k in row)
+        offsets = array.array('i', ((c * 511 + a - b + 255) * 256 for c in range(3) for a in range(256)
+                                    for b in range(256)))
+        channel = [c / 255 for c in range(256)]
+        # The saturations share the float objects of equal values
+        rounded = {}
+        saturation = [0] * 256 + [rounded.setdefault(v, v) for v in (round((m - c) / m, 3) for m in channel[1:]
+                                                                     for c in channel)]
+        _plane_tables['hsv'] = hues, offsets, saturation, [round(c, 3) for c in channel]
+    return _plane_tables['hsv']
+
+
+def _pair_indices(high, low):
+    """ The 16-bit indices high * 256 + low of two planes of 8-bit values. """
+    import array
+    import sys
+
+    words = bytearray(2 * len(high))
+    words[0::2], words[1::2] = (high, low) if sys.byteorder == 'big' else (low, high)
+    return array.array('H', bytes(words))
+
+
+def _positions(values, value):
+    """ Yield the indices of a value in a list. """
+    i = -1
+    while True:
+        try:
+            i = values.index(value, i + 1)
+        except ValueError:
+            return
+        yield i
+
+
+def _rgb_to_yiq_planes(red, green, blue):
+    """ rgb_to_yiq_many of the planes of 8-bit RGB colors. """
+    import itertools
+    from operator import add, floordiv
+
+    pairs = _pair_indices(red, green)
+    planes = []
+    for rg, b, values in _yiq_tables():
+        sums = map(add, map(rg.__getitem__, pairs), map(b.__getitem__, blue))
+        planes.append(list(map(values.__getitem__, map(floordiv, sums, itertools.repeat(510)))))
+    results = list(zip(*planes))
+
+    # I and Q rounded to zero keep the sign of the float arithmetic, as computed by the scalar conversion
+    for plane in planes[1:]:
+        for i in _positions(plane, 0.0):
+            results[i] = _rgb_to_yiq((red[i], green[i], blue[i]))
+    return results
+
+
+def _rgb_to_hsv_planes(red, green, blue):
+    """ rgb_to_hsv_many of the planes of 8-bit RGB colors. """
+    import array
+    import itertools
+    import sys
+    from operator import add, and_, eq, mul, rshift, sub, truediv
+
+    hues, offsets, saturation, value = _hsv_tables()
+    high = bytes(map(max, red, green, blue))
+    low = bytes(map(min, red, green, blue))
+
+    # The channel holding the maximum (red first, then green, then blue), as 0 (blue), 1 (green) or 2 and 3 (red)
+    case = list(map(add, map(mul, map(eq, red, high), itertools.repeat(2)), map(eq, green, high)))
+
+    # Widen each color to a big-endian 64-bit word, RGBRGB in its low 48 bits, so that shifting it by 0, 16 or 8 bits
+    # leaves the channels of the hue difference (g, b), (b, r) or (r, g) in its low 16 bits
+    words = bytearray(8 * len(red))
+    for i, plane in enumerate((red, green, blue, red, green, blue)):
+        words[i + 2::8] = plane
+    words = array.array('Q', bytes(words))
+    if sys.byteorder == 'little':
+        words.byteswap()
+    pairs = map(and_, map(rshift, words, map((8, 16, 0, 0).__getitem__, case)), itertools.repeat(0xFFFF))
+    pairs = map(add, pairs, map((2 << 16, 1 << 16, 0, 0).__getitem__, case))
+
+    hue = list(map(hues.__getitem__, map(add, map(offsets.__getitem__, pairs), map(sub, high, low))))
+    extent = _pair_indices(high, low)
+    results = list(zip(map(truediv, hue, itertools.repeat(1000)), map(saturation.__getitem__, extent),
+                       map(value.__getitem__, high)))
+
+    for i in _positions(hue, -1):
+        results[i] = _rgb_to_hsv((red[i], green[i], blue[i]))
+    black = high.find(0)
+    while black >= 0:
+        results[black] = (0, 0, 0.0)
+        black = high.find(0, black + 1)
+    return results
+
+
+def _rgb_to_hex_table(rgb):
+    """ rgb_to_hex, using the precomputed digit table for 8-bit channel values. """
+    try:
+        return '#' + _hex_digits[rgb[0]] + _hex_digits[rgb[1]] + _hex_digits[rgb[2]]
+    except KeyError:
+        return rgb_to_hex(rgb)
+
+
+def rgb_to_hex_many(rgbs):
+    """
+    Convert a collection of RGB color representations to HEX color representations.
+
+    :param rgbs: An iterable of RGB 3-tuples, or a bytes-like object of packed 8-bit RGB triples.
+    :return: HEX representations of the input RGB values.
+    :rtype: list
+    """
+    if isinstance(rgbs, (bytes, bytearray, memoryview)):
+        return encode_hex_list(rgbs)
+    return _bulk(_rgb_to_hex_table, _rgb_values(rgbs))
+
+
+def rgb_to_web_many(rgbs, nearest=False, metric='euclidean'):
+    """
+    Convert a collection of RGB color representations to WEB color representations.
+
+    :param rgbs: An iterable of RGB 3-tuples, or a bytes-like object of packed 8-bit RGB triples.
+    :param nearest: Flag indicating unnamed colors should map to the nearest named color (default False)
+    :param metric: The distance metric for nearest matching, one of colorutils.nearest.metrics (default 'euclidean')
+    :return: WEB representations of the input RGB values.
+    :rtype: list
+    """
+    return _bulk(lambda rgb: rgb_to_web(rgb, nearest, metric), _rgb_values(rgbs))
+
+
+def rgb_to_yiq_many(rgbs):
+    """
+    Convert a collection of RGB color representations to YIQ color representations.
+
+    :param rgbs: An iterable of RGB 3-tuples, or a bytes-like object of packed 8-bit RGB triples.
+    :return: YIQ representations of the input RGB values.
+    :rtype: list
+    """
+    return _bulk_planes('yiq', _rgb_to_yiq_planes, rgb_to_yiq, rgbs)
+
+
+def rgb_to_hsv_many(rgbs):
+    """
+    Convert a collection of RGB color representations to HSV color representations.
+
+    :param rgbs: An iterable of RGB 3-tuples, or a bytes-like object of packed 8-bit RGB triples.
+    :return: HSV representations of the input RGB values.
+    :rtype: list
+    """
+    return _bulk_planes('hsv', _rgb_to_hsv_planes, rgb_to_hsv, rgbs)
+
+
+def hex_to_rgb_many(hexes):
+    """
+    Convert a collection of HEX color representations to RGB color representations.
+
+    :param hexes: An iterable of 3- or 6-char hexadecimal strings.
+    :return: RGB representations of the input HEX values.
+    :rtype: list
+    """
+    return _bulk(hex_to_rgb, hexes)
+
+
+def hex_to_web_many(hexes, nearest=False, metric='euclidean'):
+    """
+    Convert a collection of HEX color representations to WEB color representations.
+
+    :param hexes: An iterable of 3- or 6-char hexadecimal strings.
+    :param nearest: Flag indicating unnamed colors should map to the nearest named color (default False)
+    :param metric: The distance metric for nearest matching, one of colorutils.nearest.metrics (default 'euclidean')
+    :return: WEB representations of the input HEX values.
+    :rtype: list
+    """
+    return _bulk(lambda _hex: hex_to_web(_hex, nearest, metric), hexes)
+
+
+def hex_to_yiq_many(hexes):
+    """
+    Convert a collection of HEX color representations to YIQ color representations.
+
+    :param hexes: An iterable of 3- or 6-char hexadecimal strings.
+    :return: YIQ representations of the input HEX values.
+    :rtype: list
+    """
+    return _bulk(hex_to_yiq, hexes)
+
+
+def hex_to_hsv_many(hexes):
+    """
+    Convert a collection of HEX color representations to HSV color representations.
+
+    :param hexes: An iterable of 3- or 6-char hexadecimal strings.
+    :return: HSV representations of the input HEX values.
+    :rtype: list
+    """
+    return _bulk(hex_to_hsv, hexes)
+
+
+def web_to_rgb_many(webs):
+    """
+    Convert a collection of WEB color representations to RGB color representations.
+
+    :param webs: An iterable of WEB strings.
+    :return: RGB representations of the input WEB values.
+    :rtype: list
+    """
+    return _bulk(web_to_rgb, webs)
+
+
+def web_to_hex_many(webs):
+    """
+    Convert a collection of WEB color representations to HEX color representations.
+
+    :param webs: An iterable of WEB strings.
+    :return: HEX representations of the input WEB values.
+    :rtype: list
+    """
+    return _bulk(web_to_hex, webs)
+
+
+def web_to_yiq_many(webs):
+    """
+    Convert a collection of WEB color representations to YIQ color representations.
+
+    :param webs: An iterable of WEB strings.
+    :return: YIQ representations of the input WEB values.
+    :rtype: list
+    """
+    return _bulk(web_to_yiq, webs)
+
+
+def web_to_hsv_many(webs):
+    """
+    Convert a collection of WEB color representations to HSV color representations.
+
+    :param webs: An iterable of WEB strings.
+    :return: HSV representations of the input WEB values.
+    :rtype: list
+    """
+    return _bulk(web_to_hsv, webs)
+
+
+def yiq_to_rgb_many(yiqs):
+    """
+    Convert a collection of YIQ color representations to RGB color representations.
+
+    :param yiqs: An iterable of YIQ 3-tuples.
+    :return: RGB representations of the input YIQ values.
+    :rtype: list
+    """
+    return _bulk(yiq_to_rgb, _tuple_values(yiqs))
+
+
+def yiq_to_hex_many(yiqs):
+    """
+    Convert a collection of YIQ color representations to HEX color representations.
+
+    :param yiqs: An iterable of YIQ 3-tuples.
+    :return: HEX representations of the input YIQ values.
+    :rtype: list
+    """
+    return _bulk(yiq_to_hex, _tuple_values(yiqs))
+
+
+def yiq_to_web_many(yiqs):
+    """
+    Convert a collection of YIQ color representations to WEB color representations.
+
+    :param yiqs: An iterable of YIQ 3-tuples.
+    :return: WEB representations of the input YIQ values.
+    :rtype: list
+    """
+    return _bulk(yiq_to_web, _tuple_values(yiqs))
+
+
+def yiq_to_hsv_many(yiqs):
+    """
+    Convert a collection of YIQ color representations to HSV color representations.
+
+    :param yiqs: An iterable of YIQ 3-tuples.
+    :return: HSV representations of the input YIQ values.
+    :rtype: list
+    """
+    return _bulk(yiq_to_hsv, _tuple_values(yiqs))
+
+
+def hsv_to_rgb_many(hsvs):
+    """
+    Convert a collection of HSV color representations to RGB color representations.
+
+    :param hsvs: An iterable of HSV 3-tuples.
+    :return: RGB representations of the input HSV values.
+    :rtype: list
+    """
+    return _bulk(hsv_to_rgb, _tuple_values(hsvs))
+
+
+def hsv_to_hex_many(hsvs):
+    """
+    Convert a collection of HSV color representations to HEX color representations.
+
+    :param hsvs: An iterable of HSV 3-tuples.
+    :return: HEX representations of the input HSV values.
+    :rtype: list
+    """
+    return _bulk(hsv_to_hex, _tuple_values(hsvs))
+
+
+def hsv_to_web_many(hsvs):
+    """
+    Convert a collection of HSV color representations to WEB color representations.
+
+    :param hsvs: An iterable of HSV 3-tuples.
+    :return: WEB representations of the input HSV values.
+    :rtype: list
+    """
+    return _bulk(hsv_to_web, _tuple_values(hsvs))
+
+
+def hsv_to_yiq_many(hsvs):
+    """
+    Convert a collection of HSV color representations to YIQ color representations.
+
+    :param hsvs: An iterable of HSV 3-tuples.
+    :return: YIQ representations of the input HSV values.
+    :rtype: list
+    """
+    return _bulk(hsv_to_yiq, _tuple_values(hsvs))
+
+
+def rgb_to_xyz_many(rgbs):
+    """
+    Convert a collection of RGB color representations to CIE XYZ color representations.
+
+    :param rgbs: An iterable of RGB 3-tuples, or a bytes-like object of packed 8-bit RGB triples.
+    :return: XYZ representations of the input RGB values.
+    :rtype: list
+    """
+    return _bulk(rgb_to_xyz, _rgb_values(rgbs))
+
+
+def xyz_to_lab_many(xyzs):
+    """
+    Convert a collection of CIE XYZ color representations to CIELAB color representations.
+
+    :param xyzs: An iterable of XYZ 3-tuples.
+    :return: CIELAB representations of the input XYZ values.
+    :rtype: list
+    """
+    return _bulk(xyz_to_lab, _tuple_values(xyzs))
+
+
+def rgb_to_lab_many(rgbs):
+    """
+    Convert a collection of RGB color representations to CIELAB color representations.
+
+    :param rgbs: An iterable of RGB 3-tuples, or a bytes-like object of packed 8-bit RGB triples.
+    :return: CIELAB representations of the input RGB values.
+    :rtype: list
+    """
+    return _bulk(rgb_to_lab, _rgb_values(rgbs))
+
+
+def rgba_to_hex_many(rgbas):
+    """
+    Convert a collection of RGBA color representations to 8-char HEX color representations.
+
+    :param rgbas: An iterable of RGBA 4-tuples.
+    :return: HEX representations of the input RGBA values, as #rrggbbaa.
+    :rtype: list
+    """
+    return _bulk(rgba_to_hex, _tuple_values(rgbas))
+
+
+def hex_to_rgba_many(hexes):
+    """
+    Convert a collection of HEX color representations, with or without an alpha channel, to RGBA color
+    representations.
+
+    :param hexes: An iterable of 3-, 4-, 6- or 8-char hexadecimal strings.
+    :return: RGBA representations of the input HEX values.
+    :rtype: list
+    """
+    return _bulk(hex_to_rgba, hexes)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Perceptual color difference.
+
+The difference between two colors is measured as the distance between their CIELAB representations, using the CIE
+Delta E formulae: CIE76 (euclidean distance), CIE94 and CIEDE2000, which correct for the non-uniformities of CIELAB.
+A Delta E of about 2.3 is commonly taken as a just noticeable difference.
+
+The delta_e76, delta_e94 and delta_e2000 functions take CIELAB 3-tuples; the delta_e functions take colors (Colors,
+PackedColors or RGB 3-tuples), converting each distinct color to CIELAB once.
+"""
+from __future__ import division
+import math
+
+from .convert import _is_color, _rgbs, rgb_to_lab, rgb_to_lab_many
+from .exceptions import ColorException
+
+
+def delta_e76(lab1, lab2):
+    """
+    The CIE76 color difference: the euclidean distance between two CIELAB colors.
+
+    :param lab1: A CIELAB 3-tuple.
+    :param lab2: A CIELAB 3-tuple.
+    :return: The color difference.
+    :rtype: float
+    """
+    return math.sqrt((lab1[0] - lab2[0]) ** 2 + (lab1[1] - lab2[1]) ** 2 + (lab1[2] - lab2[2]) ** 2)
+
+
+def delta_e94(lab1, lab2, textiles=False):
+    """
+    The CIE94 color difference between two CIELAB colors. The difference is not symmetric: the first color is the
+    reference.
+
+    :param lab1: The reference CIELAB 3-tuple.
+    :param lab2: A CIELAB 3-tuple.
+    :param textiles: Flag selecting the weights for textiles rather than graphic arts (default False)
+    :return: The color difference.
+    :rtype: float
+    """
+    kl, k1, k2 = (2, 0.048, 0.014) if textiles else (1, 0.045, 0.015)
+    l1, a1, b1 = lab1
+    l2, a2, b2 = lab2
+
+    c1 = math.sqrt(a1 * a1 + b1 * b1)
+    c2 = math.sqrt(a2 * a2 + b2 * b2)
+    dl, dc = l1 - l2, c1 - c2
+    dh2 = max((a1 - a2) ** 2 + (b1 - b2) ** 2 - dc * dc, 0)
+
+    sc = 1 + k1 * c1
+    sh = 1 + k2 * c1
+    return math.sqrt((dl / kl) ** 2 + (dc / sc) ** 2 + dh2 / (sh * sh))
+
+
+def _hue(b, a):
+    """ The hue angle of a CIELAB color, in degrees in [0, 360). """
+    return math.degrees(math.atan2(b, a)) % 360 if a or b else 0.0
+
+
+def delta_e2000(lab1, lab2, kl=1, kc=1, kh=1):
+    """
+    The CIEDE2000 color difference between two CIELAB colors.
+
+    :param lab1: A CIELAB 3-tuple.
+    :param lab2: A CIELAB 3-tuple.
+    :param kl: The lightness weighting factor (default 1).
+    :param kc: The chroma weighting factor (default 1).
+    :param kh: The hue weighting factor (default 1).
+    :return: The color difference.
+    :rtype: float
+    """
+    l1, a1, b1 = lab1
+    l2, a2, b2 = lab2
+
+    c7 = ((math.sqrt(a1 * a1 + b1 * b1) + math.sqrt(a2 * a2 + b2 * b2)) / 2) ** 7
+    g = 0.5 * (1 - math.sqrt(c7 / (c7 + 25 ** 7)))
+    a1, a2 = a1 * (1 + g), a2 * (1 + g)
+    c1, c2 = math.sqrt(a1 * a1 + b1 * b1), math.sqrt(a2 * a2 + b2 * b2)
+    h1, h2 = _hue(b1, a1), _hue(b2, a2)
+
+    dl, dc = l2 - l1, c2 - c1
+    if c1 * c2 == 0:
+        dh = 0
+        h = h1 + h2
+    else:
+        dh = h2 - h1
+        if dh > 180:
+            dh -= 360
+        elif dh < -180:
+            dh += 360
+        h = (h1 + h2) / 2
+        if abs(h1 - h2) > 180:
+            h += 180 if h < 180 else -180
+    dh = 2 * math.sqrt(c1 * c2) * math.sin(math.radians(dh / 2))
+
+    l, c = (l1 + l2) / 2, (c1 + c2) / 2
+    t = (1 - 0.17 * math.cos(math.radians(h - 30)) + 0.24 * math.cos(math.radians(2 * h)) +
+         0.32 * math.cos(math.radians(3 * h + 6)) - 0.20 * math.cos(math.radians(4 * h - 63)))
+    c7 = c ** 7
+    rt = (-2 * math.sqrt(c7 / (c7 + 25 ** 7)) *
+          math.sin(math.radians(60 * math.exp(-((h - 275) / 25) ** 2))))
+
+    sl = 1 + 0.015 * (l - 50) ** 2 / math.sqrt(20 + (l - 50) ** 2)
+    sc = 1 + 0.045 * c
+    sh = 1 + 0.015 * c * t
+
+    dl, dc, dh = dl / (kl * sl), dc / (kc * sc), dh / (kh * sh)
+    return math.sqrt(dl * dl + dc * dc + dh * dh + rt * dc * dh)
+
+
+metrics = {
+    'cie76': delta_e76,
+    'cie94': delta_e94,
+    'ciede2000': delta_e2000,
+}
+
+
+def _metric(metric):
+    """ Get a Delta E function by name. """
+    try:
+        return metrics[metric]
+    except KeyError:
+        raise ColorException('Unknown color difference metric: {}'.format(metric))
+
+
+# -----------------------------------------------
+# Color Differences
+# -----------------------------------------------
+
+
+def delta_e(color1, color2, metric='ciede2000'):
+    """
+    The perceptual difference between two colors.
+
+    :param color1: A Color, PackedColor or RGB 3-tuple.
+    :param color2: A Color, PackedColor or RGB 3-tuple.
+    :param metric: The Delta E formula, one of colorutils.difference.metrics (default 'ciede2000').
+    :return: The color difference.
+    :rtype: float
+    """
+    return _metric(metric)(rgb_to_lab(getattr(color1, 'rgb', color1)), rgb_to_lab(getattr(color2, 'rgb', color2)))
+
+
+def delta_e_many(colors1, colors2, metric='ciede2000'):
+    """
+    The perceptual differences between corresponding colors of two collections. Either argument may also be a single
+    color, which is compared against every color of the other.
+
+    :param colors1: A ColorArray, or a collection of Colors, PackedColors or RGB 3-tuples, or a single color.
+    :param colors2: A ColorArray, or a collection of Colors, PackedColors or RGB 3-tuples, or a single color.
+    :param metric: The Delta E formula, one of colorutils.difference.metrics (default 'ciede2000').
+    :return: The color difference of each pair.
+    :rtype: list
+    """
+    fn = _metric(metric)
+    single1, single2 = _is_color(colors1), _is_color(colors2)
+    if single1 and single2:
+        return [delta_e(colors1, colors2, metric)]
+
+    if single1:
+        lab = rgb_to_lab(getattr(colors1, 'rgb', colors1))
+        return [fn(lab, other) for other in rgb_to_lab_many(_rgbs(colors2))]
+    if single2:
+        lab = rgb_to_lab(getattr(colors2, 'rgb', colors2))
+        return [fn(other, lab) for other in rgb_to_lab_many(_rgbs(colors1))]
+
+    labs1, labs2 = rgb_to_lab_many(_rgbs(colors1)), rgb_to_lab_many(_rgbs(colors2))
+    if len(labs1) != len(labs2):
+        raise ColorException('Cannot compare collections of {} and {} colors'.format(len(labs1), len(labs2)))
+    return [fn(a, b) for a, b in zip(labs1, labs2)]
+
+
+def iter_delta_e_matrix(colors1, colors2, metric='ciede2000', chunk_size=256):
+    """
+    Generate the perceptual difference between every color of one collection and every color of another, as rows
+    of the N x M difference matrix. The rows are computed in chunks of `chunk_size` rows, bounding memory use by
+    the chunk size rather than the size of the matrix.
+
+    :param colors1: A ColorArray, or a collection of Colors, PackedColors or RGB 3-tuples (the rows).
+    :param colors2: A ColorArray, or a collection of Colors, PackedColors or RGB 3-tuples (the columns).
+    :param metric: The Delta E formula, one of colorutils.difference.metrics (default 'ciede2000').
+    :param chunk_size: The number of rows computed at a time (default 256).
+    :return: A generator of rows, each a list of M color differences.
+    :rtype: generator
+    """
+    if chunk_size < 1:
+        raise ColorException('Chunk size must be at least 1')
+    fn = _metric(metric)
+    labs2 = rgb_to_lab_many(_rgbs(colors2))
+    return _matrix_rows(fn, _rgbs(colors1), labs2, chunk_size)
+
+
+def _matrix_rows(fn, rows, labs2, chunk_size):
+    """ Generate the rows of a difference matrix, converting the row colors to CIELAB a chunk at a time. """
+    for start in range(0, len(rows), chunk_size):
+        for a in rgb_to_lab_many(rows[start:start + chunk_size]):
+            yield [fn(a, b) for b in labs2]
+
+
+def delta_e_matrix(colors1, colors2, metric='ciede2000', chunk_size=256):
+    """
+    Compute the perceptual difference between every color of one collection and every color of another.
+
+    :param colors1: A ColorArray, or a collection of Colors, PackedColors or RGB 3-tuples (the rows).
+    :param colors2: A ColorArray, or a collection of Colors, PackedColors or RGB 3-tuples (the columns).
+    :param metric: The Delta E formula, one of colorutils.difference.metrics (default 'ciede2000').
+    :param chunk_size: The number of rows computed at a time (default 256).
+    :return: The N x M difference matrix, as a list of rows.
+    :rtype: list
+    """
+    return list(iter_delta_e_matrix(colors1, colors2, metric, chunk_size))
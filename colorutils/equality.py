@@ -3,6 +3,8 @@
 """
 A collection of colorutils-specific equality functions.
 """
+from .convert import rgb_to_hex, rgb_to_web, rgb_to_yiq, rgb_to_hsv
+from .exceptions import ColorException
 
 # -----------------------------------------------
 # RGB Color Equality
@@ -77,4 +79,163 @@ YIQ_eq = lambda c1, c2: c1.yiq == c2.yiq
 # Given two Colors, test equality between the
 # HSV representation of each color.
 # -----------------------------------------------
-HSV_eq = lambda c1, c2: c1.hsv == c2.hsv
\ No newline at end of file
+HSV_eq = lambda c1, c2: c1.hsv == c2.hsv
+
+
+# -----------------------------------------------
+# Perceptual Color Equality
+# ...............................................
+#
+# Given a tolerance, create an equality function
+# which tests whether the perceptual difference
+# (Delta E, see colorutils.difference) between
+# two Colors is within the tolerance.
+# -----------------------------------------------
+def DELTA_E_eq(tolerance=2.3, metric='ciede2000'):
+    """
+    Create an equality function under which two Colors are equal when their perceptual difference is at most the
+    tolerance. Perceptual equality functions have no equality key, since they are not transitive.
+
+    :param tolerance: The maximum Delta E between equal colors (default 2.3, a just noticeable difference).
+    :param metric: The Delta E formula, one of colorutils.difference.metrics (default 'ciede2000').
+    :return: The equality function.
+    :rtype: function
+    """
+    from .difference import delta_e, _metric
+
+    _metric(metric)
+    return lambda c1, c2: delta_e(c1, c2, metric) <= tolerance
+
+
+# -----------------------------------------------
+# Equality Keys
+# ...............................................
+#
+# Each predefined equality function has a key:
+# two Colors are equal under the equality
+# function exactly when their keys are equal.
+# Keys are hashable, so collections of colors
+# can be deduplicated, grouped and counted in
+# linear time rather than by pairwise comparison.
+#
+# A key is given by the Color attribute it reads
+# and the conversion which computes it from a
+# plain RGB 3-tuple.
+# -----------------------------------------------
+_keys = {
+    RGB_eq: ('rgb', tuple),
+    RED_eq: ('red', lambda rgb: rgb[0]),
+    GREEN_eq: ('green', lambda rgb: rgb[1]),
+    BLUE_eq: ('blue', lambda rgb: rgb[2]),
+    HEX_eq: ('hex', rgb_to_hex),
+    WEB_eq: ('web', rgb_to_web),
+    YIQ_eq: ('yiq', rgb_to_yiq),
+    HSV_eq: ('hsv', rgb_to_hsv),
+}
+
+
+def equality_key(equality_fn):
+    """
+    Get the key function for an equality function. The key function maps a Color (or an RGB 3-tuple) to a hashable
+    value, such that two colors are equal under the equality function exactly when their keys are equal.
+
+    :param equality_fn: One of the predefined equality functions.
+    :return: The key function.
+    :rtype: function
+    """
+    try:
+        attr, convert = _keys[equality_fn]
+    except (KeyError, TypeError):
+        raise ColorException('No key is defined for equality function {}'.format(equality_fn))
+
+    def key(color):
+        if isinstance(color, tuple):
+            return convert(color)
+        value = getattr(color, attr)
+        return tuple(value) if isinstance(value, list) else value
+    return key
+
+
+def equality_keys(colors, equality_fn=RGB_eq):
+    """
+    Compute the equality key of each color in a collection. For a ColorArray, the keys are computed in bulk.
+
+    :param colors: A ColorArray, or an iterable of Colors or RGB 3-tuples.
+    :param equality_fn: One of the predefined equality functions (default RGB_eq).
+    :return: The key of each color.
+    :rtype: list
+    """
+    key = equality_key(equality_fn)
+    from .colorutils import ColorArray
+    if isinstance(colors, ColorArray):
+        return getattr(colors, _keys[equality_fn][0])
+    return [key(c) for c in colors]
+
+
+def unique(colors, equality_fn=RGB_eq):
+    """
+    Remove duplicate colors from a collection under an equality function, keeping the first of each.
+
+    :param colors: A ColorArray, or an iterable of Colors or RGB 3-tuples.
+    :param equality_fn: One of the predefined equality functions (default RGB_eq).
+    :return: The unique colors, in order of first appearance (a ColorArray if given a ColorArray).
+    :rtype: list or ColorArray
+    """
+    colors = _sequence(colors)
+    indices = [group[0] for group in _group_indices(colors, equality_fn).values()]
+    return _select(colors, indices)
+
+
+def group_by(colors, equality_fn=RGB_eq):
+    """
+    Group the colors of a collection which are equal under an equality function.
+
+    :param colors: A ColorArray, or an iterable of Colors or RGB 3-tuples.
+    :param equality_fn: One of the predefined equality functions (default RGB_eq).
+    :return: A dictionary mapping each key to the colors with that key, in order of first appearance (ColorArrays
+             if given a ColorArray).
+    :rtype: dict
+    """
+    colors = _sequence(colors)
+    groups = _group_indices(colors, equality_fn)
+    return dict((key, _select(colors, indices)) for key, indices in groups.items())
+
+
+def count(colors, equality_fn=RGB_eq):
+    """
+    Count the colors of a collection which are equal under an equality function.
+
+    :param colors: A ColorArray, or an iterable of Colors or RGB 3-tuples.
+    :param equality_fn: One of the predefined equality functions (default RGB_eq).
+    :return: A mapping of each key to the number of colors with that key.
+    :rtype: collections.Counter
+    """
+    from collections import Counter
+
+    return Counter(equality_keys(colors, equality_fn))
+
+
+def _group_indices(colors, equality_fn):
+    """ Map each key to the indices of the colors with that key, in order of first appearance. """
+    groups = {}
+    for i, key in enumerate(equality_keys(colors, equality_fn)):
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [i]
+        else:
+            group.append(i)
+    return groups
+
+
+def _select(colors, indices):
+    """ Select the colors at the given indices. """
+    from .colorutils import ColorArray
+    if isinstance(colors, ColorArray):
+        b = colors._buffer
+        return ColorArray(bytearray().join(b[i * 3:i * 3 + 3] for i in indices))
+    return [colors[i] for i in indices]
+
+
+def _sequence(colors):
+    """ Materialize an iterable of colors so that it can be indexed. """
+    return colors if hasattr(colors, '__getitem__') else list(colors)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A multi-stop gradient engine.
+
+A gradient is defined by two or more color stops, each at a position in [0, 1], and is sampled at `step_count + 1`
+evenly spaced points (or `step_count - 1`, excluding the ends). Between two stops, colors are interpolated in the
+chosen color space, optionally shaped by an easing function.
+"""
+from __future__ import division
+import math
+
+from .convert import rgb_to_hsv, hsv_to_rgb, rgb_to_yiq, yiq_to_rgb
+from .exceptions import ColorException
+
+
+# -----------------------------------------------
+# Easing Functions
+# ...............................................
+#
+# Each easing function maps the position within
+# a segment, in [0, 1], to an interpolation
+# weight in [0, 1].
+# -----------------------------------------------
+easings = {
+    'linear': lambda t: t,
+    'ease-in': lambda t: t * t,
+    'ease-out': lambda t: t * (2 - t),
+    'ease-in-out': lambda t: t * t * (3 - 2 * t),
+    'sine': lambda t: (1 - math.cos(t * math.pi)) / 2,
+}
+
+
+def _hue_delta(a, b):
+    """ The signed difference between two hues along the shortest path around the hue circle. """
+    d = (b - a) % 360
+    return d - 360 if d > 180 else d
+
+
+# -----------------------------------------------
+# Interpolation Spaces
+# ...............................................
+#
+# Each space defines the conversion of a stop
+# into the space, the per-component difference
+# between two stops, and the conversion of an
+# interpolated value back to RGB.
+# -----------------------------------------------
+spaces = {
+    'rgb': (tuple, lambda a, b: tuple(b[i] - a[i] for i in range(3)), lambda v: v),
+    'hsv': (rgb_to_hsv, lambda a, b: (_hue_delta(a[0], b[0]), b[1] - a[1], b[2] - a[2]),
+            lambda v: hsv_to_rgb((v[0] % 360, v[1], v[2]))),
+    'yiq': (rgb_to_yiq, lambda a, b: tuple(b[i] - a[i] for i in range(3)), yiq_to_rgb),
+}
+
+
+def iter_gradient(stops, step_count, positions=None, space='rgb', easing=None, inclusive=True):
+    """
+    Generate the colors of a gradient, one RGB value at a time.
+
+    :param stops: Two or more colors (RGB 3-tuples or Colors) defining the gradient.
+    :param step_count: The number of steps between the first and last stop.
+    :param positions: The position of each stop in [0, 1], in increasing order (default evenly spaced).
+    :param space: The color space to interpolate in: 'rgb', 'hsv' (along the shortest hue path) or 'yiq'.
+    :param easing: An easing function name (see colorutils.gradient.easings) or callable (default linear).
+    :param inclusive: Flag determining whether to include the first and last stop (default True)
+    :return: A generator of RGB values.
+    :rtype: generator
+    """
+    if len(stops) < 2:
+        raise ColorException('A gradient requires at least two stops')
+    if step_count < 1:
+        raise ColorException('A gradient requires a step count of at least 1')
+    if space not in spaces:
+        raise ColorException('Unknown gradient color space: {}'.format(space))
+
+    if positions is None:
+        positions = [i / (len(stops) - 1) for i in range(len(stops))]
+    if len(positions) != len(stops) or any(b < a for a, b in zip(positions, positions[1:])):
+        raise ColorException('Gradient positions must be in increasing order, one per stop')
+
+    if isinstance(easing, str):
+        if easing not in easings:
+            raise ColorException('Unknown gradient easing: {}'.format(easing))
+        easing = easings[easing]
+
+    to_space, delta, from_space = spaces[space]
+    stops = [getattr(s, 'rgb', s) for s in stops]
+    values = [to_space(s) for s in stops]
+    # Stop positions, in units of steps
+    marks = [p * step_count for p in positions]
+
+    return _sample(stops, values, marks, delta, from_space, easing, step_count, inclusive)
+
+
+def _sample(stops, values, marks, delta, from_space, easing, step_count, inclusive):
+    """ Generate the samples of a validated gradient. """
+    k, last = (0, step_count) if inclusive else (1, step_count - 1)
+    while k <= last and k <= marks[0]:
+        yield stops[0]
+        k += 1
+
+    for segment in range(len(stops) - 1):
+        start, end = marks[segment], marks[segment + 1]
+        a = values[segment]
+        d = delta(a, values[segment + 1])
+        step = tuple(d[i] / (end - start) for i in range(3)) if end > start else None
+
+        while k <= last and k < end:
+            if easing is None:
+                yield from_space((a[0] + step[0] * (k - start), a[1] + step[1] * (k - start),
+                                  a[2] + step[2] * (k - start)))
+            else:
+                w = easing((k - start) / (end - start))
+                yield from_space((a[0] + d[0] * w, a[1] + d[1] * w, a[2] + d[2] * w))
+            k += 1
+
+        if k <= last and k == end:
+            yield stops[segment + 1]
+            k += 1
+
+    while k <= last:
+        yield stops[-1]
+        k += 1
+
+
+def gradient(stops, step_count, positions=None, space='rgb', easing=None, inclusive=True):
+    """
+    Compute the colors of a gradient.
+
+    :param stops: Two or more colors (RGB 3-tuples or Colors) defining the gradient.
+    :param step_count: The number of steps between the first and last stop.
+    :param positions: The position of each stop in [0, 1], in increasing order (default evenly spaced).
+    :param space: The color space to interpolate in: 'rgb', 'hsv' (along the shortest hue path) or 'yiq'.
+    :param easing: An easing function name (see colorutils.gradient.easings) or callable (default linear).
+    :param inclusive: Flag determining whether to include the first and last stop (default True)
+    :return: List of RGB values.
+    :rtype: list
+    """
+    return list(iter_gradient(stops, step_count, positions, space, easing, inclusive))
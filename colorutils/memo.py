@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Memoized parsing of HEX and WEB color strings.
+
+Stylesheets and other text sources spell the same few colors over and over. With memoization enabled, hex_to_rgb,
+hex_to_yiq, hex_to_hsv, web_to_rgb, web_to_yiq and web_to_hsv (and everything built on them, such as Color(hex=...)
+and the bulk conversions) parse each distinct color once, through a bounded, thread-safe LRU cache. Equivalent
+spellings share a cache entry: '#FFF', 'fff' and '#ffffff' are the same color, as are 'White' and 'white'.
+
+Memoization is opt-in:
+
+    >>> from colorutils import memo
+    >>> memo.enable(size=8192)
+    >>> memo.info()
+    {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0, 'maxsize': 8192}
+"""
+from __future__ import division
+from functools import lru_cache
+
+from . import convert
+from .exceptions import ColorException
+
+
+def enable(size=4096):
+    """
+    Memoize the parsing of HEX and WEB values. Enabling memoization again replaces the cache (and its statistics).
+
+    :param size: The maximum number of cached values, or None for no bound (default 4096).
+    """
+    if size is not None and size < 1:
+        raise ColorException('Cache size must be positive, got {}'.format(size))
+    convert._memo = lru_cache(maxsize=size)(convert._parse)
+
+
+def disable():
+    """ Stop memoizing the parsing of HEX and WEB values, dropping the cached values. """
+    convert._memo = None
+
+
+def enabled():
+    """
+    Get whether the parsing of HEX and WEB values is memoized.
+
+    :rtype: bool
+    """
+    return convert._memo is not None
+
+
+def clear():
+    """ Clear the cached values and statistics. """
+    memo = convert._memo
+    if memo is not None:
+        memo.cache_clear()
+
+
+def info():
+    """
+    Get the cache statistics.
+
+    :return: A dictionary with the number of cache hits and misses, the hit rate, and the number of cached values and
+             the maximum (all 0 while memoization is disabled).
+    :rtype: dict
+    """
+    memo = convert._memo
+    if memo is None:
+        return {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0, 'maxsize': 0}
+
+    hits, misses, maxsize, size = memo.cache_info()
+    return {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'size': size, 'maxsize': maxsize}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Nearest-color lookup using a k-d tree over 3-component color points.
+"""
+from . import static
+from .exceptions import ColorException
+
+
+# -----------------------------------------------
+# Distance Metrics
+# ...............................................
+#
+# Each metric is defined by per-axis weights and
+# the power of its Minkowski distance (None for
+# the Chebyshev / maximum distance). The weighted
+# metric is the common (2, 4, 3) weighted RGB
+# approximation of perceived difference.
+# -----------------------------------------------
+metrics = {
+    'euclidean': ((1, 1, 1), 2),
+    'manhattan': ((1, 1, 1), 1),
+    'chebyshev': ((1, 1, 1), None),
+    'weighted': ((2, 4, 3), 2),
+}
+
+
+class KDTree(object):
+    """
+    KDTree is a static 3-dimensional k-d tree which answers nearest-neighbor queries over a fixed set of points,
+    under one of the distance metrics defined in `colorutils.nearest.metrics`.
+
+    Queries return the index of the nearest point, in the order the points were given, and its distance to the query.
+    """
+    def __init__(self, points, metric='euclidean'):
+        """ Initialization """
+        if metric not in metrics:
+            raise ColorException('Unknown distance metric: {}'.format(metric))
+
+        self.points = [tuple(p) for p in points]
+        self.metric = metric
+        self._weights, self._power = metrics[metric]
+        self._root = self._build(list(range(len(self.points))), 0)
+
+    def __len__(self):
+        return len(self.points)
+
+    def _build(self, indices, depth):
+        """ Recursively build the tree, splitting at the median along the axis for this depth. """
+        if not indices:
+            return None
+
+        axis = depth % 3
+        indices.sort(key=lambda i: self.points[i][axis])
+        mid = len(indices) // 2
+        return (indices[mid], axis,
+                self._build(indices[:mid], depth + 1),
+                self._build(indices[mid + 1:], depth + 1))
+
+    def _distance(self, a, b):
+        """ The metric distance between two points, without the final root for Minkowski metrics. """
+        w = self._weights
+        if self._power is None:
+            return max(w[0] * abs(a[0] - b[0]), w[1] * abs(a[1] - b[1]), w[2] * abs(a[2] - b[2]))
+        if self._power == 1:
+            return w[0] * abs(a[0] - b[0]) + w[1] * abs(a[1] - b[1]) + w[2] * abs(a[2] - b[2])
+        return w[0] * (a[0] - b[0]) ** 2 + w[1] * (a[1] - b[1]) ** 2 + w[2] * (a[2] - b[2]) ** 2
+
+    def nearest(self, point):
+        """
+        Find the point in the tree nearest to the given point.
+
+        :param point: A 3-component point, in the same space as the tree points.
+        :return: The index of the nearest point and its distance to the given point.
+        :rtype: tuple
+        """
+        if self._root is None:
+            raise ColorException('Cannot query an empty KDTree')
+
+        points = self.points
+        weights, power = self._weights, self._power
+        w0, w1, w2 = weights
+        p0, p1, p2 = point[0], point[1], point[2]
+
+        # Nodes are visited depth first, nearer side first, and skipped once they are known to be no nearer than
+        # the best point so far (ties are still visited, so the lowest index wins)
+        best, best_d = -1, float('inf')
+        stack = [(self._root, 0)]
+        while stack:
+            node, bound = stack.pop()
+            if bound > best_d:
+                continue
+
+            index, axis, left, right = node
+            q = points[index]
+            d0, d1, d2 = p0 - q[0], p1 - q[1], p2 - q[2]
+            if power == 2:
+                d = w0 * d0 * d0 + w1 * d1 * d1 + w2 * d2 * d2
+            elif power == 1:
+                d = w0 * abs(d0) + w1 * abs(d1) + w2 * abs(d2)
+            else:
+                d = max(w0 * abs(d0), w1 * abs(d1), w2 * abs(d2))
+            if d < best_d or (d == best_d and index < best):
+                best, best_d = index, d
+
+            diff = point[axis] - q[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            if far is not None:
+                stack.append((far, weights[axis] * diff * diff if power == 2 else weights[axis] * abs(diff)))
+            if near is not None:
+                stack.append((near, 0))
+
+        return best, best_d ** 0.5 if self._power == 2 else best_d
+
+    def nearest_many(self, points):
+        """
+        Find the nearest tree point for each of the given points. Each distinct point is only queried once.
+
+        :param points: An iterable of 3-component points.
+        :return: A list of (index, distance) tuples.
+        :rtype: list
+        """
+        memo = {}
+        results = []
+        for p in points:
+            p = tuple(p)
+            if p not in memo:
+                memo[p] = self.nearest(p)
+            results.append(memo[p])
+        return results
+
+
+# -----------------------------------------------
+# Nearest WEB Colors
+# -----------------------------------------------
+
+_web_trees = {}
+
+
+def _web_tree(metric):
+    """ Get the k-d tree over the named web colors for the given metric, building it on first use. """
+    try:
+        return _web_trees[metric]
+    except KeyError:
+        tree = _web_trees[metric] = KDTree([k for k in static.web_colors if isinstance(k, tuple)], metric)
+        return tree
+
+
+def nearest_web(rgb, metric='euclidean'):
+    """
+    Find the name of the named web color nearest to an RGB color.
+
+    :param rgb: A tuple of three numeric values corresponding to the red, green, and blue value.
+    :param metric: The distance metric to use (one of `colorutils.nearest.metrics`).
+    :return: The WEB color name nearest to the RGB value.
+    :rtype: str
+    """
+    tree = _web_tree(metric)
+    return static.web_colors[tree.points[tree.nearest(rgb)[0]]]
+
+
+def nearest_web_many(rgbs, metric='euclidean'):
+    """
+    Find the names of the named web colors nearest to each of a collection of RGB colors.
+
+    :param rgbs: An iterable of RGB 3-tuples.
+    :param metric: The distance metric to use (one of `colorutils.nearest.metrics`).
+    :return: The WEB color names nearest to the RGB values.
+    :rtype: list
+    """
+    tree = _web_tree(metric)
+    return [static.web_colors[tree.points[i]] for i, _ in tree.nearest_many(rgbs)]
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pre-defined color palettes.
+
+Each palette module defines its colors as (name, rgb) pairs and builds the named Colors, and the `all` list of them,
+on first access. Any collection of colors, including the palette modules, can be made into a Palette for nearest-color
+matching.
+"""
+import math
+
+from colorutils import Color, ColorArray, convert
+from colorutils.exceptions import ColorException
+
+
+def _lazy_palette(namespace, colors):
+    """
+    Create the module `__getattr__` and `__dir__` functions of a palette module.
+
+    :param namespace: The globals() of the palette module, where built Colors are stored.
+    :param colors: The (name, rgb) pairs of the palette, in palette order.
+    :return: The module `__getattr__` and `__dir__` functions.
+    :rtype: tuple
+    """
+    values = dict(colors)
+
+    def get(name):
+        return namespace[name] if name in namespace else __getattr__(name)
+
+    def __getattr__(name):
+        if name == 'all':
+            value = [get(n) for n, _ in colors]
+        elif name in values:
+            value = Color(values[name])
+        else:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(namespace['__name__'], name))
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(values) | {'all'})
+
+    return __getattr__, __dir__
+
+
+# -----------------------------------------------
+# Palette Indexes
+# ...............................................
+#
+# Each index space maps an RGB color to the
+# point it is indexed by. HSV colors are mapped
+# onto the HSV cone, so that hue wraps around and
+# is meaningless for unsaturated and dark colors.
+# -----------------------------------------------
+def _hsv_cone(hsv):
+    h, s, v = hsv
+    h = math.radians(h)
+    return s * v * math.cos(h), s * v * math.sin(h), v
+
+
+spaces = {
+    'rgb': (tuple, lambda rgbs: rgbs),
+    'yiq': (convert.rgb_to_yiq, convert.rgb_to_yiq_many),
+    'hsv': (lambda rgb: _hsv_cone(convert.rgb_to_hsv(rgb)),
+            lambda rgbs: [_hsv_cone(hsv) for hsv in convert.rgb_to_hsv_many(rgbs)]),
+    'lab': (convert.rgb_to_lab, convert.rgb_to_lab_many),
+}
+
+
+class Palette(object):
+    """
+    Palette is a fixed collection of colors which can be matched against: the nearest palette color to any color is
+    found with a k-d tree index over the palette, built in the requested color space (and distance metric) on first
+    use and kept for later queries.
+
+    The palette colors are available by position, and by name if the palette was given names.
+    """
+    def __init__(self, colors, names=None):
+        """ Initialization """
+        self.colors = [c if isinstance(c, Color) else Color(c) for c in colors]
+        self.names = list(names) if names is not None else None
+        if self.names is not None and len(self.names) != len(self.colors):
+            raise ColorException('A palette requires one name per color')
+        self._indexes = {}
+
+    @classmethod
+    def from_module(cls, module):
+        """
+        Create a palette from one of the colorutils.palettes modules, or any module with named Colors and an `all`
+        list of them.
+
+        :param module: The palette module.
+        :return: The palette, with the module's color names.
+        :rtype: Palette
+        """
+        names = [n for n in getattr(module, '__all__', dir(module)) if n != 'all' and not n.startswith('_')]
+        names = [n for n in names if isinstance(getattr(module, n), Color)]
+        by_id = dict((id(getattr(module, n)), n) for n in names)
+        colors = module.all
+        return cls(colors, [by_id.get(id(c)) for c in colors])
+
+    def __len__(self):
+        return len(self.colors)
+
+    def __iter__(self):
+        return iter(self.colors)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if self.names is None or key not in self.names:
+                raise KeyError(key)
+            return self.colors[self.names.index(key)]
+        return self.colors[key]
+
+    def __repr__(self):
+        return '<Palette ({} colors)>'.format(len(self.colors))
+
+    def index(self, space='rgb', metric='euclidean'):
+        """
+        Get the index of the palette in a color space, building it on first use.
+
+        :param space: The color space, one of colorutils.palettes.spaces (default 'rgb').
+        :param metric: The distance metric, one of colorutils.nearest.metrics (default 'euclidean').
+        :return: The k-d tree over the palette colors.
+        :rtype: colorutils.nearest.KDTree
+        """
+        key = (space, metric)
+        tree = self._indexes.get(key)
+        if tree is None:
+            from colorutils.nearest import KDTree
+
+            if space not in spaces:
+                raise ColorException('Unknown palette index space: {}'.format(space))
+            if not self.colors:
+                raise ColorException('Cannot match colors against an empty palette')
+            tree = self._indexes[key] = KDTree(spaces[space][1]([c.rgb for c in self.colors]), metric)
+        return tree
+
+    def nearest_index(self, color, space='rgb', metric='euclidean'):
+        """
+        Find the position of the palette color nearest to a color.
+
+        :param color: A Color, PackedColor or RGB 3-tuple.
+        :param space: The color space to compare colors in, one of colorutils.palettes.spaces (default 'rgb').
+        :param metric: The distance metric, one of colorutils.nearest.metrics (default 'euclidean').
+        :return: The position of the nearest palette color.
+        :rtype: int
+        """
+        tree = self.index(space, metric)
+        return tree.nearest(spaces[space][0](getattr(color, 'rgb', color)))[0]
+
+    def nearest(self, color, space='rgb', metric='euclidean'):
+        """
+        Find the palette color nearest to a color.
+
+        :param color: A Color, PackedColor or RGB 3-tuple.
+        :param space: The color space to compare colors in, one of colorutils.palettes.spaces (default 'rgb').
+        :param metric: The distance metric, one of colorutils.nearest.metrics (default 'euclidean').
+        :return: The nearest palette color.
+        :rtype: Color
+        """
+        return self.colors[self.nearest_index(color, space, metric)]
+
+    def nearest_indices(self, colors, space='rgb', metric='euclidean'):
+        """
+        Find the position of the nearest palette color for each of a collection of colors. Each distinct color is
+        only converted and queried once.
+
+        :param colors: A ColorArray, a bytes-like object of packed RGB triples, or an iterable of colors.
+        :param space: The color space to compare colors in, one of colorutils.palettes.spaces (default 'rgb').
+        :param metric: The distance metric, one of colorutils.nearest.metrics (default 'euclidean').
+        :return: The positions of the nearest palette colors.
+        :rtype: list
+        """
+        tree = self.index(space, metric)
+        if isinstance(colors, (bytes, bytearray, memoryview)):
+            colors = ColorArray(colors)
+        rgbs = colors.rgb if isinstance(colors, ColorArray) else [getattr(c, 'rgb', c) for c in colors]
+        return [i for i, _ in tree.nearest_many(spaces[space][1](rgbs))]
+
+    def nearest_many(self, colors, space='rgb', metric='euclidean'):
+        """
+        Map each of a collection of colors onto the nearest palette color.
+
+        :param colors: A ColorArray, a bytes-like object of packed RGB triples, or an iterable of colors.
+        :param space: The color space to compare colors in, one of colorutils.palettes.spaces (default 'rgb').
+        :param metric: The distance metric, one of colorutils.nearest.metrics (default 'euclidean').
+        :return: The nearest palette color of each color.
+        :rtype: ColorArray
+        """
+        rgbs = [c.rgb for c in self.colors]
+        return ColorArray([rgbs[i] for i in self.nearest_indices(colors, space, metric)])
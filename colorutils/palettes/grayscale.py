@@ -3,37 +3,37 @@
 """
 Grayscale Color Palette
 """
-from colorutils import Color
+from . import _lazy_palette
 
-black = Color((0, 0, 0))
-dark_gray12 = Color((10, 10, 10))
-dark_gray11 = Color((20, 20, 20))
-dark_gray10 = Color((30, 30, 30))
-dark_gray9 = Color((40, 40, 40))
-dark_gray8 = Color((50, 50, 50))
-dark_gray7 = Color((60, 60, 60))
-dark_gray6 = Color((70, 70, 70))
-dark_gray5 = Color((80, 80, 80))
-dark_gray4 = Color((90, 90, 90))
-dark_gray3 = Color((100, 100, 100))
-dark_gray2 = Color((110, 110, 110))
-dark_gray1 = Color((120, 120, 120))
-gray = Color((130, 130, 130))
-light_gray1 = Color((140, 140, 140))
-light_gray2 = Color((150, 150, 150))
-light_gray3 = Color((160, 160, 160))
-light_gray4 = Color((170, 170, 170))
-light_gray5 = Color((180, 180, 180))
-light_gray6 = Color((190, 190, 190))
-light_gray7 = Color((200, 200, 200))
-light_gray8 = Color((210, 210, 210))
-light_gray9 = Color((220, 220, 220))
-light_gray10 = Color((230, 230, 230))
-light_gray11 = Color((240, 240, 240))
-light_gray12 = Color((250, 250, 250))
-white = Color((255, 255, 255))
+_colors = (
+    ('black', (0, 0, 0)),
+    ('dark_gray12', (10, 10, 10)),
+    ('dark_gray11', (20, 20, 20)),
+    ('dark_gray10', (30, 30, 30)),
+    ('dark_gray9', (40, 40, 40)),
+    ('dark_gray8', (50, 50, 50)),
+    ('dark_gray7', (60, 60, 60)),
+    ('dark_gray6', (70, 70, 70)),
+    ('dark_gray5', (80, 80, 80)),
+    ('dark_gray4', (90, 90, 90)),
+    ('dark_gray3', (100, 100, 100)),
+    ('dark_gray2', (110, 110, 110)),
+    ('dark_gray1', (120, 120, 120)),
+    ('gray', (130, 130, 130)),
+    ('light_gray1', (140, 140, 140)),
+    ('light_gray2', (150, 150, 150)),
+    ('light_gray3', (160, 160, 160)),
+    ('light_gray4', (170, 170, 170)),
+    ('light_gray5', (180, 180, 180)),
+    ('light_gray6', (190, 190, 190)),
+    ('light_gray7', (200, 200, 200)),
+    ('light_gray8', (210, 210, 210)),
+    ('light_gray9', (220, 220, 220)),
+    ('light_gray10', (230, 230, 230)),
+    ('light_gray11', (240, 240, 240)),
+    ('light_gray12', (250, 250, 250)),
+    ('white', (255, 255, 255)),
+)
 
-all = [black, dark_gray12, dark_gray11, dark_gray10, dark_gray9, dark_gray8, dark_gray7, dark_gray6, dark_gray5,
-       dark_gray4, dark_gray3, dark_gray2, dark_gray1, gray, light_gray1, light_gray2, light_gray3, light_gray4,
-       light_gray5, light_gray6, light_gray7, light_gray8, light_gray9, light_gray10, light_gray11, light_gray12,
-       white]
+__all__ = [_name for _name, _ in _colors] + ['all']
+__getattr__, __dir__ = _lazy_palette(globals(), _colors)
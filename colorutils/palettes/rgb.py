@@ -3,10 +3,13 @@
 """
 RGB Color Palette
 """
-from colorutils import Color
+from . import _lazy_palette
 
-red = Color((255, 0, 0))
-green = Color((0, 255, 0))
-blue = Color((0, 0, 255))
+_colors = (
+    ('red', (255, 0, 0)),
+    ('green', (0, 255, 0)),
+    ('blue', (0, 0, 255)),
+)
 
-all = [red, green, blue]
\ No newline at end of file
+__all__ = [_name for _name, _ in _colors] + ['all']
+__getattr__, __dir__ = _lazy_palette(globals(), _colors)
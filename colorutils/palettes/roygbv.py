@@ -3,13 +3,16 @@
 """
 ROYGBV Color Palette
 """
-from colorutils import Color
+from . import _lazy_palette
 
-red = Color((255, 0, 0))
-orange = Color((255, 165, 0))
-yellow = Color((255, 255, 0))
-green = Color((0, 255, 0))
-blue = Color((0, 0, 255))
-violet = Color((238, 130, 238))
+_colors = (
+    ('red', (255, 0, 0)),
+    ('orange', (255, 165, 0)),
+    ('yellow', (255, 255, 0)),
+    ('green', (0, 255, 0)),
+    ('blue', (0, 0, 255)),
+    ('violet', (238, 130, 238)),
+)
 
-all = [red, orange, yellow, green, blue, violet]
+__all__ = [_name for _name, _ in _colors] + ['all']
+__getattr__, __dir__ = _lazy_palette(globals(), _colors)
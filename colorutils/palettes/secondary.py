@@ -3,10 +3,13 @@
 """
 Secondary Color Palette
 """
-from colorutils import Color
+from . import _lazy_palette
 
-green = Color((0, 255, 0))
-purple = Color((128, 0, 128))
-orange = Color((255, 165, 0))
+_colors = (
+    ('green', (0, 255, 0)),
+    ('purple', (128, 0, 128)),
+    ('orange', (255, 165, 0)),
+)
 
-all = [green, purple, orange]
\ No newline at end of file
+__all__ = [_name for _name, _ in _colors] + ['all']
+__getattr__, __dir__ = _lazy_palette(globals(), _colors)
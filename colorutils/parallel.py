@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Multi-process bulk conversion.
+
+Large collections of colors are converted by sharding them across a pool of worker processes, each running the bulk
+conversion functions of colorutils.convert on its shards. The colors and the results are exchanged through
+multiprocessing.shared_memory blocks rather than pickled: the input is written to shared memory once, each worker
+reads its shards directly from it and writes its results into place in a shared output block, and only the shard
+bounds are sent to the workers.
+
+    >>> from colorutils.parallel import ParallelConverter
+    >>> with ParallelConverter(workers=8) as converter:
+    ...     hsvs = converter.convert(pixels, 'rgb', 'hsv')
+
+The results are equal to those of the corresponding `_many` function, down to the types of their components:
+numeric colors are exchanged as doubles, along with a flag for each component which is an integer (e.g. the hue and
+saturation of black, (0, 0, 0.0)). Collections no larger than one chunk are converted in-process.
+"""
+from __future__ import division
+import array
+import itertools
+import operator
+import os
+
+from . import convert, static
+from .exceptions import ColorException
+
+
+string_formats = ('hex', 'web')
+
+# Conversions whose (3-component) results are integers rather than floats
+_integer_results = (('hex', 'rgb'), ('web', 'rgb'))
+
+
+def _string_width(values):
+    """ The record width needed to store a collection of strings as fixed-width ASCII. """
+    return max(len(v) for v in values) if values else 1
+
+
+def _web_width():
+    """ The record width needed for WEB values: the longest color name, or a 7-char HEX value. """
+    return max([7] + [len(v) for k, v in static.web_colors.items() if isinstance(k, tuple)])
+
+
+def _encode_strings(values, width):
+    return b''.join(v.encode('ascii').ljust(width, b'\0') for v in values)
+
+
+def _decode_strings(data, width):
+    return [data[i:i + width].rstrip(b'\0').decode('ascii') for i in range(0, len(data), width)]
+
+
+def _integer_flags(flat):
+    """ A byte for each of a list of numbers: 1 for an integer, 0 for a float. """
+    return bytes(map(operator.is_, map(type, flat), itertools.repeat(int)))
+
+
+def _encode_numbers(values):
+    """ Pack a collection of numeric colors as doubles, followed by the integer flags of their components. """
+    flat = list(itertools.chain.from_iterable(values))
+    return array.array('d', flat).tobytes() + _integer_flags(flat)
+
+
+def _decode_numbers(doubles, flags):
+    """ Unpack the doubles of numeric colors as 3-tuples, restoring the components flagged as integers. """
+    flat = doubles.tolist()
+    i = flags.find(1)
+    while i >= 0:
+        flat[i] = int(flat[i])
+        i = flags.find(1, i + 1)
+    flat = iter(flat)
+    return list(zip(flat, flat, flat))
+
+
+def _attach(name):
+    """ Attach to a shared memory block created by another process, without taking ownership of it. """
+    from multiprocessing import shared_memory
+
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Before Python 3.13, attaching always registers the block with the resource tracker. Pool workers share the
+        # tracker of the process that created the block, so this repeats its registration, and is undone when the
+        # creator unlinks the block.
+        return shared_memory.SharedMemory(name)
+
+
+# -----------------------------------------------
+# Workers
+# -----------------------------------------------
+
+
+def _convert_shard(task):
+    """ Worker process entry point: convert the colors in [start, stop) of the shared input into the shared output. """
+    name, kwargs, layout, start, stop = task
+    source, target, n, in_name, in_width, out_name, out_width, out_code = layout
+
+    # The blocks are attached for this shard only, so that idle workers do not keep a finished job's memory mapped
+    src_block, out_block = _attach(in_name), _attach(out_name)
+    try:
+        src, out = src_block.buf, out_block.buf
+        if in_width == 'packed':
+            values = bytes(src[start * 3:stop * 3])
+        elif in_width == 'numeric':
+            # The integer flags follow the 3 * n doubles
+            flags = bytes(src[n * 24 + start * 3:n * 24 + stop * 3])
+            values = _decode_numbers(src[:n * 24].cast('d')[start * 3:stop * 3], flags)
+        else:
+            values = _decode_strings(bytes(src[start * in_width:stop * in_width]), in_width)
+
+        results = getattr(convert, name)(values, **kwargs)
+
+        if out_code is None:
+            out[start * out_width:stop * out_width] = _encode_strings(results, out_width)
+        elif out_code == 'd':
+            flat = list(itertools.chain.from_iterable(results))
+            out[:n * 24].cast('d')[start * 3:stop * 3] = array.array('d', flat)
+            out[n * 24 + start * 3:n * 24 + stop * 3] = _integer_flags(flat)
+        else:
+            out.cast(out_code)[start * 3:stop * 3] = array.array(out_code, itertools.chain.from_iterable(results))
+    finally:
+        src_block.close()
+        out_block.close()
+    return stop - start
+
+
+# -----------------------------------------------
+# Parallel Conversion
+# -----------------------------------------------
+
+
+class ParallelConverter(object):
+    """
+    ParallelConverter converts large collections of colors across a pool of worker processes. The pool is started
+    on first use and reused for later conversions until the converter is closed (or its `with` block ends).
+    """
+    def __init__(self, workers=None, chunk_size=1 << 16):
+        """
+        Initialization
+
+        :param workers: The number of worker processes (default the number of CPUs).
+        :param chunk_size: The number of colors in each shard sent to a worker (default 65536).
+        """
+        if chunk_size < 1:
+            raise ColorException('Chunk size must be at least 1')
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """ Stop the worker processes. """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def convert(self, values, source, target, **kwargs):
+        """
+        Convert a collection of colors between formats.
+
+        :param values: The colors to convert: a ColorArray or bytes-like object of packed RGB triples (from 'rgb'),
+                       or a sequence of color values of the source format.
+        :param source: The color format to convert from: 'rgb', 'hex', 'web', 'yiq' or 'hsv'.
+        :param target: The color format to convert to, e.g. 'hsv' or 'lab'.
+        :param kwargs: Further arguments of the bulk conversion function (e.g. `nearest` for conversions to WEB).
+        :return: The converted values, in order.
+        :rtype: list
+        """
+        name = '{}_to_{}_many'.format(source, target)
+        fn = getattr(convert, name, None)
+        if fn is None:
+            raise ColorException('Cannot convert from {} to {}'.format(source, target))
+
+        packed = getattr(values, '_buffer', values)
+        if isinstance(packed, (bytes, bytearray, memoryview)):
+            if source != 'rgb':
+                raise ColorException('Packed color buffers can only be converted from rgb')
+            values = packed
+            n = len(packed) // 3
+        else:
+            values = values if isinstance(values, (list, tuple)) else list(values)
+            n = len(values)
+
+        if self.workers <= 1 or n <= self.chunk_size:
+            return fn(values, **kwargs)
+        return self._convert(name, kwargs, values, n, source, target)
+
+    def _convert(self, name, kwargs, values, n, source, target):
+        """ Convert across the worker pool, through shared memory. """
+        from multiprocessing import shared_memory
+
+        if isinstance(values, (bytes, bytearray, memoryview)):
+            in_width, data = 'packed', values
+        elif source in string_formats:
+            in_width = _string_width(values)
+            data = _encode_strings(values, in_width)
+        else:
+            in_width, data = 'numeric', _encode_numbers(values)
+
+        if target in string_formats:
+            out_code = None
+            out_width = 7 if target == 'hex' else _web_width()
+            if source in string_formats:
+                # Unrecognized strings are passed through unchanged
+                out_width = max(out_width, in_width)
+            out_size = n * out_width
+        else:
+            out_code = 'q' if (source, target) in _integer_results else 'd'
+            out_width = 3
+            # Doubles are followed by the integer flags of the components
+            out_size = n * (27 if out_code == 'd' else 24)
+
+        # The pool is started before the blocks are created, so that forked workers do not inherit their mappings
+        if self._pool is None:
+            import multiprocessing
+            self._pool = multiprocessing.Pool(self.workers)
+
+        src = shared_memory.SharedMemory(create=True, size=max(1, len(data) * getattr(data, 'itemsize', 1)))
+        out = shared_memory.SharedMemory(create=True, size=max(1, out_size))
+        try:
+            view = memoryview(data).cast('B')
+            src.buf[:len(view)] = view
+            view.release()
+
+            layout = (source, target, n, src.name, in_width, out.name, out_width, out_code)
+            tasks = [(name, kwargs, layout, start, min(start + self.chunk_size, n))
+                     for start in range(0, n, self.chunk_size)]
+            for _ in self._pool.imap_unordered(_convert_shard, tasks):
+                pass
+
+            if out_code is None:
+                return _decode_strings(bytes(out.buf[:out_size]), out_width)
+            if out_code == 'd':
+                return _decode_numbers(out.buf[:n * 24].cast('d'), bytes(out.buf[n * 24:n * 27]))
+            flat = iter(out.buf[:out_size].cast(out_code).tolist())
+            return list(zip(flat, flat, flat))
+        finally:
+            src.close()
+            src.unlink()
+            out.close()
+            out.unlink()
+
+
+def convert_many(values, source, target, workers=None, chunk_size=1 << 16, **kwargs):
+    """
+    Convert a collection of colors between formats across a pool of worker processes, started for this conversion.
+    To run several conversions on the same pool, use a ParallelConverter.
+
+    :param values: The colors to convert: a ColorArray or bytes-like object of packed RGB triples (from 'rgb'), or a
+                   sequence of color values of the source format.
+    :param source: The color format to convert from: 'rgb', 'hex', 'web', 'yiq' or 'hsv'.
+    :param target: The color format to convert to, e.g. 'hsv' or 'lab'.
+    :param workers: The number of worker processes (default the number of CPUs).
+    :param chunk_size: The number of colors in each shard sent to a worker (default 65536).
+    :param kwargs: Further arguments of the bulk conversion function (e.g. `nearest` for conversions to WEB).
+    :return: The converted values, in order.
+    :rtype: list
+    """
+    with ParallelConverter(workers, chunk_size) as converter:
+        return converter.convert(values, source, target, **kwargs)
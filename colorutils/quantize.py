@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Palette extraction (color quantization) from pixel buffers.
+
+Pixels may be given as a ColorArray, a bytes-like object of packed 8-bit RGB triples, or an iterable of RGB 3-tuples.
+Rather than working on every pixel, the quantizers reduce the input to a weighted color histogram: large inputs are
+first subsampled to at most `sample_size` pixels, and colors are binned by their top `bits` bits per channel, with
+each bin represented by the mean color of its pixels. Both quantizers return the palette as a ColorArray along with
+the fraction of (sampled) pixels each palette color represents, ordered from most to least common.
+"""
+from __future__ import division
+import bisect
+import itertools
+import random
+import sys
+from array import array
+from collections import Counter
+
+from .colorutils import Color, ColorArray
+from .exceptions import ColorException
+from .nearest import KDTree
+
+
+def _packed_pixels(pixels, sample_size):
+    """ Get the pixels as a packed RGB buffer, subsampled with a uniform stride to at most sample_size pixels. """
+    if isinstance(pixels, ColorArray):
+        packed = pixels._buffer
+    elif isinstance(pixels, (bytes, bytearray, memoryview)):
+        packed = bytearray(pixels)
+    else:
+        packed = ColorArray(pixels)._buffer
+
+    n = len(packed) // 3
+    if sample_size and n > sample_size:
+        stride = -(-n // sample_size)
+        sampled = bytearray(3 * (-(-n // stride)))
+        for c in range(3):
+            sampled[c::3] = packed[c::3 * stride]
+        packed = sampled
+    return packed
+
+
+def histogram(pixels, bits=5, sample_size=1 << 18):
+    """
+    Build a weighted color histogram of pixels.
+
+    :param pixels: A ColorArray, packed RGB buffer, or iterable of RGB 3-tuples.
+    :param bits: Number of significant bits per channel used to bin colors (default 5, 8 disables binning).
+    :param sample_size: Maximum number of pixels to sample (default 262144, None to use every pixel).
+    :return: A list of (rgb, count) pairs, where rgb is the mean color of the pixels in the bin.
+    :rtype: list
+    """
+    if not isinstance(bits, int) or not 1 <= bits <= 8:
+        raise ColorException('Bits per channel must be an integer from 1 to 8, got {!r}'.format(bits))
+
+    packed = _packed_pixels(pixels, sample_size)
+    n = len(packed) // 3
+
+    # Widen each RGB triple to a native 32-bit word so the pixels can be counted as integers
+    words = bytearray(4 * n)
+    for c in range(3):
+        words[c::4] = packed[c::3]
+    words = array('I', bytes(words))
+    if sys.byteorder == 'big':
+        words.byteswap()
+    counts = Counter(words)
+
+    shift = 8 - bits
+    mask = ((0xff >> shift) << shift) * 0x010101
+    bins = {}
+    for value, count in counts.items():
+        key = value & mask
+        r, g, b = value & 0xff, (value >> 8) & 0xff, value >> 16
+        acc = bins.get(key)
+        if acc is None:
+            bins[key] = [r * count, g * count, b * count, count]
+        else:
+            acc[0] += r * count
+            acc[1] += g * count
+            acc[2] += b * count
+            acc[3] += count
+
+    return [((r / n, g / n, b / n), n) for r, g, b, n in bins.values()]
+
+
+def _result(centers, weights):
+    """ Build the (palette, weights) result, ordered by decreasing weight and dropping empty clusters. """
+    total = sum(weights)
+    ranked = sorted((w, c) for c, w in zip(centers, weights) if w > 0)[::-1]
+    return ColorArray([c for _, c in ranked]), [w / total for w, _ in ranked]
+
+
+# -----------------------------------------------
+# Median Cut
+# -----------------------------------------------
+
+
+def _split_index(box, axis):
+    """
+    Find where to split a box of (rgb, count) pairs, sorted along the axis, into two non-empty boxes. The split is
+    the one which minimizes the total weighted squared deviation along the axis; for a unimodal box this is the
+    weighted median, but unlike a plain median it does not split a dense cluster when the box holds several.
+    """
+    total_w = sum(c[1] for c in box)
+    total_s = sum(c[0][axis] * c[1] for c in box)
+    total_q = sum(c[0][axis] ** 2 * c[1] for c in box)
+
+    best, best_cost = 1, None
+    w = s = q = 0
+    for i in range(1, len(box)):
+        (x, count) = box[i - 1][0][axis], box[i - 1][1]
+        w += count
+        s += x * count
+        q += x * x * count
+        rw, rs, rq = total_w - w, total_s - s, total_q - q
+        cost = (q - s * s / w) + (rq - rs * rs / rw)
+        if best_cost is None or cost < best_cost:
+            best, best_cost = i, cost
+    return best
+
+
+def median_cut(pixels, n, bits=5, sample_size=1 << 18):
+    """
+    Extract a palette of up to n colors using the median cut algorithm. The box with the largest population-weighted
+    channel range is repeatedly split along that channel, at the point which minimizes the squared deviation of the
+    two halves.
+
+    :param pixels: A ColorArray, packed RGB buffer, or iterable of RGB 3-tuples.
+    :param n: The maximum number of palette colors.
+    :param bits: Number of significant bits per channel used to bin colors (default 5).
+    :param sample_size: Maximum number of pixels to sample (default 262144, None to use every pixel).
+    :return: The palette and the fraction of pixels represented by each palette color.
+    :rtype: tuple
+    """
+    if n < 1:
+        raise ColorException('Palette size must be at least 1')
+
+    hist = histogram(pixels, bits, sample_size)
+    if not hist:
+        return ColorArray(), []
+
+    def widest(box):
+        ranges = [max(c[0][i] for c in box) - min(c[0][i] for c in box) for i in range(3)]
+        axis = ranges.index(max(ranges))
+        return ranges[axis] * sum(c[1] for c in box), axis
+
+    boxes = [hist]
+    while len(boxes) < n:
+        scored = [widest(box) if len(box) > 1 else (0, 0) for box in boxes]
+        best = max(range(len(boxes)), key=lambda i: scored[i][0])
+        if scored[best][0] == 0:
+            break
+
+        axis = scored[best][1]
+        box = sorted(boxes.pop(best), key=lambda c: c[0][axis])
+        split = _split_index(box, axis)
+        boxes.extend([box[:split], box[split:]])
+
+    centers, weights = [], []
+    for box in boxes:
+        total = sum(c[1] for c in box)
+        centers.append(tuple(sum(c[0][i] * c[1] for c in box) / total for i in range(3)))
+        weights.append(total)
+    return _result(centers, weights)
+
+
+# -----------------------------------------------
+# K-Means
+# -----------------------------------------------
+
+
+def _sq_dist(a, b):
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def _assign(points, centers):
+    """ Index of the nearest center for each point. """
+    labels = []
+    for r, g, b in points:
+        best, best_d = 0, None
+        for j, (cr, cg, cb) in enumerate(centers):
+            d = (r - cr) * (r - cr) + (g - cg) * (g - cg) + (b - cb) * (b - cb)
+            if best_d is None or d < best_d:
+                best, best_d = j, d
+        labels.append(best)
+    return labels
+
+
+def _sampler(weights, rng):
+    """ Get a function which picks an index at random with probability proportional to its weight. """
+    cumulative = list(itertools.accumulate(weights))
+    total = cumulative[-1]
+    return lambda: min(bisect.bisect_right(cumulative, rng.random() * total), len(cumulative) - 1)
+
+
+def _seed_centers(points, weights, k, rng):
+    """ Choose k initial centers with weighted k-means++ seeding. """
+    centers = [points[_sampler(weights, rng)()]]
+    closest = [_sq_dist(p, centers[0]) for p in points]
+    while len(centers) < k:
+        scores = [w * d for w, d in zip(weights, closest)]
+        if not any(scores):
+            break
+        center = points[_sampler(scores, rng)()]
+        centers.append(center)
+        closest = [min(d, _sq_dist(p, center)) for p, d in zip(points, closest)]
+    return centers
+
+
+def kmeans(pixels, k, max_iter=20, tol=0.5, seed=None, mini_batch=None, bits=4, sample_size=1 << 18):
+    """
+    Extract a palette of up to k colors using k-means clustering with k-means++ seeding, over the weighted color
+    histogram of the pixels.
+
+    :param pixels: A ColorArray, packed RGB buffer, or iterable of RGB 3-tuples.
+    :param k: The maximum number of palette colors.
+    :param max_iter: Maximum number of iterations (default 20).
+    :param tol: Stop once no center moves further than this (default 0.5).
+    :param seed: Seed or random.Random instance for reproducible results (default None).
+    :param mini_batch: If set, update the centers from a weighted random batch of this many histogram colors per
+                       iteration (mini-batch k-means) instead of from every color (default None).
+    :param bits: Number of significant bits per channel used to bin colors (default 4).
+    :param sample_size: Maximum number of pixels to sample (default 262144, None to use every pixel).
+    :return: The palette and the fraction of pixels represented by each palette color.
+    :rtype: tuple
+    """
+    if k < 1:
+        raise ColorException('Palette size must be at least 1')
+
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    hist = histogram(pixels, bits, sample_size)
+    if not hist:
+        return ColorArray(), []
+
+    points = [c for c, _ in hist]
+    weights = [w for _, w in hist]
+    centers = [list(c) for c in _seed_centers(points, weights, k, rng)]
+    seen = [0] * len(centers)
+    sample = _sampler(weights, rng)
+
+    for _ in range(max_iter):
+        if mini_batch:
+            batch = [sample() for _ in range(mini_batch)]
+            moved = 0
+            for i, j in zip(batch, _assign([points[i] for i in batch], centers)):
+                seen[j] += 1
+                rate = 1 / seen[j]
+                before = tuple(centers[j])
+                for c in range(3):
+                    centers[j][c] += rate * (points[i][c] - centers[j][c])
+                moved = max(moved, _sq_dist(before, centers[j]))
+        else:
+            sums = [[0, 0, 0, 0] for _ in centers]
+            for p, w, j in zip(points, weights, _assign(points, centers)):
+                acc = sums[j]
+                acc[0] += p[0] * w
+                acc[1] += p[1] * w
+                acc[2] += p[2] * w
+                acc[3] += w
+            moved = 0
+            for j, acc in enumerate(sums):
+                if acc[3]:
+                    center = [acc[0] / acc[3], acc[1] / acc[3], acc[2] / acc[3]]
+                    moved = max(moved, _sq_dist(center, centers[j]))
+                    centers[j] = center
+        if moved <= tol * tol:
+            break
+
+    totals = [0] * len(centers)
+    for w, j in zip(weights, _assign(points, centers)):
+        totals[j] += w
+    return _result([tuple(c) for c in centers], totals)
+
+
+# -----------------------------------------------
+# Palette Comparison
+# -----------------------------------------------
+
+
+def match_palette(palette, reference, metric='euclidean'):
+    """
+    Map each color of an extracted palette onto the nearest color of a reference palette, e.g. one of the
+    colorutils.palettes modules' `all` lists.
+
+    :param palette: A ColorArray or iterable of colors.
+    :param reference: An iterable of reference colors (Colors or RGB 3-tuples).
+    :param metric: The distance metric, one of colorutils.nearest.metrics (default 'euclidean').
+    :return: The nearest reference Color for each palette color.
+    :rtype: list
+    """
+    reference = [c if isinstance(c, Color) else Color(c) for c in reference]
+    tree = KDTree([c.rgb for c in reference], metric)
+    rgbs = palette.rgb if isinstance(palette, ColorArray) else [Color(c).rgb for c in palette]
+    return [reference[i] for i, _ in tree.nearest_many(rgbs)]
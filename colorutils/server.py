@@ -0,0 +1,440 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A micro-batching color conversion server.
+
+    python -m colorutils serve --port 8765
+
+Clients send conversion requests as JSON lines, over TCP or a Unix socket:
+
+    {"id": 1, "from": "hex", "to": "hsv", "values": ["#2e8b57", "#000000"]}
+
+and receive a JSON line for each request, carrying its id:
+
+    {"id": 1, "result": [[146.452, 0.669, 0.545], [0.0, 0.0, 0.0]]}
+
+A request may also send a single "value", answered with a single "result". Failed requests are answered with an
+"error" message instead, as are request lines longer than the server's line limit (which are skipped). The request {"metrics": true} is answered with the server metrics.
+
+Requests for the same conversion that arrive within the latency window (from all connections) are coalesced into a
+single call of the bulk conversion function, amortizing its per-call overhead. Responses are written as soon as their
+batch completes, so a connection may send further requests without waiting, and receive responses out of order.
+"""
+from __future__ import division
+import asyncio
+import collections
+import json
+import sys
+import time
+
+from . import convert
+from .exceptions import ColorException
+
+
+string_formats = ('hex', 'web')
+default_limit = 2 ** 20
+
+
+def _percentile(ordered, p):
+    """ The nearest-rank percentile of a sorted list. """
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+class Metrics(object):
+    """
+    Metrics collects the batch sizes, queue depth and request latencies of a BatchConverter. Latencies are kept for
+    the most recent `window` requests.
+    """
+    def __init__(self, window=10000):
+        """
+        Initialization
+
+        :param window: The number of recent request latencies to keep (default 10000).
+        """
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.values = 0
+        self.max_batch = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self._latencies = collections.deque(maxlen=window)
+
+    def snapshot(self):
+        """
+        Get the current metrics. Latencies are in milliseconds, from a request being queued to its batch completing.
+
+        :return: The metrics.
+        :rtype: dict
+        """
+        latencies = sorted(self._latencies)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'batches': self.batches,
+            'values': self.values,
+            'mean_batch': round(self.values / self.batches, 3) if self.batches else 0.0,
+            'max_batch': self.max_batch,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'p50_ms': round(_percentile(latencies, 0.50) * 1000, 3),
+            'p99_ms': round(_percentile(latencies, 0.99) * 1000, 3),
+        }
+
+
+# -----------------------------------------------
+# Micro-batching
+# -----------------------------------------------
+
+
+class BatchConverter(object):
+    """
+    BatchConverter coalesces conversion requests into micro-batches. The first request for a conversion opens a batch,
+    which is converted once the latency window has passed, or as soon as it holds `max_batch` values.
+    """
+    def __init__(self, window=0.002, max_batch=4096):
+        """
+        Initialization
+
+        :param window: The longest time (in seconds) a request waits for other requests to join its batch
+                       (default 0.002).
+        :param max_batch: The number of values at which a batch is converted without waiting (default 4096).
+        """
+        if window < 0:
+            raise ColorException('Latency window must not be negative')
+        if max_batch < 1:
+            raise ColorException('Maximum batch size must be at least 1')
+        self.window = window
+        self.max_batch = max_batch
+        self.metrics = Metrics()
+        # Open batches, by conversion: a list of (values, future, queue time) and the timer converting them
+        self._pending = {}
+        self._timers = {}
+
+    def submit(self, values, source, target):
+        """
+        Queue a list of values for conversion.
+
+        :param values: The color values to convert.
+        :param source: The color format to convert from, e.g. 'hex'.
+        :param target: The color format to convert to, e.g. 'hsv'.
+        :return: A future of the converted values.
+        :rtype: asyncio.Future
+        """
+        name = '{}_to_{}_many'.format(source, target)
+        if source == target or not hasattr(convert, name):
+            raise ColorException('Cannot convert from {} to {}'.format(source, target))
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(name, [])
+        batch.append((values, future, time.perf_counter()))
+
+        metrics = self.metrics
+        metrics.requests += 1
+        metrics.queue_depth += len(values)
+        metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+
+        if sum(len(v) for v, _, _ in batch) >= self.max_batch:
+            self._flush(name)
+        elif name not in self._timers:
+            self._timers[name] = loop.call_later(self.window, self._flush, name)
+        return future
+
+    async def convert(self, values, source, target):
+        """
+        Convert a list of values, as part of a batch.
+
+        :param values: The color values to convert.
+        :param source: The color format to convert from, e.g. 'hex'.
+        :param target: The color format to convert to, e.g. 'hsv'.
+        :return: The converted values.
+        :rtype: list
+        """
+        return await self.submit(values, source, target)
+
+    def _flush(self, name):
+        """ Convert the open batch of a conversion, and resolve the futures of its requests. """
+        timer = self._timers.pop(name, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(name, [])
+        if not batch:
+            return
+
+        fn = getattr(convert, name)
+        values = [value for request, _, _ in batch for value in request]
+        try:
+            results = fn(values)
+        except Exception:
+            # Convert the requests separately, to fail only those at fault
+            results = None
+
+        metrics = self.metrics
+        metrics.batches += 1
+        metrics.values += len(values)
+        metrics.max_batch = max(metrics.max_batch, len(values))
+        metrics.queue_depth -= len(values)
+
+        done, offset = time.perf_counter(), 0
+        for request, future, queued in batch:
+            if results is not None:
+                result = results[offset:offset + len(request)]
+                offset += len(request)
+            else:
+                try:
+                    result = fn(request)
+                except Exception as e:
+                    metrics.errors += 1
+                    if not future.done():
+                        future.set_exception(e)
+                    continue
+            metrics._latencies.append(done - queued)
+            if not future.done():
+                future.set_result(result)
+
+
+# -----------------------------------------------
+# Protocol
+# -----------------------------------------------
+
+
+def _values(values, source):
+    """ Parse the JSON values of a request into color values of the source format. """
+    if not isinstance(values, list):
+        raise ColorException('Expected a list of values')
+    if source in string_formats:
+        return values
+    return [tuple(value) for value in values]
+
+
+async def handle_request(converter, request):
+    """
+    Answer a decoded request.
+
+    :param converter: The BatchConverter.
+    :param request: The request, a dict.
+    :return: The response, a dict.
+    :rtype: dict
+    """
+    if not isinstance(request, dict):
+        return {'id': None, 'error': 'Expected a JSON object'}
+    response = {'id': request.get('id')}
+    if request.get('metrics'):
+        response['metrics'] = converter.metrics.snapshot()
+        return response
+
+    source, target = request.get('from'), request.get('to')
+    try:
+        if 'value' in request:
+            result = await converter.submit(_values([request['value']], source), source, target)
+            response['result'] = result[0]
+        else:
+            response['result'] = await converter.submit(_values(request.get('values'), source), source, target)
+    except Exception as e:
+        response['error'] = str(e) or e.__class__.__name__
+    return response
+
+
+async def _respond(converter, writer, line):
+    """ Decode, answer and write the response to a single request line. """
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        response = {'id': None, 'error': 'Invalid JSON: {}'.format(e)}
+    else:
+        response = await handle_request(converter, request)
+    if not writer.is_closing():
+        writer.write(json.dumps(response).encode('utf-8') + b'\n')
+
+
+async def _skip_line(reader):
+    """ Discard the rest of an overlong request line, up to and including its newline. """
+    while True:
+        try:
+            await reader.readuntil(b'\n')
+            return
+        except asyncio.LimitOverrunError as e:
+            await reader.readexactly(e.consumed)
+
+
+async def _readline(reader, writer, limit):
+    """ Read a request line, answering (and skipping) lines over the stream limit. Returns b'' at EOF. """
+    while True:
+        try:
+            return await reader.readuntil(b'\n')
+        except asyncio.IncompleteReadError as e:
+            return e.partial
+        except (asyncio.LimitOverrunError, ValueError):
+            response = {'id': None, 'error': 'Request line exceeds the limit of {} bytes'.format(limit)}
+            writer.write(json.dumps(response).encode('utf-8') + b'\n')
+            await _skip_line(reader)
+
+
+async def handle_connection(converter, reader, writer, limit=default_limit):
+    """ Answer the requests of a connection, each as soon as it is converted. """
+    tasks = set()
+    try:
+        while True:
+            line = await _readline(reader, writer, limit)
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.ensure_future(_respond(converter, writer, line))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            await writer.drain()
+        if tasks:
+            await asyncio.wait(tasks)
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        writer.close()
+
+
+async def start_server(converter, host='127.0.0.1', port=8765, path=None, limit=default_limit):
+    """
+    Start serving conversion requests.
+
+    :param converter: The BatchConverter.
+    :param host: The address to listen on (default 127.0.0.1).
+    :param port: The TCP port to listen on (default 8765; 0 for any free port).
+    :param path: The path of a Unix socket to listen on instead of TCP.
+    :param limit: The longest request line accepted, in bytes (default 1 MiB); longer lines are answered with an
+                  error.
+    :return: The server.
+    :rtype: asyncio.AbstractServer
+    """
+    if limit < 1:
+        raise ColorException('Line limit must be at least 1 byte')
+
+    def handler(reader, writer):
+        return handle_connection(converter, reader, writer, limit)
+
+    if path:
+        return await asyncio.start_unix_server(handler, path, limit=limit)
+    return await asyncio.start_server(handler, host, port, limit=limit)
+
+
+async def _report(converter, interval, stream):
+    """ Write the server metrics to a stream periodically. """
+    while True:
+        await asyncio.sleep(interval)
+        stream.write(json.dumps(converter.metrics.snapshot()) + '\n')
+        stream.flush()
+
+
+async def serve(host='127.0.0.1', port=8765, path=None, window=0.002, max_batch=4096, metrics_interval=0,
+                stream=None, limit=default_limit):
+    """
+    Serve conversion requests until cancelled.
+
+    :param host: The address to listen on (default 127.0.0.1).
+    :param port: The TCP port to listen on (default 8765).
+    :param path: The path of a Unix socket to listen on instead of TCP.
+    :param window: The latency window of the micro-batches, in seconds (default 0.002).
+    :param max_batch: The number of values at which a batch is converted without waiting (default 4096).
+    :param metrics_interval: The interval in seconds between metrics reports (default 0, no reports).
+    :param stream: The stream metrics reports are written to (default stderr).
+    :param limit: The longest request line accepted, in bytes (default 1 MiB).
+    """
+    converter = BatchConverter(window, max_batch)
+    server = await start_server(converter, host, port, path, limit)
+    reporter = None
+    if metrics_interval > 0:
+        reporter = asyncio.ensure_future(_report(converter, metrics_interval, stream or sys.stderr))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if reporter is not None:
+            reporter.cancel()
+
+
+# -----------------------------------------------
+# Client
+# -----------------------------------------------
+
+
+class ConversionClient(object):
+    """
+    ConversionClient is a blocking client of a conversion server, sending one request at a time.
+
+        >>> with ConversionClient(port=8765) as client:
+        ...     client.convert(['#2e8b57'], 'hex', 'hsv')
+        [(146.452, 0.669, 0.545)]
+    """
+    def __init__(self, host='127.0.0.1', port=8765, path=None, timeout=None):
+        """
+        Initialization
+
+        :param host: The address of the server (default 127.0.0.1).
+        :param port: The TCP port of the server (default 8765).
+        :param path: The path of the server's Unix socket, to connect to instead of TCP.
+        :param timeout: The socket timeout, in seconds (default None, blocking).
+        """
+        import socket
+
+        if path:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(path)
+        else:
+            self._socket = socket.create_connection((host, port), timeout)
+        self._file = self._socket.makefile('rwb')
+        self._id = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """ Close the connection. """
+        self._file.close()
+        self._socket.close()
+
+    def _request(self, request):
+        """ Send a request and read its response. """
+        self._id += 1
+        request['id'] = self._id
+        self._file.write(json.dumps(request).encode('utf-8') + b'\n')
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ColorException('Connection closed by the server')
+        response = json.loads(line)
+        if 'error' in response:
+            raise ColorException(response['error'])
+        return response
+
+    def convert(self, values, source, target):
+        """
+        Convert a list of color values.
+
+        :param values: The color values to convert.
+        :param source: The color format to convert from, e.g. 'hex'.
+        :param target: The color format to convert to, e.g. 'hsv'.
+        :return: The converted values; strings for HEX and WEB, tuples otherwise.
+        :rtype: list
+        """
+        results = self._request({'from': source, 'to': target, 'values': list(values)})['result']
+        if target in string_formats:
+            return results
+        return [tuple(result) for result in results]
+
+    def metrics(self):
+        """
+        Get the server metrics.
+
+        :return: The metrics.
+        :rtype: dict
+        """
+        return self._request({'metrics': True})['metrics']
@@ -0,0 +1,393 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Precomputed full-gamut conversion tables.
+
+There are only 2 ** 24 8-bit RGB colors, so the results of a conversion from RGB can be computed once for every color
+and stored in a table, turning each later conversion into an indexed load. Tables are built into files on disk and
+memory-mapped when enabled, so that the pages are loaded on demand and shared between every process using the same
+table file.
+
+The available tables are:
+
+    hsv :: rgb_to_hsv, stored as 1/1000ths (8 bytes per color, 128 MiB)
+    yiq :: rgb_to_yiq, stored as 1/1000ths (6 bytes per color, 96 MiB)
+    web :: the nearest named web color under the euclidean metric, as used by rgb_to_web(..., nearest=True)
+           (1 byte per color, 16 MiB)
+
+Building a complete table takes on the order of a minute, and verifies the stored values against the scalar
+conversions. Tables are opt-in; enabling a table whose file is absent leaves the scalar conversions in place:
+
+    >>> from colorutils import tables
+    >>> tables.build_table('hsv')
+    >>> tables.enable()
+    ['hsv']
+"""
+from __future__ import division
+import array
+import math
+import mmap
+import os
+import struct
+import sys
+
+from . import convert, static
+from .exceptions import ColorException
+
+
+_size = 1 << 24
+_magic = b'CUTABLE1'
+# magic, kind, byte order, number of colors, number of named web colors
+_header = struct.Struct('<8s4s8sII')
+_header_size = 64
+
+# For each table kind, the array type code of each of its planes
+_planes = {
+    'hsv': ('i', 'H', 'H'),
+    'yiq': ('h', 'h', 'h'),
+    'web': ('B',),
+}
+
+kinds = tuple(sorted(_planes))
+
+# Stored in place of -0.0 in the signed 16-bit planes, as the scalar conversions round small negative values to -0.0
+_negative_zero = -32768
+
+
+def table_dir():
+    """
+    Get the default directory for table files: $COLORUTILS_TABLE_DIR, or ~/.cache/colorutils.
+
+    :return: The directory path.
+    :rtype: str
+    """
+    return os.environ.get('COLORUTILS_TABLE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'colorutils')
+
+
+def table_path(kind, directory=None):
+    """
+    Get the path of the file for a table.
+
+    :param kind: The table kind, one of colorutils.tables.kinds.
+    :param directory: The table directory (default colorutils.tables.table_dir()).
+    :return: The file path.
+    :rtype: str
+    """
+    if kind not in _planes:
+        raise ColorException('Unknown conversion table: {}'.format(kind))
+    return os.path.join(directory or table_dir(), 'rgb_to_{}.table'.format(kind))
+
+
+def _web_points():
+    """ The named web colors, in the order of the points of the colorutils.nearest k-d trees. """
+    return [k for k in static.web_colors if isinstance(k, tuple)]
+
+
+# -----------------------------------------------
+# Table Lookup
+# -----------------------------------------------
+
+
+class Table(object):
+    """
+    Table is a memory-mapped conversion table, covering the first `count` 24-bit RGB values (all of them, for a
+    complete table). Use colorutils.tables.load_table to open a table file.
+    """
+    def __init__(self, kind, buf, count, source=None):
+        """ Initialization """
+        self.kind = kind
+        self.count = count
+        self._source = source
+
+        views, offset = [], _header_size
+        for code in _planes[kind]:
+            size = array.array(code).itemsize * count
+            views.append(memoryview(buf)[offset:offset + size].cast(code))
+            offset += -(-size // 8) * 8
+        self._views = views
+
+        if kind == 'web':
+            names = [static.web_colors[p] for p in _web_points()]
+            plane = views[0]
+            self._decode = lambda i: names[plane[i]]
+        elif kind == 'yiq':
+            # Every 16-bit value is decoded through a list, indexed from its end for negative values
+            scale = [n / 1000 for n in range(32768)] + [n / 1000 for n in range(-32768, 0)]
+            scale[_negative_zero] = -0.0
+            p0, p1, p2 = views
+            self._decode = lambda i: (scale[p0[i]], scale[p1[i]], scale[p2[i]])
+        else:
+            # Black decodes as the scalar conversion returns it, with an integer hue and saturation
+            p0, p1, p2 = views
+            self._decode = lambda i: (p0[i] / 1000, p1[i] / 1000, p2[i] / 1000) if i else (0, 0, 0.0)
+
+    def __repr__(self):
+        return '<Table {} ({} colors)>'.format(self.kind, self.count)
+
+    def lookup(self, rgb):
+        """
+        Look up the converted value of an RGB color.
+
+        :param rgb: An RGB 3-tuple.
+        :return: The converted value, or None if the color is not 8-bit or not covered by the table.
+        """
+        try:
+            r, g, b = rgb
+            if 0 <= r < 256 and 0 <= g < 256 and 0 <= b < 256:
+                i = (r << 16) | (g << 8) | b
+                if i < self.count:
+                    return self._decode(i)
+        except (TypeError, ValueError):
+            pass
+        return None
+
+    def lookup_packed(self, packed):
+        """
+        Look up the converted values of a bytes-like object of packed 8-bit RGB triples, or None if the table does
+        not cover every color in it.
+
+        :param packed: A bytes-like object of packed 8-bit RGB triples.
+        :return: The converted values, in order.
+        :rtype: list
+        """
+        packed = bytearray(packed)
+        n = len(packed) // 3
+
+        # Widen each RGB triple to a big-endian 32-bit word, giving its 24-bit table index
+        words = bytearray(4 * n)
+        for c in range(3):
+            words[c + 1::4] = packed[c::3]
+        indices = array.array('I', bytes(words))
+        if sys.byteorder == 'little':
+            indices.byteswap()
+
+        if n and max(indices) >= self.count:
+            return None
+        decode = self._decode
+        return [decode(i) for i in indices]
+
+    def close(self):
+        """ Release the table's views of its memory-mapped file. """
+        for view in self._views:
+            view.release()
+        self._views = []
+        if self._source is not None:
+            self._source.close()
+
+
+def load_table(kind, directory=None):
+    """
+    Open a table file, memory-mapped for reading.
+
+    :param kind: The table kind, one of colorutils.tables.kinds.
+    :param directory: The table directory (default colorutils.tables.table_dir()).
+    :return: The table, or None if the file is absent or is not a valid table for this platform.
+    :rtype: Table
+    """
+    path = table_path(kind, directory)
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError):
+        return None
+
+    try:
+        magic, _kind, byteorder, count, named = _header.unpack_from(mapped)
+    except struct.error:
+        mapped.close()
+        return None
+    expected = _header_size + sum(-(-array.array(c).itemsize * count // 8) * 8 for c in _planes[kind])
+    if (magic != _magic or _kind.rstrip(b'\0') != kind.encode('ascii') or
+            byteorder.rstrip(b'\0') != sys.byteorder.encode('ascii') or len(mapped) != expected or
+            (kind == 'web' and named != len(_web_points()))):
+        mapped.close()
+        return None
+    return Table(kind, mapped, count, mapped)
+
+
+# -----------------------------------------------
+# Table Building
+# -----------------------------------------------
+
+
+def _scaled_rows(kind, count):
+    """ Compute the planes of an hsv or yiq table from its scalar conversion, checking each value is stored exactly. """
+    fn = getattr(convert, '_rgb_to_{}'.format(kind))
+    planes = [array.array(code) for code in _planes[kind]]
+    for i in range(count):
+        value = fn((i >> 16, (i >> 8) & 0xff, i & 0xff))
+        for plane, v in zip(planes, value):
+            n = int(round(v * 1000))
+            if n == 0 and math.copysign(1, v) < 0 and plane.typecode == 'h':
+                n = _negative_zero
+            elif n / 1000 != v or not _same_sign(n, v):
+                raise ColorException('Conversion of {} is not representable in a table'.format(i))
+            plane.append(n)
+    return planes
+
+
+def _nearest_row(points, r, g):
+    """
+    Compute the index of the nearest point (by euclidean distance, lowest index on ties) for each color (r, g, b).
+
+    For a fixed r and g, the squared distance to a point p is (b - pb)**2 + k, so the nearest point is found from the
+    lower envelope of the lines k + pb**2 - 2 * pb * b, walked in order of increasing b.
+    """
+    lines = {}
+    for index, (pr, pg, pb) in enumerate(points):
+        k = (r - pr) * (r - pr) + (g - pg) * (g - pg) + pb * pb
+        if pb not in lines or k < lines[pb][0]:
+            lines[pb] = (k, index)
+
+    # The lines of the envelope, by slope, as their pb, intercept and point index
+    hb, hk, hi = [], [], []
+    for pb in sorted(lines):
+        k, index = lines[pb]
+        # Drop the last line while it is strictly above the envelope of its neighbors
+        while len(hb) >= 2 and (hk[-1] - hk[-2]) * (pb - hb[-1]) > (k - hk[-1]) * (hb[-1] - hb[-2]):
+            hb.pop()
+            hk.pop()
+            hi.pop()
+        hb.append(pb)
+        hk.append(k)
+        hi.append(index)
+
+    row = bytearray(256)
+    p, last = 0, len(hb) - 1
+    for b in range(256):
+        d = hk[p] - 2 * hb[p] * b
+        while p < last and hk[p + 1] - 2 * hb[p + 1] * b <= d:
+            p += 1
+            d = hk[p] - 2 * hb[p] * b
+        best, q = hi[p], p
+        while q > 0 and hk[q - 1] - 2 * hb[q - 1] * b == d:
+            q -= 1
+            best = min(best, hi[q])
+        row[b] = best
+    return row
+
+
+def _web_rows(count):
+    """ Compute the plane of a web table. """
+    points = _web_points()
+    plane = bytearray()
+    for row in range(count >> 8):
+        plane += _nearest_row(points, row >> 8, row & 0xff)
+    return [plane]
+
+
+def _same_sign(a, b):
+    """ Whether two numbers have the same sign, telling 0.0 from -0.0. """
+    return math.copysign(1, a) == math.copysign(1, b)
+
+
+def _verify(table):
+    """ Check the entries of a table for a spread of colors against the scalar conversions. """
+    if table.kind == 'web':
+        from .nearest import nearest_web
+        fn = nearest_web
+    else:
+        fn = getattr(convert, '_rgb_to_{}'.format(table.kind))
+
+    step = max(1, table.count // 16384)
+    for i in list(range(0, table.count, step)) + [table.count - 1]:
+        rgb = (i >> 16, (i >> 8) & 0xff, i & 0xff)
+        value, expected = table.lookup(rgb), fn(rgb)
+        # Compared by repr, telling 0 from 0.0 and 0.0 from -0.0
+        if repr(value) != repr(expected):
+            raise ColorException('Conversion table {} does not match at {}'.format(table.kind, rgb))
+
+
+def build_table(kind, directory=None, count=_size):
+    """
+    Build a table file, verifying it against the scalar conversions. The file is written atomically, so concurrent
+    builds and readers are safe.
+
+    :param kind: The table kind, one of colorutils.tables.kinds.
+    :param directory: The table directory (default colorutils.tables.table_dir()).
+    :param count: The number of 24-bit RGB values to cover, from 0 (default all); a multiple of 256.
+    :return: The path of the table file.
+    :rtype: str
+    """
+    path = table_path(kind, directory)
+    if count < 256 or count > _size or count % 256:
+        raise ColorException('Conversion table size must be a multiple of 256 up to 2 ** 24')
+
+    if kind == 'web':
+        planes = _web_rows(count)
+    else:
+        planes = _scaled_rows(kind, count)
+
+    header = _header.pack(_magic, kind.encode('ascii'), sys.byteorder.encode('ascii'), count, len(_web_points()))
+    parts = [header.ljust(_header_size, b'\0')]
+    for code, plane in zip(_planes[kind], planes):
+        data = bytes(plane) if code == 'B' else plane.tobytes()
+        parts.append(data + b'\0' * (-len(data) % 8))
+    data = b''.join(parts)
+
+    table = Table(kind, data, count)
+    try:
+        _verify(table)
+    finally:
+        table.close()
+
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    tmp = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return path
+
+
+# -----------------------------------------------
+# Enabling Tables
+# -----------------------------------------------
+
+
+def enable(kinds=kinds, directory=None, build=False):
+    """
+    Use tables for the conversions from RGB. Tables whose files are absent (or invalid) are skipped, unless `build`
+    is set, in which case they are built first.
+
+    :param kinds: The table kinds to enable (default all).
+    :param directory: The table directory (default colorutils.tables.table_dir()).
+    :param build: Flag indicating absent tables should be built (default False).
+    :return: The kinds of the enabled tables.
+    :rtype: list
+    """
+    enabled = []
+    for kind in kinds:
+        table = load_table(kind, directory)
+        if table is None and build:
+            build_table(kind, directory)
+            table = load_table(kind, directory)
+        if table is not None:
+            previous = convert._tables.get(kind)
+            convert._tables[kind] = table
+            if previous is not None:
+                previous.close()
+            enabled.append(kind)
+    return enabled
+
+
+def disable(kinds=kinds):
+    """
+    Stop using tables for the conversions from RGB.
+
+    :param kinds: The table kinds to disable (default all).
+    """
+    for kind in kinds:
+        table = convert._tables.pop(kind, None)
+        if table is not None:
+            table.close()
+
+
+def enabled():
+    """
+    Get the tables in use.
+
+    :return: A dict of the enabled tables, by kind.
+    :rtype: dict
+    """
+    return dict(convert._tables)
@@ -23,13 +23,18 @@ setup(
     url='https://github.com/edaniszewski/colorutils',
     download_url='https://github.com/edaniszewski/colorutils/releases/tag/0.1',
     keywords=['color', 'color manipulation', 'color conversion', 'color tools'],
+    python_requires='>=3.8',
     classifiers=[
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'Topic :: Utilities',
     ],
 )
\ No newline at end of file
@@ -20,6 +20,11 @@ class ColorUtilsTestCase(unittest.TestCase):
         _c1 = Color((10, 10, 10))
         self.assertEqual(Color((30, 30, 30)), _c1 + (20, 20, 20))
 
+    def test_color_addition_blend(self):
+        _c1 = Color((0, 100, 200), arithmetic=ArithmeticModel.BLEND)
+        self.assertEqual(Color((50, 100, 150)), _c1 + Color((100, 100, 100)))
+        self.assertEqual(Color((5, 100, 227)), _c1 + (10, 101, 255))
+
     def test_color_addition_exception(self):
         _c1 = Color((35, 150, 35))
 
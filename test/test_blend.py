@@ -0,0 +1,117 @@
+import unittest
+from colorutils import *
+from colorutils.blend import SUBTRACT
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # Every pair of 8-bit channel values
+        self.base = bytes(v for v in range(256) for _ in range(256))
+        self.other = bytes(range(256)) * 256
+
+    def test_registry(self):
+        for name in ('light', 'blend', 'multiply', 'screen', 'overlay', 'darken', 'lighten', 'difference',
+                     'soft-light', 'alpha-over'):
+            self.assertIn(name, ArithmeticModel.modes)
+            self.assertIs(ArithmeticModel.modes[name], getattr(ArithmeticModel, name.upper().replace('-', '_')))
+            self.assertIs(ArithmeticModel.modes[name], ArithmeticModel.get(name))
+
+        self.assertIs(ArithmeticModel.LIGHT, ArithmeticModel.get(0))
+        self.assertIs(ArithmeticModel.BLEND, ArithmeticModel.get(1))
+        self.assertIs(ArithmeticModel.SCREEN, ArithmeticModel.get(ArithmeticModel.SCREEN))
+        self.assertEqual('<BlendMode soft-light>', repr(ArithmeticModel.SOFT_LIGHT))
+
+        for model in ('dodge', 2, -1, None):
+            with self.assertRaises(ColorException):
+                ArithmeticModel.get(model)
+
+    def test_scalar_kernels(self):
+        expected = {
+            'light': (255, 228, 178),
+            'blend': (164, 114, 89),
+            'multiply': (100, 50, 25),
+            'screen': (228, 178, 153),
+            'overlay': (200, 100, 50),
+            'darken': (128, 100, 50),
+            'lighten': (200, 128, 128),
+            'difference': (72, 28, 78),
+            'soft-light': (200, 100, 50),
+            'alpha-over': (164, 114, 89),
+        }
+        for name, rgb in expected.items():
+            mode = ArithmeticModel.get(name)
+            self.assertEqual(rgb, mode((200, 100, 50), (128, 128, 128)), name)
+            self.assertEqual(Color(rgb), Color((200, 100, 50), arithmetic=mode) + (128, 128, 128), name)
+            self.assertEqual(Color(rgb), Color((200, 100, 50), arithmetic=name) + Color((128, 128, 128)), name)
+
+        self.assertEqual((0, 0, 0), ArithmeticModel.MULTIPLY((0, 0, 0), (255, 255, 255)))
+        self.assertEqual((255, 255, 255), ArithmeticModel.SCREEN((255, 255, 255), (0, 0, 0)))
+
+    def test_packed_kernels(self):
+        for mode in list(ArithmeticModel.modes.values()) + [SUBTRACT]:
+            expected = bytes(min(max(int(round(mode.fn(a, b))), 0), 255) for a, b in zip(self.base, self.other))
+            self.assertEqual(expected, mode.blend_packed(self.base, self.other), mode.name)
+            self.assertEqual(expected, mode.table(), mode.name)
+            self.assertEqual(expected[200::256], mode.row(200), mode.name)
+
+        self.assertEqual(b'', ArithmeticModel.MULTIPLY.blend_packed(b'', b''))
+        with self.assertRaises(ColorException):
+            ArithmeticModel.LIGHT.blend_packed(b'\x00', b'')
+
+    def test_color_array(self):
+        colors, others = random_rgb_many(500, rng=1), random_rgb_many(500, rng=2)
+        for mode in ArithmeticModel.modes.values():
+            a = ColorArray(colors, arithmetic=mode)
+            expected = [Color(c1, arithmetic=mode) + c2 for c1, c2 in zip(colors.rgb, others.rgb)]
+            self.assertEqual(expected, list(a + others))
+            self.assertEqual([Color(c, arithmetic=mode) + (10, 200, 30) for c in colors.rgb], list(a + (10, 200, 30)))
+            a += others
+            self.assertEqual((ColorArray(colors, arithmetic=mode) + others).rgb, a.rgb)
+
+        # Values outside the 8-bit range are applied through the scalar kernel
+        a = ColorArray([(100, 100, 100)], arithmetic=ArithmeticModel.MULTIPLY)
+        self.assertEqual([(200, 0, 50)], (a + (510, -10, 127.5)).rgb)
+
+    def test_color_array_reflected(self):
+        # With the array on the right, the other operand is the base, which matters for non-commutative modes
+        colors, others = random_rgb_many(500, rng=1), random_rgb_many(500, rng=2)
+        for mode in ArithmeticModel.modes.values():
+            a = ColorArray(colors, arithmetic=mode)
+            expected = [Color(c2, arithmetic=mode) + c1 for c1, c2 in zip(colors.rgb, others.rgb)]
+            self.assertEqual(expected, list(others.rgb + a))
+            self.assertEqual([Color((10, 200, 30), arithmetic=mode) + c for c in colors.rgb], list((10, 200, 30) + a))
+
+        a = ColorArray([(200, 50, 100)], arithmetic=ArithmeticModel.OVERLAY)
+        self.assertEqual([(16, 231, 101)], ((10, 240, 128) + a).rgb)
+        self.assertEqual([(149, 94, 100)], (a + (10, 240, 128)).rgb)
+
+    def test_color_array_reflected_color(self):
+        # A Color or PackedColor on the left defers to the array, which applies its own mode with the color as base
+        a = ColorArray([(200, 50, 100), (0, 255, 10)], arithmetic=ArithmeticModel.OVERLAY)
+        self.assertEqual(((10, 240, 128) + a).rgb, (Color((10, 240, 128)) + a).rgb)
+        self.assertEqual(((10, 240, 128) + a).rgb, (PackedColor((10, 240, 128)) + a).rgb)
+        self.assertIsInstance(Color((10, 240, 128)) + a, ColorArray)
+
+        a = ColorArray([(200, 50, 100), (0, 255, 10)])
+        self.assertEqual([(0, 190, 28), (10, 0, 118)], (Color((10, 240, 128)) - a).rgb)
+        self.assertEqual([(0, 190, 28), (10, 0, 118)], (PackedColor((10, 240, 128)) - a).rgb)
+        self.assertEqual([(0, 190, 28), (10, 0, 118)], ((10, 240, 128) - a).rgb)
+
+    def test_alpha_over(self):
+        mode = ArithmeticModel.alpha_over(0.25)
+        self.assertEqual((25, 50, 200), mode((0, 0, 200), (100, 200, 200)))
+        self.assertEqual((0, 0, 200), ArithmeticModel.alpha_over(0)((0, 0, 200), (100, 200, 200)))
+        self.assertEqual((100, 200, 200), ArithmeticModel.alpha_over(1)((0, 0, 200), (100, 200, 200)))
+        with self.assertRaises(ColorException):
+            ArithmeticModel.alpha_over(1.5)
+
+    def test_register(self):
+        try:
+            mode = ArithmeticModel.register('average-up', lambda a, b: (a + b + 1) // 2)
+            self.assertIs(mode, ArithmeticModel.AVERAGE_UP)
+            self.assertEqual(Color((51, 1, 1)), Color((1, 1, 1), arithmetic='average-up') + (100, 0, 1))
+            self.assertEqual([(51, 1, 1)], (ColorArray([(1, 1, 1)], arithmetic=mode) + [(100, 0, 1)]).rgb)
+        finally:
+            ArithmeticModel.modes.pop('average-up', None)
+            del ArithmeticModel.AVERAGE_UP
@@ -0,0 +1,77 @@
+import unittest
+from colorutils import *
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    rgbs = [(0, 0, 0), (255, 255, 255), (46, 139, 87), (1, 243, 77), (128, 128, 0), (46, 139, 87), (12.5, 0, 255)]
+
+    def test_rgb_many(self):
+        self.assertEqual([rgb_to_hex(c) for c in self.rgbs], rgb_to_hex_many(self.rgbs))
+        self.assertEqual([rgb_to_web(c) for c in self.rgbs], rgb_to_web_many(self.rgbs))
+        self.assertEqual([rgb_to_yiq(c) for c in self.rgbs], rgb_to_yiq_many(self.rgbs))
+        self.assertEqual([rgb_to_hsv(c) for c in self.rgbs], rgb_to_hsv_many(self.rgbs))
+
+    def test_rgb_many_exhaustive_channels(self):
+        rgbs = [(v, (v * 7) % 256, (v * 13) % 256) for v in range(256)]
+        self.assertEqual([rgb_to_hex(c) for c in rgbs], rgb_to_hex_many(rgbs))
+        self.assertEqual([rgb_to_hsv(c) for c in rgbs], rgb_to_hsv_many(rgbs))
+
+    def test_rgb_many_packed_buffer(self):
+        packed = bytes(bytearray([0, 0, 0, 46, 139, 87, 255, 0, 0]))
+        self.assertEqual(['#000000', '#2e8b57', '#ff0000'], rgb_to_hex_many(packed))
+        self.assertEqual(['Black', 'SeaGreen', 'Red'], rgb_to_web_many(bytearray(packed)))
+        self.assertEqual([rgb_to_hsv((46, 139, 87))], rgb_to_hsv_many(memoryview(packed)[3:6]))
+
+    def test_rgb_many_planes(self):
+        # Large collections of 8-bit colors are converted a plane at a time, with identical results (including the
+        # int or float type of each value and the sign of zeros)
+        rgbs = random_rgb_many(8192, rng=3).rgb + [(v, v, v) for v in range(256)] + [(192, 1, 0), (255, 0, 0)]
+        packed = bytes(bytearray(v for rgb in rgbs for v in rgb))
+        for many, scalar in ((rgb_to_yiq_many, rgb_to_yiq), (rgb_to_hsv_many, rgb_to_hsv)):
+            expected = repr([scalar(c) for c in rgbs])
+            self.assertEqual(expected, repr(many(packed)))
+            self.assertEqual(expected, repr(many(rgbs)))
+            self.assertEqual(expected, repr(many(iter(rgbs))))
+        self.assertEqual(rgb_to_hsv_many(rgbs), ColorArray(rgbs).hsv)
+
+    def test_many_repeats(self):
+        distinct = ['#{0:06x}'.format(i * 997) for i in range(3000)]
+        repeated = ['#000000', '#2e8b57', '#fff'] * 1000
+        for hexes in (distinct, repeated, distinct[:10] + repeated):
+            self.assertEqual([hex_to_rgb(c) for c in hexes], hex_to_rgb_many(hexes))
+
+    def test_rgb_many_lists(self):
+        self.assertEqual(['#2e8b57'], rgb_to_hex_many([[46, 139, 87]]))
+
+    def test_hex_many(self):
+        hexes = ['#000000', 'fff', '#2E8B57', '01f34d', '#2e8b57']
+        self.assertEqual([hex_to_rgb(c) for c in hexes], hex_to_rgb_many(hexes))
+        self.assertEqual([hex_to_web(c) for c in hexes], hex_to_web_many(hexes))
+        self.assertEqual([hex_to_yiq(c) for c in hexes], hex_to_yiq_many(hexes))
+        self.assertEqual([hex_to_hsv(c) for c in hexes], hex_to_hsv_many(hexes))
+
+    def test_web_many(self):
+        webs = ['Black', 'cyan', 'SEAGREEN', '#01f34d', '0ff']
+        self.assertEqual([web_to_rgb(c) for c in webs], web_to_rgb_many(webs))
+        self.assertEqual([web_to_hex(c) for c in webs], web_to_hex_many(webs))
+        self.assertEqual([web_to_yiq(c) for c in webs], web_to_yiq_many(webs))
+        self.assertEqual([web_to_hsv(c) for c in webs], web_to_hsv_many(webs))
+
+    def test_yiq_many(self):
+        yiqs = [(0.701, -0.596, -0.217), (0, 0, 0), [1, 0, 0], (0.413, -0.152, -0.143)]
+        self.assertEqual([yiq_to_rgb(c) for c in yiqs], yiq_to_rgb_many(yiqs))
+        self.assertEqual([yiq_to_hex(c) for c in yiqs], yiq_to_hex_many(yiqs))
+        self.assertEqual([yiq_to_web(c) for c in yiqs], yiq_to_web_many(yiqs))
+        self.assertEqual([yiq_to_hsv(c) for c in yiqs], yiq_to_hsv_many(yiqs))
+
+    def test_hsv_many(self):
+        hsvs = [(180, 1, 1), (0, 0, 0), [146.452, 0.669, 0.545], (359.9, 0.5, 0.5)]
+        self.assertEqual([hsv_to_rgb(c) for c in hsvs], hsv_to_rgb_many(hsvs))
+        self.assertEqual([hsv_to_hex(c) for c in hsvs], hsv_to_hex_many(hsvs))
+        self.assertEqual([hsv_to_web(c) for c in hsvs], hsv_to_web_many(hsvs))
+        self.assertEqual([hsv_to_yiq(c) for c in hsvs], hsv_to_yiq_many(hsvs))
+
+
+if __name__ == '__main__':
+    unittest.main()
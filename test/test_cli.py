@@ -0,0 +1,98 @@
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from colorutils import *
+from colorutils.cli import build_parser, convert_lines, main, run_convert
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _write(self, name, text):
+        path = os.path.join(self.tmp, name)
+        with io.open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def _run(self, argv):
+        out, err = io.StringIO(), io.StringIO()
+        args = build_parser().parse_args(argv)
+        self.assertEqual(0, run_convert(args, stdout=out, stderr=err))
+        return out.getvalue(), err.getvalue()
+
+    def test_convert_lines(self):
+        self.assertEqual(('146.452 0.669 0.545\n', 1), convert_lines(['#2e8b57\n'], 'hex', 'hsv'))
+        self.assertEqual(('#2e8b57\n#000000\n', 2), convert_lines(['46, 139, 87\n', '\n', '0 0 0'], 'rgb', 'hex'))
+        self.assertEqual(('SeaGreen\n', 1), convert_lines(['46,139,87'], 'rgb', 'web', 'csv'))
+        self.assertEqual(('0,255,255\n', 1), convert_lines(['cyan'], 'web', 'rgb', 'csv'))
+        self.assertEqual(('[0, 255, 255]\n[255, 0, 0]\n', 2),
+                         convert_lines(['"cyan"', '"red"'], 'web', 'rgb', 'jsonl'))
+        self.assertEqual(('"#00ffff"\n', 1), convert_lines(['[0, 255, 255]'], 'rgb', 'hex', 'jsonl'))
+
+        with self.assertRaises(ColorException):
+            convert_lines(['1 2'], 'rgb', 'hex')
+
+    def test_convert_files(self):
+        first = self._write('a.txt', '#000000\n#fff\n')
+        second = self._write('b.txt', 'ff0000\n')
+
+        out, err = self._run(['convert', '--from', 'hex', '--to', 'web', '--chunk-size', '1', first, second])
+        self.assertEqual('Black\nWhite\nRed\n', out)
+        self.assertTrue(err.startswith('Converted 3 colors'))
+
+        output = os.path.join(self.tmp, 'out.txt')
+        out, err = self._run(['convert', '--from', 'hex', '--to', 'rgb', '-q', '-o', output, first])
+        self.assertEqual('', out + err)
+        with io.open(output) as f:
+            self.assertEqual('0 0 0\n255 255 255\n', f.read())
+
+    def test_convert_workers(self):
+        path = self._write('a.txt', ''.join('#{0:06x}\n'.format(i * 997) for i in range(1000)))
+
+        serial, _ = self._run(['convert', '--from', 'hex', '--to', 'hsv', '--chunk-size', '100', path])
+        parallel, _ = self._run(['convert', '--from', 'hex', '--to', 'hsv', '--chunk-size', '100', '--workers', '2',
+                                 path])
+        self.assertEqual(serial, parallel)
+        self.assertEqual(1000, len(parallel.splitlines()))
+
+    def test_convert_same_format(self):
+        with self.assertRaises(SystemExit):
+            main(['convert', '--from', 'hex', '--to', 'hex'])
+
+    def test_invalid_arguments(self):
+        path = self._write('colors.txt', '#2e8b57\n')
+        for size in ('0', '-1', 'x'):
+            with self.assertRaises(SystemExit):
+                main(['convert', '--from', 'hex', '--to', 'hsv', '--chunk-size', size, '-q', path])
+
+        err = io.StringIO()
+        stderr, sys.stderr = sys.stderr, err
+        try:
+            with self.assertRaises(SystemExit) as cm:
+                main(['convert', '--from', 'hex', '--to', 'hsv', '-q', os.path.join(self.tmp, 'missing.txt')])
+        finally:
+            sys.stderr = stderr
+        self.assertEqual(1, cm.exception.code)
+        self.assertIn('missing.txt', err.getvalue())
+        self.assertNotIn('Traceback', err.getvalue())
+
+    def test_module_entry_point(self):
+        proc = subprocess.Popen([sys.executable, '-m', 'colorutils', 'convert', '--from', 'web', '--to', 'hex', '-q'],
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        out, _ = proc.communicate(b'seagreen\ncyan\n')
+        self.assertEqual(0, proc.returncode)
+        self.assertEqual(b'#2e8b57\n#00ffff\n', out)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from colorutils import *
+from colorutils.codec import *
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    packed = bytes(bytearray([0, 0, 0, 46, 139, 87, 255, 255, 255, 1, 243, 77]))
+
+    def test_encode_hex(self):
+        self.assertEqual(b'#000000#2e8b57#ffffff#01f34d', encode_hex(self.packed))
+        self.assertEqual(b'#000000\n#2e8b57\n#ffffff\n#01f34d', encode_hex(self.packed, b'\n'))
+        self.assertEqual(b'#000000, #2e8b57, #ffffff, #01f34d', encode_hex(self.packed, b', '))
+        self.assertEqual(b'', encode_hex(b''))
+
+        with self.assertRaises(ColorException):
+            encode_hex(b'\x00\x01')
+
+    def test_decode_hex(self):
+        for sep in (b'', b'\n', b', ', b'\r\n'):
+            self.assertEqual(bytearray(self.packed), decode_hex(encode_hex(self.packed, sep)))
+
+        self.assertEqual(bytearray([255, 255, 255, 0, 0, 0, 10, 11, 12, 17, 34, 51]),
+                         decode_hex('#fff 000,#0A0B0C\n123\n'))
+        self.assertEqual(bytearray(), decode_hex(b' \n'))
+
+        with self.assertRaises(ColorException):
+            decode_hex('#fffff')
+
+        with self.assertRaises(ColorException):
+            decode_hex('#gggggg')
+
+        # Only whitespace and commas separate values
+        for block in ('#aabbcc1#ddeeff', '#aabbccZZ #ddeeff', '#aabbcc;#ddeeff', '##aabbcc'):
+            with self.assertRaises(ColorException):
+                decode_hex(block)
+
+    def test_hex_list(self):
+        rgbs = [(0, 0, 0), (46, 139, 87), (255, 255, 255), (1, 243, 77)]
+        self.assertEqual([rgb_to_hex(c) for c in rgbs], encode_hex_list(self.packed))
+        self.assertEqual([], encode_hex_list(b''))
+        self.assertEqual(bytearray(self.packed), decode_hex_list(['#000000', '2e8b57', '#fff', '01F34D']))
+        self.assertEqual(bytearray([255, 255, 255]), decode_hex_list([' #fff\n']))
+
+        # Each item is exactly one color
+        for hexes in (['#fff #000'], ['#fff,#000'], ['#aabbcc#ddeeff'], [''], ['#fff', ''], [b'#fff']):
+            with self.assertRaises(ColorException):
+                decode_hex_list(hexes)
+
+
+if __name__ == '__main__':
+    unittest.main()
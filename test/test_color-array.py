@@ -0,0 +1,166 @@
+import unittest
+from colorutils import *
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def test_color_array_construction(self):
+        _a1 = ColorArray([(0, 0, 0), Color((10, 20, 30)), (255, 255, 255)])
+        _a2 = ColorArray(bytearray([0, 0, 0, 10, 20, 30, 255, 255, 255]))
+        _a3 = ColorArray(_a1)
+
+        self.assertEqual(3, len(_a1))
+        self.assertEqual(_a1, _a2)
+        self.assertEqual(_a1, _a3)
+        self.assertEqual(0, len(ColorArray()))
+
+        with self.assertRaises(ColorException):
+            ColorArray(b'\x00\x00')
+
+        with self.assertRaises(ColorException):
+            ColorArray([(1, 2)])
+
+    def test_color_array_non_integral_values(self):
+        _a1 = ColorArray([(0, 255.0, 252.803), (-3, 300, 127.4)])
+        self.assertEqual([(0, 255, 253), (0, 255, 127)], _a1.rgb)
+
+    def test_color_array_representations(self):
+        colors = [(0, 0, 0), (46, 139, 87), (1, 243, 77), (255, 255, 255)]
+        _a1 = ColorArray(colors)
+
+        self.assertEqual(colors, _a1.rgb)
+        self.assertEqual([rgb_to_hex(c) for c in colors], _a1.hex)
+        self.assertEqual([minify_hex(rgb_to_hex(c)) for c in colors], _a1.shorthex)
+        self.assertEqual([rgb_to_web(c) for c in colors], _a1.web)
+        self.assertEqual([rgb_to_yiq(c) for c in colors], _a1.yiq)
+        self.assertEqual([rgb_to_hsv(c) for c in colors], _a1.hsv)
+        self.assertEqual([0, 46, 1, 255], _a1.red)
+        self.assertEqual([0, 139, 243, 255], _a1.green)
+        self.assertEqual([0, 87, 77, 255], _a1.blue)
+
+    def test_color_array_setters(self):
+        _a1 = ColorArray()
+
+        _a1.hex = ['#00ffff', '#f00']
+        self.assertEqual([(0, 255, 255), (255, 0, 0)], _a1.rgb)
+        with self.assertRaises(ColorException):
+            _a1.hex = ['#fff #000']
+        self.assertEqual([(0, 255, 255), (255, 0, 0)], _a1.rgb)
+
+        _a1.web = ['cyan', 'Black', '#0000ff']
+        self.assertEqual([(0, 255, 255), (0, 0, 0), (0, 0, 255)], _a1.rgb)
+
+        _a1.hsv = [(180, 1, 1)]
+        self.assertEqual([(0, 255, 255)], _a1.rgb)
+
+        _a1.yiq = [(0.701, -0.596, -0.217)]
+        self.assertEqual([(0, 255, 253)], _a1.rgb)
+
+        _a1.red = [100]
+        self.assertEqual([(100, 255, 253)], _a1.rgb)
+
+        with self.assertRaises(ColorException):
+            _a1.green = [1, 2]
+
+        _a2 = ColorArray(hex=['#010203'])
+        self.assertEqual([(1, 2, 3)], _a2.rgb)
+
+    def test_color_array_indexing(self):
+        _a1 = ColorArray([(i, i, i) for i in range(10)])
+
+        self.assertEqual(Color((3, 3, 3)), _a1[3])
+        self.assertEqual(Color((9, 9, 9)), _a1[-1])
+        self.assertEqual([(2, 2, 2), (3, 3, 3)], _a1[2:4].rgb)
+        self.assertEqual([(0, 0, 0), (4, 4, 4), (8, 8, 8)], _a1[::4].rgb)
+        self.assertEqual(0, len(_a1[5:2]))
+
+        with self.assertRaises(IndexError):
+            _a1[10]
+
+        _a1[0] = Color((50, 50, 50))
+        _a1[1:3] = [(7, 7, 7), (8, 8, 8)]
+        self.assertEqual([(50, 50, 50), (7, 7, 7), (8, 8, 8)], _a1[:3].rgb)
+
+        with self.assertRaises(ColorException):
+            _a1[1:3] = [(7, 7, 7)]
+
+    def test_color_array_iterable(self):
+        _a1 = ColorArray([(10, 20, 30), (40, 50, 60)])
+        self.assertEqual([Color((10, 20, 30)), Color((40, 50, 60))], list(_a1))
+
+        _a1.append((1, 1, 1))
+        _a1.extend(ColorArray([(2, 2, 2)]))
+        self.assertEqual(b'\x0a\x14\x1e\x28\x32\x3c\x01\x01\x01\x02\x02\x02', _a1.tobytes())
+
+    def test_color_array_addition(self):
+        _a1 = ColorArray([(35, 150, 35), (10, 100, 255), (0, 0, 0)])
+        _a2 = ColorArray([(150, 35, 150), (50, 175, 30), (100, 50, 25)])
+        self.assertEqual([(185, 185, 185), (60, 255, 255), (100, 50, 25)], (_a1 + _a2).rgb)
+        self.assertEqual((_a1 + _a2).rgb, (_a1 + _a2.rgb).rgb)
+        self.assertEqual((_a1 + _a2).rgb, (_a1 + _a2.tobytes()).rgb)
+
+        # A single color is added to every color of the array
+        self.assertEqual([(45, 170, 65), (20, 120, 255), (10, 20, 30)], (_a1 + (10, 20, 30)).rgb)
+        self.assertEqual((_a1 + (10, 20, 30)).rgb, (_a1 + Color((10, 20, 30))).rgb)
+        self.assertEqual((_a1 + (10, 20, 30)).rgb, ((10, 20, 30) + _a1).rgb)
+        self.assertEqual((_a1 + (10, 20, 30)).rgb, (_a1 + PackedColor((10, 20, 30))).rgb)
+        self.assertEqual((_a1 + (10, 20, 30)).rgb, (_a1 + [10, 20, 30]).rgb)
+
+        # A sequence of three Colors is three colors, not a single color
+        colors = (Color((10, 20, 30)), Color((1, 2, 3)), PackedColor((5, 5, 5)))
+        self.assertEqual([(45, 170, 65), (11, 102, 255), (5, 5, 5)], (_a1 + colors).rgb)
+        self.assertEqual((_a1 + colors).rgb, (_a1 + list(colors)).rgb)
+
+        _a1.arithmetic = ArithmeticModel.BLEND
+        self.assertEqual([(92, 92, 92), (30, 137, 142), (50, 25, 12)], (_a1 + _a2).rgb)
+        self.assertEqual([(22, 85, 32), (10, 60, 142), (5, 10, 15)], (_a1 + (10, 20, 30)).rgb)
+        self.assertEqual(ArithmeticModel.BLEND, (_a1 + _a2).arithmetic)
+        self.assertEqual([(35, 150, 35), (10, 100, 255), (0, 0, 0)], _a1.rgb)
+
+        with self.assertRaises(ColorException):
+            _a1 + _a2[:2]
+        with self.assertRaises(TypeError):
+            _a1 + 150
+        with self.assertRaises(TypeError):
+            _a1 + 'a'
+
+    def test_color_array_subtraction(self):
+        _a1 = ColorArray([(150, 35, 150), (50, 175, 30), (100, 50, 25)])
+        _a2 = ColorArray([(35, 150, 35), (10, 100, 255), (0, 0, 0)])
+        self.assertEqual([(115, 0, 115), (40, 75, 0), (100, 50, 25)], (_a1 - _a2).rgb)
+        self.assertEqual([(130, 15, 130), (30, 155, 10), (80, 30, 5)], (_a1 - (20, 20, 20)).rgb)
+
+        # Subtraction is the same under every arithmetic model
+        _a1.arithmetic = ArithmeticModel.BLEND
+        self.assertEqual([(115, 0, 115), (40, 75, 0), (100, 50, 25)], (_a1 - _a2).rgb)
+
+        with self.assertRaises(ColorException):
+            _a1 - [(1, 1, 1)]
+        with self.assertRaises(TypeError):
+            _a1 - 13.0
+
+    def test_color_array_in_place_arithmetic(self):
+        colors = random_rgb_many(1000, rng=4)
+        others = random_rgb_many(1000, rng=5)
+        expected = [tuple(min(a + b, 255) for a, b in zip(c1, c2)) for c1, c2 in zip(colors.rgb, others.rgb)]
+
+        _a1 = ColorArray(colors)
+        buffer = _a1._buffer
+        _a1 += others
+        self.assertIs(buffer, _a1._buffer)
+        self.assertEqual(expected, _a1.rgb)
+
+        _a1 -= (255, 0, 0)
+        self.assertIs(buffer, _a1._buffer)
+        self.assertEqual([(0, g, b) for _, g, b in expected], _a1.rgb)
+
+        # The element-wise results match those of Color arithmetic
+        _a1 = ColorArray(colors, arithmetic=ArithmeticModel.BLEND)
+        _a1 += others
+        self.assertEqual([Color(c1, arithmetic=ArithmeticModel.BLEND) + c2 for c1, c2 in zip(colors.rgb, others.rgb)],
+                         list(_a1))
+        self.assertEqual([Color(c1) - c2 for c1, c2 in zip(colors.rgb, others.rgb)], list(colors - others))
+
+
+if __name__ == '__main__':
+    unittest.main()
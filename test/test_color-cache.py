@@ -0,0 +1,73 @@
+import unittest
+from colorutils import *
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        Color.reset_cache_info()
+
+    def test_cached_representations(self):
+        _c1 = Color((46, 139, 87))
+
+        self.assertEqual('#2e8b57', _c1.hex)
+        self.assertEqual('#2e8b57', _c1.hex)
+        self.assertEqual((146.452, 0.669, 0.545), _c1.hsv)
+        self.assertEqual((146.452, 0.669, 0.545), _c1.hsv)
+
+        info = Color.cache_info()
+        self.assertEqual(2, info['hits'])
+        self.assertEqual(2, info['misses'])
+        self.assertEqual(0.5, info['hit_rate'])
+
+    def test_cache_invalidation(self):
+        _c1 = Color([0, 0, 0])
+        self.assertEqual('#000', _c1.shorthex)
+
+        _c1.red = 255
+        self.assertEqual('#ff0000', _c1.hex)
+        self.assertEqual('#f00', _c1.shorthex)
+        _c1.green = 255
+        self.assertEqual('#ffff00', _c1.hex)
+        _c1.blue = 255
+        self.assertEqual('#fff', _c1.shorthex)
+
+        _c1.rgb = (0, 0, 0)
+        self.assertEqual('#000000', _c1.hex)
+        _c1.hex = '#00ffff'
+        self.assertEqual('Cyan', _c1.web)
+        _c1.web = 'red'
+        self.assertEqual((0.0, 1.0, 1.0), _c1.hsv)
+        _c1.hsv = (180, 1, 1)
+        self.assertEqual('#00ffff', _c1.hex)
+        _c1.yiq = (0, 0, 0)
+        self.assertEqual('#000000', _c1.hex)
+
+    def test_copies_do_not_share_state(self):
+        _c1 = Color([10, 20, 30])
+        _c2 = Color(_c1)
+        self.assertEqual('#0a141e', _c2.hex)
+        _c1.red = 50
+        self.assertEqual('#32141e', _c1.hex)
+        self.assertEqual([10, 20, 30], _c2.rgb)
+        self.assertEqual('#0a141e', _c2.hex)
+
+    def test_cache_opt_out(self):
+        _c1 = Color((46, 139, 87), cache=False)
+        _c1.hex
+        _c1.hex
+        self.assertEqual({'hits': 0, 'misses': 0, 'hit_rate': 0.0}, Color.cache_info())
+        # The cache of an instance is only created once a representation is cached
+        self.assertNotIn('_cache', vars(_c1))
+        self.assertNotIn('_cache', vars(Color((46, 139, 87))))
+
+        Color.cache = False
+        try:
+            Color((1, 2, 3)).yiq
+            self.assertEqual(0, Color.cache_info()['misses'])
+        finally:
+            Color.cache = True
+
+
+if __name__ == '__main__':
+    unittest.main()
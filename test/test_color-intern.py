@@ -0,0 +1,81 @@
+import threading
+import unittest
+from colorutils import *
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.intern_size = Color.intern_size
+        Color.clear_interned()
+
+    def tearDown(self):
+        Color.intern_size = self.intern_size
+        Color.clear_interned()
+
+    def test_shared_instance(self):
+        _c1 = Color.intern((255, 255, 255))
+        self.assertIsInstance(_c1, PackedColor)
+        self.assertEqual((255, 255, 255), _c1.rgb)
+
+        self.assertIs(_c1, Color.intern((255, 255, 255)))
+        self.assertIs(_c1, Color.intern([255, 255, 255]))
+        self.assertIs(_c1, Color.intern(Color((255, 255, 255))))
+        self.assertIs(_c1, Color.intern(PackedColor((255, 255, 255))))
+        self.assertIs(_c1, Color.intern(hex='#fff'))
+        self.assertIs(_c1, Color.intern(web='white'))
+        self.assertIs(_c1, Color.intern((255.2, 255, 300)))
+        self.assertIs(Color.intern(), Color.intern(rgb_min))
+        self.assertIsNot(_c1, Color.intern((255, 255, 254)))
+
+        with self.assertRaises(AttributeError):
+            _c1.red = 0
+
+    def test_info(self):
+        Color.intern((46, 139, 87))
+        Color.intern((46, 139, 87))
+        Color.intern(hex='#2e8b57')
+        Color.intern((0, 0, 0))
+
+        info = Color.intern_info()
+        self.assertEqual(2, info['hits'])
+        self.assertEqual(2, info['misses'])
+        self.assertEqual(0, info['evictions'])
+        self.assertEqual(0.5, info['hit_rate'])
+        self.assertEqual(2, info['size'])
+        self.assertEqual(Color.intern_size, info['maxsize'])
+        self.assertGreater(info['memory'], 0)
+
+        Color.clear_interned()
+        info = Color.intern_info()
+        self.assertEqual((0, 0, 0, 0.0), (info['hits'], info['misses'], info['size'], info['hit_rate']))
+
+    def test_lru_eviction(self):
+        Color.intern_size = 2
+        red, green = Color.intern((255, 0, 0)), Color.intern((0, 255, 0))
+        self.assertIs(red, Color.intern((255, 0, 0)))
+
+        # Green is the least recently used, so it is evicted
+        Color.intern((0, 0, 255))
+        self.assertEqual(2, Color.intern_info()['size'])
+        self.assertEqual(1, Color.intern_info()['evictions'])
+        self.assertIs(red, Color.intern((255, 0, 0)))
+        self.assertIsNot(green, Color.intern((0, 255, 0)))
+
+    def test_threads(self):
+        results = []
+
+        def worker():
+            results.append([Color.intern((i % 64, 0, 0)) for i in range(1000)])
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for colors in results[1:]:
+            self.assertTrue(all(a is b for a, b in zip(results[0], colors)))
+        info = Color.intern_info()
+        self.assertEqual(4000, info['hits'] + info['misses'])
+        self.assertEqual(64, info['size'])
@@ -33,6 +33,23 @@ class ColorUtilsTestCase(unittest.TestCase):
         _run = [Color((10,10,10)), Color((20,20,20)), Color((30,30,30)), Color((40,40,40)), Color((50,50,50)),
                 Color((60,60,60)), Color((70,70,70)), Color((80,80,80)), Color((90,90,90))]
         self.assertEqual(run, _run)
+    def test_iter_color_run(self):
+        self.assertEqual(color_run((0,0,0), (100,100,100), 10), list(iter_color_run((0,0,0), (100,100,100), 10)))
+        self.assertEqual(color_run((0,0,0), (100,100,100), 10, inclusive=False, to_color=False),
+                         list(iter_color_run((0,0,0), (100,100,100), 10, inclusive=False, to_color=False)))
+
+    def test_iter_color_run_chunks(self):
+        chunks = list(iter_color_run((0,0,0), (100,100,100), 10, chunk_size=4))
+
+        self.assertEqual([4, 4, 3], [len(c) for c in chunks])
+        self.assertEqual([(0,0,0), (10,10,10), (20,20,20), (30,30,30)], chunks[0].rgb)
+
+        with self.assertRaises(ColorException):
+            iter_color_run((0,0,0), (100,100,100), 0)
+
+        with self.assertRaises(ColorException):
+            list(iter_color_run((0,0,0), (100,100,100), 10, chunk_size=-1))
+
 
 if __name__ == '__main__':
     unittest.main()
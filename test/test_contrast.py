@@ -0,0 +1,78 @@
+import unittest
+from colorutils import *
+from colorutils import contrast
+from colorutils.contrast import (best_contrast, best_contrast_many, contrast_ratio, contrast_ratio_many,
+                                 relative_luminance, relative_luminance_many)
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        contrast.clear_cache()
+
+    def test_relative_luminance(self):
+        self.assertEqual(0.0, relative_luminance((0, 0, 0)))
+        self.assertAlmostEqual(1.0, relative_luminance((255, 255, 255)))
+        self.assertAlmostEqual(0.2126, relative_luminance(Color((255, 0, 0))))
+        self.assertAlmostEqual(0.7152, relative_luminance(PackedColor((0, 255, 0))))
+        self.assertAlmostEqual(0.21586, relative_luminance((128, 128, 128)), places=5)
+        # Non-8-bit values are computed directly
+        self.assertAlmostEqual(relative_luminance((128, 128, 128)), relative_luminance((128.0, 128.0, 128.0)))
+
+        colors = random_rgb_many(200, rng=7)
+        expected = [relative_luminance(rgb) for rgb in colors.rgb]
+        self.assertEqual(expected, relative_luminance_many(colors))
+        self.assertEqual(expected, relative_luminance_many(colors.tobytes()))
+        self.assertEqual(expected, relative_luminance_many(list(colors)))
+
+    def test_contrast_ratio(self):
+        self.assertAlmostEqual(21.0, contrast_ratio((0, 0, 0), (255, 255, 255)))
+        self.assertAlmostEqual(21.0, contrast_ratio((255, 255, 255), (0, 0, 0)))
+        self.assertEqual(1.0, contrast_ratio((46, 139, 87), (46, 139, 87)))
+        self.assertAlmostEqual(4.54, contrast_ratio((118, 118, 118), (255, 255, 255)), places=2)
+
+        self.assertEqual([contrast_ratio((0, 0, 0), (255, 0, 0)), contrast_ratio((0, 0, 0), (0, 0, 255))],
+                         contrast_ratio_many((0, 0, 0), [(255, 0, 0), (0, 0, 255)]))
+        self.assertEqual(contrast_ratio_many([(255, 0, 0), (0, 0, 255)], Color((0, 0, 0))),
+                         contrast_ratio_many((0, 0, 0), ColorArray([(255, 0, 0), (0, 0, 255)])))
+        self.assertEqual([contrast_ratio((1, 2, 3), (4, 5, 6))], contrast_ratio_many((1, 2, 3), (4, 5, 6)))
+        self.assertEqual([21.0, 1.0], [round(r, 3) for r in
+                                       contrast_ratio_many([(0, 0, 0), (9, 9, 9)], [(255, 255, 255), (9, 9, 9)])])
+
+        with self.assertRaises(ColorException):
+            contrast_ratio_many([(0, 0, 0)], [(0, 0, 0), (1, 1, 1)])
+
+    def test_best_contrast(self):
+        self.assertEqual((255, 255, 255), best_contrast((0, 0, 0)))
+        self.assertEqual((0, 0, 0), best_contrast((255, 255, 0)))
+
+        navy, cream = (0, 51, 102), (255, 255, 204)
+        candidates = [navy, cream, (0, 0, 0), (255, 255, 255)]
+        # The most contrast, or the first candidate meeting the level
+        self.assertEqual((0, 0, 0), best_contrast((255, 255, 255), candidates))
+        self.assertEqual(navy, best_contrast((255, 255, 255), candidates, level='AA'))
+        self.assertEqual(cream, best_contrast((0, 0, 0), candidates, level='AAA'))
+        # No candidate meets the level
+        self.assertEqual(cream, best_contrast((128, 128, 128), [navy, cream], level='AAA'))
+
+        with self.assertRaises(ColorException):
+            best_contrast((0, 0, 0), candidates, level='A')
+        with self.assertRaises(ColorException):
+            best_contrast((0, 0, 0), [])
+
+    def test_best_contrast_many(self):
+        backgrounds = random_rgb_many(300, rng=2)
+        candidates = [Color((0, 51, 102)), Color((255, 255, 204))]
+        for level in (None, 'AA', 'AAA-large'):
+            expected = [best_contrast(rgb, candidates, level) for rgb in backgrounds.rgb]
+            self.assertEqual(expected, best_contrast_many(backgrounds, candidates, level))
+            self.assertEqual(expected, best_contrast_many(backgrounds.rgb, candidates, level))
+        self.assertIs(candidates[0], best_contrast_many([(255, 255, 255)], candidates)[0])
+        self.assertEqual([(255, 255, 255), (0, 0, 0)] * 2, best_contrast_many([(0, 0, 0), (255, 255, 255)] * 2))
+
+    def test_cache(self):
+        contrast.clear_cache()
+        relative_luminance((1, 2, 3))
+        self.assertIn((1, 2, 3), contrast._luminances)
+        contrast.clear_cache()
+        self.assertEqual({}, contrast._luminances)
@@ -0,0 +1,92 @@
+import unittest
+from colorutils import *
+from colorutils.difference import *
+from colorutils.equality import *
+
+# Test data from Sharma, Wu and Dalal, "The CIEDE2000 Color-Difference Formula"
+SHARMA = [
+    ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+    ((50.0, 3.1571, -77.2803), (50.0, 0.0, -82.7485), 2.8615),
+    ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+    ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0011), 7.2195),
+    ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+    ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+    ((2.0776, 0.0795, -1.135), (0.9033, -0.0636, -0.5514), 0.9082),
+]
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def test_rgb_to_lab(self):
+        self.assertEqual((95.047, 100.0, 108.883), rgb_to_xyz((255, 255, 255)))
+        self.assertEqual((0.0, 0.0, 0.0), rgb_to_xyz((0, 0, 0)))
+        self.assertEqual((100.0, 0.0, 0.0), rgb_to_lab((255, 255, 255)))
+        self.assertEqual((0.0, 0.0, 0.0), rgb_to_lab((0, 0, 0)))
+        self.assertEqual((53.24, 80.095, 67.206), rgb_to_lab((255, 0, 0)))
+        self.assertEqual(xyz_to_lab(rgb_to_xyz((46, 139, 87))), rgb_to_lab((46, 139, 87)))
+
+    def test_rgb_to_lab_many(self):
+        rgbs = [(255, 0, 0), (46, 139, 87), (255, 0, 0)]
+        self.assertEqual([rgb_to_lab(rgb) for rgb in rgbs], rgb_to_lab_many(rgbs))
+        self.assertEqual([rgb_to_xyz(rgb) for rgb in rgbs], rgb_to_xyz_many(ColorArray(rgbs).tobytes()))
+        self.assertEqual(rgb_to_lab_many(rgbs), xyz_to_lab_many(rgb_to_xyz_many(rgbs)))
+
+    def test_delta_e2000(self):
+        for lab1, lab2, expected in SHARMA:
+            self.assertAlmostEqual(expected, delta_e2000(lab1, lab2), places=4)
+            self.assertAlmostEqual(expected, delta_e2000(lab2, lab1), places=4)
+
+    def test_delta_e76(self):
+        self.assertEqual(5.0, delta_e76((50, 0, 0), (50, 3, 4)))
+        self.assertEqual(0.0, delta_e76((50, 3, 4), (50, 3, 4)))
+
+    def test_delta_e94(self):
+        self.assertEqual(0.0, delta_e94((50, 3, 4), (50, 3, 4)))
+        self.assertEqual(10.0, delta_e94((50, 0, 0), (60, 0, 0)))
+        self.assertEqual(5.0, delta_e94((50, 0, 0), (60, 0, 0), textiles=True))
+        # Chroma differences are weighted down for saturated reference colors
+        self.assertAlmostEqual(10 / 1.9, delta_e94((50, 20, 0), (50, 30, 0)))
+        self.assertNotEqual(delta_e94((50, 20, 0), (50, 30, 0)), delta_e94((50, 30, 0), (50, 20, 0)))
+
+    def test_delta_e(self):
+        self.assertEqual(0.0, delta_e((46, 139, 87), Color((46, 139, 87))))
+        self.assertEqual(delta_e2000(rgb_to_lab((1, 2, 3)), rgb_to_lab((4, 5, 6))), delta_e((1, 2, 3), (4, 5, 6)))
+        self.assertEqual(delta_e76(rgb_to_lab((1, 2, 3)), rgb_to_lab((4, 5, 6))),
+                         delta_e(PackedColor((1, 2, 3)), (4, 5, 6), 'cie76'))
+        self.assertLess(delta_e((255, 0, 0), (250, 0, 0)), delta_e((255, 0, 0), (0, 0, 255)))
+        with self.assertRaises(ColorException):
+            delta_e((0, 0, 0), (1, 1, 1), 'cie2001')
+
+    def test_delta_e_many(self):
+        a = [(0, 0, 0), (255, 0, 0), (46, 139, 87)]
+        b = ColorArray([(10, 10, 10), (250, 0, 0), (46, 139, 87)])
+        expected = [delta_e(x, y) for x, y in zip(a, b.rgb)]
+        self.assertEqual(expected, delta_e_many(a, b))
+        self.assertEqual([delta_e(x, (255, 0, 0), 'cie94') for x in a], delta_e_many(a, (255, 0, 0), 'cie94'))
+        self.assertEqual([delta_e((255, 0, 0), x, 'cie94') for x in a], delta_e_many(Color((255, 0, 0)), a, 'cie94'))
+        self.assertEqual([0.0], delta_e_many((1, 2, 3), (1, 2, 3)))
+        with self.assertRaises(ColorException):
+            delta_e_many(a, a[:2])
+
+    def test_delta_e_matrix(self):
+        a = [(0, 0, 0), (255, 0, 0), (46, 139, 87)]
+        b = [Color((10, 10, 10)), Color((0, 0, 255))]
+        expected = [[delta_e(x, y) for y in b] for x in a]
+        self.assertEqual(expected, delta_e_matrix(a, b))
+        self.assertEqual(expected, delta_e_matrix(ColorArray(a), b, chunk_size=2))
+        self.assertEqual(expected[0], next(iter_delta_e_matrix(a, b, chunk_size=1)))
+        self.assertEqual([], delta_e_matrix([], b))
+        with self.assertRaises(ColorException):
+            delta_e_matrix(a, b, chunk_size=0)
+
+    def test_delta_e_eq(self):
+        c = Color((46, 139, 87), equality_fn=DELTA_E_eq())
+        self.assertTrue(c == Color((46, 139, 88)))
+        self.assertTrue(c == Color((47, 139, 87)))
+        self.assertFalse(c == Color((46, 160, 87)))
+        self.assertTrue(Color((46, 139, 87), equality_fn=DELTA_E_eq(4, 'cie76')) == Color((50, 145, 87)))
+
+        with self.assertRaises(ColorException):
+            DELTA_E_eq(2, 'cie2001')
+        with self.assertRaises(ColorException):
+            equality_key(DELTA_E_eq())
@@ -41,6 +41,45 @@ class ColorUtilsTestCase(unittest.TestCase):
         self.assertFalse(_c1 == _c3)
         self.assertTrue(_c3 == _c4)
 
+    def test_equality_keys(self):
+        colors = [Color((10, 20, 30)), Color((10, 40, 60)), (10, 20, 30), PackedColor((11, 20, 30))]
+        for fn in (RGB_eq, RED_eq, GREEN_eq, BLUE_eq, HEX_eq, WEB_eq, YIQ_eq, HSV_eq):
+            key = equality_key(fn)
+            for c1 in colors:
+                for c2 in colors:
+                    _c1, _c2 = Color(c1) if isinstance(c1, tuple) else c1, Color(c2) if isinstance(c2, tuple) else c2
+                    self.assertEqual(fn(_c1, _c2), key(c1) == key(c2))
+
+        with self.assertRaises(ColorException):
+            equality_key(lambda c1, c2: True)
+
+    def test_equality_keys_bulk(self):
+        colors = [(10, 20, 30), (10, 40, 60), (0, 0, 0)]
+        for fn in (RGB_eq, RED_eq, HEX_eq, WEB_eq, HSV_eq):
+            self.assertEqual(equality_keys(colors, fn), equality_keys(ColorArray(colors), fn))
+
+    def test_unique(self):
+        colors = [Color((10, 20, 30)), Color((10, 40, 60)), Color((10, 20, 30)), Color((0, 0, 0))]
+        self.assertEqual([colors[0], colors[1], colors[3]], unique(colors))
+        self.assertEqual([colors[0], colors[3]], unique(colors, RED_eq))
+        self.assertEqual([colors[0], colors[1], colors[3]], unique(iter(colors)))
+
+        _a1 = unique(ColorArray(colors), HEX_eq)
+        self.assertIsInstance(_a1, ColorArray)
+        self.assertEqual([(10, 20, 30), (10, 40, 60), (0, 0, 0)], _a1.rgb)
+
+    def test_group_by(self):
+        colors = [(10, 20, 30), (10, 40, 60), (0, 0, 0)]
+        self.assertEqual({10: [(10, 20, 30), (10, 40, 60)], 0: [(0, 0, 0)]}, group_by(colors, RED_eq))
+
+        groups = group_by(ColorArray(colors), RED_eq)
+        self.assertEqual([(10, 20, 30), (10, 40, 60)], groups[10].rgb)
+
+    def test_count(self):
+        colors = ColorArray([(10, 20, 30), (10, 40, 60), (10, 20, 30)])
+        self.assertEqual({'#0a141e': 2, '#0a283c': 1}, count(colors, HEX_eq))
+        self.assertEqual({10: 3}, count(list(colors), RED_eq))
+
 
 if __name__ == '__main__':
     unittest.main()
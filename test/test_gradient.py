@@ -0,0 +1,61 @@
+import unittest
+from colorutils import *
+from colorutils.gradient import *
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def test_two_stop_gradient(self):
+        self.assertEqual([(0, 0, 0), (5.0, 10.0, 20.0), (10, 20, 40)], gradient([(0, 0, 0), (10, 20, 40)], 2))
+        self.assertEqual([(5.0, 10.0, 20.0)], gradient([(0, 0, 0), Color((10, 20, 40))], 2, inclusive=False))
+
+    def test_multi_stop_gradient(self):
+        run = gradient([(0, 0, 0), (100, 0, 0), (100, 100, 0)], 4)
+        self.assertEqual([(0, 0, 0), (50.0, 0.0, 0.0), (100, 0, 0), (100.0, 50.0, 0.0), (100, 100, 0)], run)
+
+    def test_gradient_positions(self):
+        run = gradient([(0, 0, 0), (100, 100, 100), (200, 200, 200)], 4, positions=[0.25, 0.5, 1])
+        self.assertEqual([(0, 0, 0), (0, 0, 0), (100, 100, 100), (150.0, 150.0, 150.0), (200, 200, 200)], run)
+
+        with self.assertRaises(ColorException):
+            gradient([(0, 0, 0), (1, 1, 1)], 4, positions=[1, 0])
+
+    def test_gradient_hsv_shortest_hue(self):
+        # Red (hue 0) to magenta (hue 300) passes through hue 330, not through green
+        run = gradient([(255, 0, 0), (255, 0, 255)], 2, space='hsv')
+        self.assertEqual(330.0, rgb_to_hsv(run[1])[0])
+        self.assertEqual((255, 0, 255), run[2])
+
+    def test_gradient_yiq(self):
+        run = gradient([(0, 0, 0), (255, 255, 255)], 2, space='yiq')
+        self.assertEqual(3, len(run))
+        self.assertTrue(all(abs(v - 127.5) < 2 for v in run[1]))
+
+    def test_gradient_easing(self):
+        linear = gradient([(0, 0, 0), (100, 100, 100)], 4, easing='linear')
+        eased = gradient([(0, 0, 0), (100, 100, 100)], 4, easing='ease-in')
+        custom = gradient([(0, 0, 0), (100, 100, 100)], 4, easing=lambda t: 1)
+
+        self.assertEqual((25.0, 25.0, 25.0), linear[1])
+        self.assertEqual((6.25, 6.25, 6.25), eased[1])
+        self.assertEqual((100, 100, 100), custom[1])
+
+        with self.assertRaises(ColorException):
+            gradient([(0, 0, 0), (1, 1, 1)], 4, easing='bounce')
+
+    def test_gradient_invalid(self):
+        with self.assertRaises(ColorException):
+            gradient([(0, 0, 0)], 4)
+
+        with self.assertRaises(ColorException):
+            gradient([(0, 0, 0), (1, 1, 1)], 0)
+
+        with self.assertRaises(ColorException):
+            gradient([(0, 0, 0), (1, 1, 1)], 4, space='lab')
+
+    def test_iter_gradient(self):
+        self.assertEqual(gradient([(0, 0, 0), (10, 10, 10)], 10), list(iter_gradient([(0, 0, 0), (10, 10, 10)], 10)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+# Imported first, as it exports the colorutils.colorutils module under the name of the package
+from colorutils import *
+import colorutils
+import colorutils.static
+import colorutils.palettes.grayscale as grayscale
+import colorutils.palettes.primary as primary
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(colorutils.__file__)))
+
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+import colorutils.palettes.primary
+elapsed = time.perf_counter() - start
+modules = [m for m in ('re', 'hashlib', 'colorutils.nearest', 'colorutils.gradient') if m in sys.modules]
+import json
+print(json.dumps({
+    'elapsed': elapsed,
+    'web_colors': 'web_colors' in vars(colorutils.static),
+    'palette': 'red' in vars(colorutils.palettes.primary),
+    'modules': modules,
+}))
+'''
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def _probe(self):
+        out = subprocess.check_output([sys.executable, '-S', '-c', PROBE], cwd=ROOT)
+        return json.loads(out.decode('utf-8'))
+
+    def test_import_is_lazy(self):
+        result = self._probe()
+        self.assertFalse(result['web_colors'])
+        self.assertFalse(result['palette'])
+        self.assertEqual([], result['modules'])
+
+    def test_import_time(self):
+        self.assertLess(min(self._probe()['elapsed'] for _ in range(3)), 0.25)
+
+    def test_web_colors(self):
+        self.assertIs(colorutils.static.web_colors, colorutils.web_colors)
+        self.assertIs(colorutils.static.web_colors, web_colors)
+        self.assertEqual('SeaGreen', web_colors[(46, 139, 87)])
+        self.assertEqual((46, 139, 87), web_colors['seagreen'])
+        self.assertEqual('SeaGreen', rgb_to_web((46, 139, 87)))
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from colorutils import *', namespace)
+        for name in ('Color', 'ColorArray', 'rgb_to_hex', 'color_run', 'rgb_max', 'web_colors'):
+            self.assertIn(name, namespace)
+        # The original submodules are still exported, but not the standard library or newer modules, nor internals
+        for name in ('colorutils', 'convert', 'equality', 'exceptions', 'static'):
+            self.assertIs(sys.modules['colorutils.' + name], namespace[name])
+        for name in ('sys', 'threading', 'collections', 'itertools', 'random', 'division', 'blend', 'SUBTRACT',
+                     'decode_hex_list'):
+            self.assertNotIn(name, namespace)
+        self.assertTrue(all(hasattr(colorutils, name) for name in colorutils.__all__))
+
+        namespace = {}
+        exec('from colorutils.palettes.grayscale import *', namespace)
+        self.assertEqual(Color((130, 130, 130)), namespace['gray'])
+        self.assertEqual(27, len(namespace['all']))
+
+    def test_palette(self):
+        self.assertEqual(Color((255, 0, 0)), primary.red)
+        self.assertIs(primary.red, primary.red)
+        self.assertEqual([primary.red, primary.yellow, primary.blue], primary.all)
+        self.assertIs(primary.all[0], primary.red)
+        self.assertIs(grayscale.all[-1], grayscale.white)
+        self.assertIn('yellow', dir(primary))
+
+        with self.assertRaises(AttributeError):
+            primary.green
@@ -0,0 +1,97 @@
+import threading
+import unittest
+from colorutils import *
+from colorutils import memo
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        memo.enable(size=16)
+
+    def tearDown(self):
+        memo.disable()
+
+    def test_enable(self):
+        self.assertTrue(memo.enabled())
+        memo.disable()
+        self.assertFalse(memo.enabled())
+        self.assertEqual({'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0, 'maxsize': 0}, memo.info())
+        self.assertEqual((46, 139, 87), hex_to_rgb('#2e8b57'))
+        memo.clear()
+
+        with self.assertRaises(ColorException):
+            memo.enable(size=0)
+
+    def test_results(self):
+        hexes = ['#2e8b57', '2E8B57', '#fff', 'FFF', '#000000', '#0a0b0c']
+        webs = ['SeaGreen', 'white', '#0ff', 'Teal', '#123456']
+        expected = {}
+        memo.disable()
+        for fn in (hex_to_rgb, hex_to_yiq, hex_to_hsv):
+            expected[fn] = [fn(h) for h in hexes]
+        for fn in (web_to_rgb, web_to_yiq, web_to_hsv):
+            expected[fn] = [fn(w) for w in webs]
+
+        memo.enable()
+        for _ in range(2):
+            for fn in (hex_to_rgb, hex_to_yiq, hex_to_hsv):
+                self.assertEqual(expected[fn], [fn(h) for h in hexes])
+            for fn in (web_to_rgb, web_to_yiq, web_to_hsv):
+                self.assertEqual(expected[fn], [fn(w) for w in webs])
+        self.assertEqual(expected[hex_to_hsv], hex_to_hsv_many(hexes))
+        self.assertEqual(Color((46, 139, 87)), Color(hex='#2E8B57'))
+
+        # hex_to_web and web_to_hex return unnamed input unchanged
+        self.assertEqual('#2E8B58', hex_to_web('#2E8B58'))
+        self.assertEqual('#FFFFFE', web_to_hex('#FFFFFE'))
+
+    def test_normalization(self):
+        for spelling in ('#ffffff', 'FFFFFF', '#FFF', 'fff', '#FfF'):
+            self.assertEqual((255, 255, 255), hex_to_rgb(spelling))
+        info = memo.info()
+        self.assertEqual(4, info['hits'])
+        self.assertEqual(1, info['misses'])
+        self.assertEqual(1, info['size'])
+
+        for spelling in ('SeaGreen', 'seagreen', 'SEAGREEN'):
+            web_to_hsv(spelling)
+        self.assertEqual(2, memo.info()['size'])
+        self.assertEqual(6, memo.info()['hits'])
+
+    def test_bounded(self):
+        for i in range(100):
+            hex_to_hsv('#{0:06x}'.format(i))
+        info = memo.info()
+        self.assertEqual(16, info['size'])
+        self.assertEqual(16, info['maxsize'])
+
+        memo.clear()
+        self.assertEqual({'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0, 'maxsize': 16}, memo.info())
+
+    def test_errors(self):
+        for value in ('white', '#ggg', '#gggggg'):
+            with self.assertRaises(ValueError):
+                hex_to_rgb(value)
+        with self.assertRaises(ValueError):
+            web_to_hsv('notacolor')
+        self.assertEqual(0, memo.info()['size'])
+
+    def test_threads(self):
+        errors = []
+
+        def worker():
+            for i in range(2000):
+                if hex_to_rgb('#{0:06x}'.format(i % 32)) != (0, 0, i % 32):
+                    errors.append(i)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual([], errors)
+        info = memo.info()
+        self.assertEqual(8000, info['hits'] + info['misses'])
+        self.assertEqual(16, info['size'])
@@ -0,0 +1,59 @@
+import random
+import unittest
+from colorutils import *
+from colorutils.nearest import *
+
+
+def _brute_force(points, point, metric):
+    tree = KDTree(points[:1], metric)
+    distances = [tree._distance(point, p) for p in points]
+    return distances.index(min(distances))
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def test_rgb_to_web_nearest(self):
+        self.assertEqual('#010000', rgb_to_web((1, 0, 0)))
+        self.assertEqual('Black', rgb_to_web((1, 0, 0), nearest=True))
+        self.assertEqual('Red', rgb_to_web((250, 3, 2), nearest=True))
+        self.assertEqual('SeaGreen', rgb_to_web((46, 139, 87), nearest=True))
+        self.assertEqual('Red', rgb_to_web((250, 3, 2), nearest=True, metric='manhattan'))
+
+        with self.assertRaises(ColorException):
+            rgb_to_web((1, 0, 0), nearest=True, metric='unknown')
+
+    def test_hex_to_web_nearest(self):
+        self.assertEqual('#010000', hex_to_web('#010000'))
+        self.assertEqual('Black', hex_to_web('#010000', nearest=True))
+        self.assertEqual('White', hex_to_web('#fefefe', nearest=True, metric='chebyshev'))
+
+    def test_web_many_nearest(self):
+        rgbs = [(1, 0, 0), (250, 3, 2), (1, 0, 0), (46, 139, 87)]
+        self.assertEqual(['Black', 'Red', 'Black', 'SeaGreen'], rgb_to_web_many(rgbs, nearest=True))
+        self.assertEqual(['#010000', '#fa0302'], rgb_to_web_many(rgbs[:2]))
+        self.assertEqual(['Black', 'White'], hex_to_web_many(['010000', '#fefefe'], nearest=True))
+        self.assertEqual(['Black', 'Red'], nearest_web_many(rgbs[:2]))
+
+    def test_kd_tree_matches_brute_force(self):
+        rand = random.Random(42)
+        points = [(rand.randint(0, 255), rand.randint(0, 255), rand.randint(0, 255)) for _ in range(300)]
+        queries = [(rand.randint(0, 255), rand.randint(0, 255), rand.randint(0, 255)) for _ in range(200)]
+
+        for metric in metrics:
+            tree = KDTree(points, metric)
+            for q in queries:
+                index, _ = tree.nearest(q)
+                self.assertEqual(tree._distance(q, points[_brute_force(points, q, metric)]),
+                                 tree._distance(q, points[index]))
+
+    def test_kd_tree_distance(self):
+        tree = KDTree([(0, 0, 0), (10, 10, 10)])
+        self.assertEqual((0, 5.0), tree.nearest((3, 0, 4)))
+        self.assertEqual([(1, 0.0), (0, 0.0)], tree.nearest_many([(10, 10, 10), [0, 0, 0]]))
+
+        with self.assertRaises(ColorException):
+            KDTree([]).nearest((0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
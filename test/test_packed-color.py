@@ -0,0 +1,78 @@
+import unittest
+import pickle
+from colorutils import *
+from colorutils.equality import RED_eq
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def test_packed_color_construction(self):
+        _c1 = PackedColor((46, 139, 87))
+
+        self.assertEqual((46, 139, 87), _c1.rgb)
+        self.assertEqual(_c1, PackedColor(Color((46, 139, 87))))
+        self.assertEqual(_c1, PackedColor(_c1))
+        self.assertEqual(_c1, PackedColor(hex='#2e8b57'))
+        self.assertEqual(_c1, PackedColor(web='SeaGreen'))
+        self.assertEqual(PackedColor((0, 255, 255)), PackedColor(hsv=(180, 1, 1)))
+        self.assertEqual((0, 0, 0), PackedColor().rgb)
+        self.assertEqual((0, 255, 0), PackedColor((-4, 255.4, 0.2)).rgb)
+
+        with self.assertRaises(TypeError):
+            PackedColor(cmyk=(0, 0, 0, 0))
+
+        with self.assertRaises(ColorException):
+            PackedColor((0, 0, 0), hex='#000')
+
+    def test_packed_color_properties(self):
+        _c1 = PackedColor((46, 139, 87))
+        _c2 = Color((46, 139, 87))
+
+        self.assertEqual(46, _c1.red)
+        self.assertEqual(139, _c1.green)
+        self.assertEqual(87, _c1.blue)
+        self.assertEqual(_c2.hex, _c1.hex)
+        self.assertEqual(_c2.web, _c1.web)
+        self.assertEqual(_c2.yiq, _c1.yiq)
+        self.assertEqual(_c2.hsv, _c1.hsv)
+        self.assertEqual('#000', PackedColor((0, 0, 0)).shorthex)
+        self.assertEqual(0x2e8b57, int(_c1))
+        self.assertEqual([46, 139, 87], list(_c1))
+
+    def test_packed_color_immutable(self):
+        _c1 = PackedColor((46, 139, 87))
+
+        with self.assertRaises(AttributeError):
+            _c1.red = 10
+
+        with self.assertRaises(AttributeError):
+            _c1.foo = 10
+
+    def test_packed_color_hashable(self):
+        colors = set([PackedColor((1, 2, 3)), PackedColor(hex='#010203'), PackedColor((3, 2, 1))])
+        self.assertEqual(2, len(colors))
+        self.assertEqual({PackedColor((1, 2, 3)): 'a'}[PackedColor(Color((1, 2, 3)))], 'a')
+        self.assertEqual(PackedColor((1, 2, 3)), pickle.loads(pickle.dumps(PackedColor((1, 2, 3)))))
+
+    def test_packed_color_interop(self):
+        self.assertTrue(PackedColor((1, 2, 3)) == Color((1, 2, 3)))
+        self.assertTrue(Color((1, 2, 3)) == PackedColor((1, 2, 3)))
+        self.assertTrue(Color([1, 2, 3]) == PackedColor((1, 2, 3)))
+        self.assertTrue(PackedColor((1, 2, 3)) == Color([1, 2, 3]))
+        self.assertFalse(Color([1, 2, 4]) == PackedColor((1, 2, 3)))
+        self.assertEqual(Color((1, 2, 3)), Color(PackedColor((1, 2, 3))))
+        self.assertEqual(PackedColor((30, 255, 30)), PackedColor((10, 200, 10)) + PackedColor((20, 100, 20)))
+        self.assertEqual(PackedColor((0, 100, 0)), PackedColor((10, 200, 10)) - (20, 100, 20))
+        self.assertEqual(Color((30, 255, 30)), Color((10, 200, 10)) + PackedColor((20, 100, 20)))
+        self.assertEqual(Color((0, 100, 0)), Color((10, 200, 10)) - PackedColor((20, 100, 20)))
+
+        # Equality against a Color uses the Color's equality function, either way around
+        _c1 = Color((1, 2, 3), equality_fn=RED_eq)
+        self.assertTrue(_c1 == PackedColor((1, 9, 9)))
+        self.assertTrue(PackedColor((1, 9, 9)) == _c1)
+        self.assertTrue(PackedColor((2, 2, 3)) != _c1)
+        self.assertFalse(PackedColor((2, 2, 3)) == _c1)
+
+
+if __name__ == '__main__':
+    unittest.main()
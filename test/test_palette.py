@@ -0,0 +1,70 @@
+import unittest
+from colorutils import *
+from colorutils.palettes import Palette
+import colorutils.palettes.grayscale as grayscale
+import colorutils.palettes.roygbv as roygbv
+
+
+def _brute_force(palette, rgb, space):
+    from colorutils.palettes import spaces
+    to_space = spaces[space][0]
+    point = to_space(rgb)
+    distances = [sum((a - b) ** 2 for a, b in zip(point, to_space(c.rgb))) for c in palette]
+    return distances.index(min(distances))
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def test_palette(self):
+        p = Palette([(255, 0, 0), Color((0, 255, 0)), PackedColor((0, 0, 255))])
+        self.assertEqual(3, len(p))
+        self.assertEqual('<Palette (3 colors)>', repr(p))
+        self.assertEqual([Color((255, 0, 0)), Color((0, 255, 0)), Color((0, 0, 255))], list(p))
+        self.assertEqual(Color((0, 255, 0)), p[1])
+        with self.assertRaises(KeyError):
+            p['red']
+        with self.assertRaises(ColorException):
+            Palette([(0, 0, 0)], names=['black', 'white'])
+
+    def test_from_module(self):
+        p = Palette.from_module(roygbv)
+        self.assertEqual(['red', 'orange', 'yellow', 'green', 'blue', 'violet'], p.names)
+        self.assertIs(roygbv.orange, p['orange'])
+        self.assertIs(roygbv.orange, p.nearest((250, 160, 10)))
+        self.assertEqual(27, len(Palette.from_module(grayscale)))
+
+    def test_nearest(self):
+        p = Palette.from_module(roygbv)
+        self.assertIs(roygbv.red, p.nearest((200, 10, 10)))
+        self.assertIs(roygbv.violet, p.nearest(Color((220, 120, 230)), space='hsv'))
+        self.assertIs(roygbv.yellow, p.nearest((240, 240, 60), space='lab'))
+        self.assertIs(roygbv.blue, p.nearest((10, 10, 200), space='yiq'))
+        self.assertEqual(4, p.nearest_index((10, 10, 200)))
+        self.assertIs(roygbv.red, p.nearest((200, 10, 10), metric='manhattan'))
+
+    def test_nearest_hue_wraps(self):
+        p = Palette([(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+        # A red with a hue just under 360 is nearest to red (hue 0)
+        self.assertEqual(Color((255, 0, 0)), p.nearest((255, 0, 10), space='hsv'))
+
+    def test_nearest_many(self):
+        p = Palette(random_rgb_many(200, rng=1))
+        colors = random_rgb_many(300, rng=2)
+        for space in ('rgb', 'yiq', 'hsv', 'lab'):
+            indices = p.nearest_indices(colors, space)
+            self.assertEqual([_brute_force(p, rgb, space) for rgb in colors.rgb], indices)
+            self.assertEqual(indices, p.nearest_indices(colors.tobytes(), space))
+            self.assertEqual(indices, p.nearest_indices(list(colors), space))
+
+            matched = p.nearest_many(colors, space)
+            self.assertIsInstance(matched, ColorArray)
+            self.assertEqual([p[i].rgb for i in indices], matched.rgb)
+
+    def test_index_cache(self):
+        p = Palette.from_module(roygbv)
+        self.assertIs(p.index('lab'), p.index('lab'))
+        self.assertIsNot(p.index('lab'), p.index('lab', 'manhattan'))
+        with self.assertRaises(ColorException):
+            p.index('cmyk')
+        with self.assertRaises(ColorException):
+            Palette([]).nearest((0, 0, 0))
@@ -0,0 +1,91 @@
+import os
+import unittest
+from colorutils import *
+from colorutils import convert
+from colorutils.parallel import ParallelConverter, convert_many
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.converter = ParallelConverter(workers=2, chunk_size=1000)
+        cls.colors = random_rgb_many(5500, rng=3)
+        cls.rgbs = cls.colors.rgb
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.converter.close()
+
+    def test_convert_from_rgb(self):
+        for target in ('hex', 'web', 'yiq', 'hsv', 'lab'):
+            fn = getattr(convert, 'rgb_to_{}_many'.format(target))
+            self.assertEqual(fn(self.rgbs), self.converter.convert(self.colors, 'rgb', target))
+            self.assertEqual(fn(self.rgbs), self.converter.convert(self.rgbs, 'rgb', target))
+        self.assertEqual(convert.rgb_to_hsv_many(self.rgbs), self.converter.convert(self.colors.tobytes(), 'rgb', 'hsv'))
+
+    def test_convert_kwargs(self):
+        self.assertEqual(convert.rgb_to_web_many(self.rgbs, nearest=True),
+                         self.converter.convert(self.colors, 'rgb', 'web', nearest=True))
+
+    def test_convert_from_strings(self):
+        hexes = convert.rgb_to_hex_many(self.rgbs)
+        rgbs = self.converter.convert(hexes, 'hex', 'rgb')
+        self.assertEqual(self.rgbs, rgbs)
+        self.assertIsInstance(rgbs[0][0], int)
+
+        webs = convert.rgb_to_web_many(self.rgbs, nearest=True)
+        self.assertEqual(convert.web_to_hsv_many(webs), self.converter.convert(webs, 'web', 'hsv'))
+        webs.append('NotAWebColor')
+        self.assertEqual(convert.web_to_hex_many(webs), self.converter.convert(webs, 'web', 'hex'))
+
+    def test_convert_from_floats(self):
+        hsvs = convert.rgb_to_hsv_many(self.rgbs)
+        self.assertEqual(convert.hsv_to_rgb_many(hsvs), self.converter.convert(hsvs, 'hsv', 'rgb'))
+        yiqs = convert.rgb_to_yiq_many(self.rgbs)
+        self.assertEqual(convert.yiq_to_hex_many(yiqs), self.converter.convert(iter(yiqs), 'yiq', 'hex'))
+
+    def test_result_types(self):
+        # Integer and float components (and signed zeros) come back as the bulk functions return them
+        rgbs = [(0, 0, 0), (5, 5, 5)] * 1500
+        self.assertEqual(repr(convert.rgb_to_hsv_many(rgbs)), repr(self.converter.convert(rgbs, 'rgb', 'hsv')))
+        self.assertEqual('(0, 0, 0.0)', repr(self.converter.convert(rgbs, 'rgb', 'hsv')[0]))
+        self.assertEqual(repr(convert.rgb_to_yiq_many(rgbs)), repr(self.converter.convert(rgbs, 'rgb', 'yiq')))
+
+        # As are the components of numeric colors to convert
+        hsvs = [(0, 0, 0), (120, 1, 1)] * 1500
+        self.assertEqual(repr(convert.hsv_to_rgb_many(hsvs)), repr(self.converter.convert(hsvs, 'hsv', 'rgb')))
+        yiqs = convert.rgb_to_yiq_many(self.rgbs)
+        self.assertEqual(repr(convert.yiq_to_rgb_many(yiqs)), repr(self.converter.convert(yiqs, 'yiq', 'rgb')))
+
+    def test_serial(self):
+        self.assertEqual(convert.rgb_to_hsv_many(self.rgbs[:10]), convert_many(self.rgbs[:10], 'rgb', 'hsv'))
+        self.assertEqual(convert.rgb_to_hsv_many(self.rgbs), convert_many(self.colors, 'rgb', 'hsv', workers=1))
+        self.assertEqual([], self.converter.convert([], 'rgb', 'hsv'))
+
+    def test_shared_memory_released(self):
+        if not os.path.isdir('/dev/shm'):
+            self.skipTest('shared memory blocks are not visible on this platform')
+        before = set(os.listdir('/dev/shm'))
+        self.converter.convert(self.colors, 'rgb', 'hsv')
+        # An error raised in a worker is re-raised, after the blocks are released
+        with self.assertRaises(ValueError):
+            self.converter.convert(['#abcdef'] * 2000 + ['#zzzzzz'], 'hex', 'rgb')
+        self.assertEqual(set(), set(os.listdir('/dev/shm')) - before)
+
+    def test_shared_memory_unmapped(self):
+        if not os.path.exists('/proc/self/maps'):
+            self.skipTest('process memory maps are not visible on this platform')
+        self.converter.convert(self.colors, 'rgb', 'hsv')
+        # Idle workers do not keep the blocks of a finished job mapped (the pool's own semaphores aside)
+        for process in self.converter._pool._pool:
+            with open('/proc/{}/maps'.format(process.pid)) as maps:
+                self.assertEqual([], [line for line in maps if '/dev/shm/' in line and '/dev/shm/sem.' not in line])
+
+    def test_invalid(self):
+        with self.assertRaises(ColorException):
+            self.converter.convert(self.rgbs, 'rgb', 'cmyk')
+        with self.assertRaises(ColorException):
+            self.converter.convert(self.colors.tobytes(), 'hsv', 'rgb')
+        with self.assertRaises(ColorException):
+            ParallelConverter(chunk_size=0)
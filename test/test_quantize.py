@@ -0,0 +1,74 @@
+import random
+import unittest
+from colorutils import *
+from colorutils.quantize import *
+from colorutils.palettes import rgb
+
+
+def _image(colors, count, noise, seed=0):
+    rand = random.Random(seed)
+    pixels = bytearray()
+    for i in range(count):
+        for v in colors[i % len(colors)]:
+            pixels.append(min(255, max(0, v + rand.randint(-noise, noise))))
+    return bytes(pixels)
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    colors = [(200, 30, 30), (30, 200, 30), (30, 30, 200)]
+
+    def _assert_palette(self, palette, weights):
+        self.assertEqual(3, len(palette))
+        self.assertAlmostEqual(1.0, sum(weights))
+        for expected in self.colors:
+            self.assertTrue(any(all(abs(a - b) <= 4 for a, b in zip(expected, c)) for c in palette.rgb))
+
+    def test_histogram(self):
+        hist = histogram([(0, 0, 0), (1, 1, 1), (255, 255, 255)], bits=5)
+        self.assertEqual([((0.5, 0.5, 0.5), 2), ((255, 255, 255), 1)], sorted(hist))
+        self.assertEqual(3, len(histogram([(0, 0, 0), (1, 1, 1), (255, 255, 255)], bits=8)))
+        self.assertEqual(10, sum(n for _, n in histogram(_image(self.colors, 100, 8), sample_size=10)))
+
+    def test_median_cut(self):
+        palette, weights = median_cut(_image(self.colors, 3000, 6), 3)
+        self._assert_palette(palette, weights)
+
+        palette, weights = median_cut([(10, 10, 10)] * 5, 4)
+        self.assertEqual([(10, 10, 10)], palette.rgb)
+        self.assertEqual([1.0], weights)
+
+    def test_kmeans(self):
+        palette, weights = kmeans(ColorArray(_image(self.colors, 3000, 6)), 3, seed=7)
+        self._assert_palette(palette, weights)
+        self.assertEqual(palette, kmeans(_image(self.colors, 3000, 6), 3, seed=7)[0])
+
+    def test_kmeans_mini_batch(self):
+        palette, weights = kmeans(_image(self.colors, 3000, 6), 3, seed=7, mini_batch=200)
+        self._assert_palette(palette, weights)
+
+    def test_empty_and_invalid(self):
+        self.assertEqual((ColorArray(), []), kmeans([], 3))
+        self.assertEqual((ColorArray(), []), median_cut(b'', 3))
+
+        with self.assertRaises(ColorException):
+            kmeans([(0, 0, 0)], 0)
+
+        # Colors are binned by 1 to 8 bits per channel
+        for bits in (0, 9, -1, 4.5):
+            with self.assertRaises(ColorException):
+                histogram([(0, 0, 0)], bits=bits)
+            with self.assertRaises(ColorException):
+                median_cut([(0, 0, 0)], 3, bits=bits)
+            with self.assertRaises(ColorException):
+                kmeans([], 3, bits=bits)
+        self.assertEqual(2, len(histogram([(0, 0, 0), (100, 100, 100), (255, 255, 255)], bits=1)))
+
+    def test_match_palette(self):
+        palette, _ = kmeans(_image(self.colors, 3000, 6), 3, seed=7)
+        matched = match_palette(palette, rgb.all)
+        self.assertEqual(sorted(c.rgb for c in rgb.all), sorted(c.rgb for c in matched))
+
+
+if __name__ == '__main__':
+    unittest.main()
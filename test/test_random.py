@@ -1,3 +1,4 @@
+import random
 import unittest
 from colorutils import *
 
@@ -17,6 +18,64 @@ class ColorUtilsTestCase(unittest.TestCase):
             for char in random_hex()[1:]:
                 self.assertTrue(char in test_set)
 
+    def test_iter_random_rgb(self):
+        colors = list(iter_random_rgb(100))
+        self.assertEqual(100, len(colors))
+        for color in colors:
+            self.assertEqual(3, len(color))
+            self.assertTrue(all(0 <= v <= 255 for v in color))
+
+        endless = iter_random_rgb()
+        self.assertEqual(3, len([next(endless) for _ in range(3)]))
+
+    def test_iter_random_rgb_chunks(self):
+        chunks = list(iter_random_rgb(250, chunk_size=100))
+        self.assertEqual([100, 100, 50], [len(c) for c in chunks])
+        self.assertTrue(all(isinstance(c, ColorArray) for c in chunks))
+
+    def test_iter_offset_random_rgb(self):
+        colors = list(iter_offset_random_rgb((100, 50, 0), 50))
+        self.assertEqual(50, len(colors))
+        for r, g, b in colors:
+            self.assertTrue(100 <= r <= 255)
+            self.assertTrue(50 <= g <= 255)
+            self.assertEqual(0, b)
+
+        self.assertEqual([10, 10], [len(c) for c in iter_offset_random_rgb((1, 1, 1), 20, chunk_size=10)])
+
+    def test_random_rgb_many(self):
+        colors = random_rgb_many(1000, rng=42)
+        self.assertIsInstance(colors, ColorArray)
+        self.assertEqual(1000, len(colors))
+        self.assertEqual(colors, random_rgb_many(1000, rng=42))
+        self.assertNotEqual(colors, random_rgb_many(1000, rng=43))
+        self.assertEqual(colors.tobytes(), random_rgb_many(1000, rng=random.Random(42), packed=True))
+        self.assertEqual(b'', random_rgb_many(0, packed=True))
+
+    def test_random_hex_web_many(self):
+        hexes = random_hex_many(100, rng=1)
+        self.assertEqual(rgb_to_hex_many(random_rgb_many(100, rng=1).rgb), hexes)
+        self.assertEqual(rgb_to_web_many(random_rgb_many(100, rng=1).rgb), random_web_many(100, rng=1))
+
+    def test_offset_random_many(self):
+        colors = offset_random_rgb_many((100, 50, 0), 100, rng=7)
+        self.assertEqual(100, len(colors))
+        self.assertEqual(colors, offset_random_rgb_many((100, 50, 0), 100, rng=7))
+        for r, g, b in colors.rgb:
+            self.assertTrue(100 <= r <= 255)
+            self.assertEqual(0, b)
+
+        self.assertEqual(colors.hex, offset_random_hex_many((100, 50, 0), 100, rng=7))
+        self.assertEqual(colors.web, offset_random_web_many((100, 50, 0), 100, rng=7))
+
+    def test_random_streams(self):
+        streams = random_streams(42, 4)
+        again = random_streams(42, 4)
+
+        first = [random_rgb_many(10, rng=s) for s in streams]
+        self.assertEqual(first, [random_rgb_many(10, rng=s) for s in again])
+        self.assertEqual(4, len(set(c.tobytes() for c in first)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,143 @@
+import pickle
+import unittest
+from colorutils import *
+from colorutils import blend
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.sources = [(255, 0, 0, 128), (0, 255, 0, 64), (10, 20, 30, 255), (200, 100, 50, 0), (1, 2, 3, 1)]
+        self.destinations = [(5, 6, 7, 200), (0, 0, 255, 255), (9, 9, 9, 0), (40, 80, 120, 77), (250, 250, 250, 254)]
+
+    def test_hex(self):
+        self.assertEqual('#2e8b5780', rgba_to_hex((46, 139, 87, 128)))
+        self.assertEqual((46, 139, 87, 128), hex_to_rgba('#2e8b5780'))
+        self.assertEqual((46, 139, 87, 255), hex_to_rgba('2E8B57'))
+        self.assertEqual((255, 0, 0, 136), hex_to_rgba('#f008'))
+        self.assertEqual((255, 0, 0, 255), hex_to_rgba('#f00'))
+        self.assertEqual(['#2e8b5780', '#000000ff'], rgba_to_hex_many([(46, 139, 87, 128), (0, 0, 0, 255)]))
+        self.assertEqual([(46, 139, 87, 128), (0, 0, 0, 255)], hex_to_rgba_many(['#2e8b5780', '#000']))
+
+    def test_color(self):
+        c = RGBAColor((46, 139, 87, 128))
+        self.assertEqual((46, 139, 87, 128), c.rgba)
+        self.assertEqual((46, 139, 87), c.rgb)
+        self.assertEqual(128, c.alpha)
+        self.assertEqual('#2e8b5780', c.hex)
+        self.assertEqual(Color((46, 139, 87)), c.color)
+        self.assertEqual('<RGBAColor (46, 139, 87, 128)>', repr(c))
+
+        self.assertEqual(c, RGBAColor(hex='#2e8b5780'))
+        self.assertEqual(c, RGBAColor(Color((46, 139, 87)), alpha=128))
+        self.assertEqual(c, RGBAColor(PackedColor((46, 139, 87)), alpha=128))
+        self.assertEqual(c, pickle.loads(pickle.dumps(c)))
+        self.assertEqual(hash(c), hash(RGBAColor(c)))
+        self.assertEqual((0, 0, 0, 255), RGBAColor().rgba)
+        self.assertEqual((46, 139, 87, 255), RGBAColor((46, 139, 87)).rgba)
+        self.assertEqual((255, 0, 0, 0), RGBAColor((300, 0, 0, -1)).rgba)
+
+        with self.assertRaises(AttributeError):
+            c.alpha = 255
+        with self.assertRaises(ColorException):
+            RGBAColor((1, 2))
+
+    def test_premultiply(self):
+        self.assertEqual((128, 0, 0, 128), blend.premultiply((255, 0, 0, 128)))
+        self.assertEqual((255, 0, 0, 128), blend.unpremultiply((128, 0, 0, 128)))
+        self.assertEqual((0, 0, 0, 0), blend.premultiply((200, 100, 50, 0)))
+        self.assertEqual((0, 0, 0, 0), blend.unpremultiply((0, 0, 0, 0)))
+
+        # Opaque colors are unchanged, and premultiplying round-trips
+        quads = bytes(v for c in range(256) for v in (c, 255 - c, c // 2, 255))
+        self.assertEqual(quads, bytes(blend.premultiply_packed(quads)))
+        self.assertEqual(quads, bytes(blend.unpremultiply_packed(blend.premultiply_packed(quads))))
+
+    def test_composite(self):
+        opaque = RGBAColor((255, 0, 0, 128)).over((0, 0, 255))
+        self.assertEqual((128, 0, 127, 255), opaque.rgba)
+        self.assertEqual((255, 0, 0, 128), RGBAColor((255, 0, 0, 128)).composite((0, 0, 255), 'src').rgba)
+        self.assertEqual((0, 0, 0, 0), RGBAColor((255, 0, 0, 128)).composite((0, 0, 255), 'clear').rgba)
+
+        with self.assertRaises(ColorException):
+            RGBAColor().composite(RGBAColor(), 'plus')
+
+    def test_packed_matches_scalar(self):
+        src, dst = RGBAArray(self.sources), RGBAArray(self.destinations)
+        for op in blend.porter_duff:
+            expected = [RGBAColor(s).composite(d, op).rgba for s, d in zip(self.sources, self.destinations)]
+            self.assertEqual(expected, src.composite(dst, op).rgba, op)
+
+            # Premultiplied arrays composite in their own storage
+            expected = bytes(v for s, d in zip(src, dst) for v in blend.composite(s.premultiplied, d.premultiplied, op))
+            self.assertEqual(expected, RGBAArray(src, premultiplied=True).composite(dst, op).tobytes(), op)
+
+    def test_straight_packed(self):
+        # Every pair of alpha values, with colors that tie when rounded, across more than one chunk of colors
+        src = bytes(v for sa in range(256) for da in range(256) for v in (sa, 255 - da, (sa * da) % 256, sa))
+        dst = bytes(v for sa in range(256) for da in range(256) for v in (255 - sa, da, (sa + da) % 256, da))
+        for op in ('over', 'xor', 'in', 'dest-atop'):
+            expected = bytes(v for i in range(0, len(src), 4)
+                             for v in blend.composite_straight(src[i:i + 4], dst[i:i + 4], op))
+            self.assertEqual(expected, blend.composite_straight_packed(src, dst, op), op)
+        self.assertEqual(b'', blend.composite_straight_packed(b'', b''))
+
+    def test_identity(self):
+        # Compositing over or under a fully transparent color leaves a straight color unchanged
+        color, clear = RGBAColor((200, 100, 50, 10)), RGBAColor((0, 0, 0, 0))
+        self.assertEqual(color, color.over(clear))
+        self.assertEqual(color, clear.over(color))
+        self.assertEqual(color, color.composite(clear, 'src'))
+        self.assertEqual(color, clear.composite(color, 'dst'))
+
+        a = RGBAArray([(200, 100, 50, 10), (1, 2, 3, 1), (46, 139, 87, 128)])
+        transparent = RGBAArray([(0, 0, 0, 0)] * len(a))
+        self.assertEqual(a.rgba, a.over(transparent).rgba)
+        self.assertEqual(a.rgba, transparent.over(a).rgba)
+        self.assertEqual(a.rgba, RGBAArray.flatten([transparent, a, transparent]).rgba)
+
+    def test_array(self):
+        a = RGBAArray([(255, 0, 0, 128), RGBAColor((0, 255, 0, 64)), (10, 20, 30), Color((1, 2, 3))])
+        self.assertEqual(4, len(a))
+        self.assertEqual('<RGBAArray (4 colors)>', repr(a))
+        self.assertEqual([(255, 0, 0, 128), (0, 255, 0, 64), (10, 20, 30, 255), (1, 2, 3, 255)], a.rgba)
+        self.assertEqual([128, 64, 255, 255], a.alpha)
+        self.assertEqual(['#ff000080', '#00ff0040', '#0a141eff', '#010203ff'], a.hex)
+        self.assertEqual(RGBAColor((0, 255, 0, 64)), a[1])
+        self.assertEqual([(255, 0, 0, 128), (10, 20, 30, 255)], a[::2].rgba)
+        self.assertEqual([(10, 20, 30, 255), (1, 2, 3, 255)], RGBAArray(ColorArray([(10, 20, 30), (1, 2, 3)])).rgba)
+
+        p = RGBAArray(a, premultiplied=True)
+        self.assertEqual('<RGBAArray (4 colors, premultiplied)>', repr(p))
+        self.assertEqual(bytes(blend.premultiply_packed(a.tobytes())), p.tobytes())
+        self.assertEqual(a, p)
+        self.assertEqual(a[1], p[1])
+
+        with self.assertRaises(ColorException):
+            RGBAArray(b'\x00\x00\x00')
+        with self.assertRaises(ColorException):
+            a.over(RGBAArray([(0, 0, 0)]))
+
+    def test_array_over(self):
+        a = RGBAArray([(255, 0, 0, 128), (0, 255, 0, 64)])
+        self.assertEqual([(128, 0, 127, 255), (0, 64, 191, 255)], a.over((0, 0, 255)).rgba)
+        self.assertEqual([(128, 0, 127, 255), (0, 255, 0, 64)],
+                         a.over(RGBAArray([(0, 0, 255, 255), (0, 0, 0, 0)])).rgba)
+
+        p = RGBAArray(a, premultiplied=True).over((0, 0, 255))
+        self.assertTrue(p.premultiplied)
+        self.assertEqual(a.over((0, 0, 255)), p)
+
+    def test_flatten(self):
+        bottom = RGBAArray([(0, 0, 255)] * len(self.sources))
+        middle = RGBAArray(self.destinations)
+        top = RGBAArray(self.sources)
+        expected = [RGBAColor(t).over(RGBAColor(m).over(b)) for t, m, b in zip(self.sources, self.destinations,
+                                                                                bottom.rgba)]
+        flattened = RGBAArray.flatten([bottom, middle, top])
+        self.assertEqual(len(expected), len(flattened))
+        self.assertEqual([c.rgba for c in expected], flattened.rgba)
+        self.assertTrue(RGBAArray.flatten([bottom, middle, top], premultiplied=True).premultiplied)
+
+        with self.assertRaises(ColorException):
+            RGBAArray.flatten([])
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from colorutils import *
+from colorutils import convert
+from colorutils.server import BatchConverter, ConversionClient, handle_request, start_server
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    def test_batching(self):
+        async def run():
+            converter = BatchConverter(window=0.01)
+            results = await asyncio.gather(
+                converter.convert(['#2e8b57'], 'hex', 'hsv'),
+                converter.convert(['#000000', '#ffffff'], 'hex', 'hsv'),
+                converter.convert([(0, 0, 0)], 'rgb', 'hex'),
+            )
+            return converter, results
+
+        converter, results = asyncio.run(run())
+        self.assertEqual([[(146.452, 0.669, 0.545)], [(0.0, 0.0, 0.0), (0.0, 0.0, 1.0)], ['#000000']], results)
+
+        metrics = converter.metrics.snapshot()
+        self.assertEqual(3, metrics['requests'])
+        self.assertEqual(2, metrics['batches'])
+        self.assertEqual(4, metrics['values'])
+        self.assertEqual(3, metrics['max_batch'])
+        self.assertEqual(0, metrics['queue_depth'])
+        self.assertEqual(4, metrics['max_queue_depth'])
+        self.assertTrue(0 < metrics['p50_ms'] <= metrics['p99_ms'])
+
+    def test_max_batch(self):
+        async def run():
+            converter = BatchConverter(window=10, max_batch=2)
+            results = await asyncio.gather(converter.convert(['#000000'], 'hex', 'rgb'),
+                                           converter.convert(['#ffffff'], 'hex', 'rgb'))
+            return converter, results
+
+        converter, results = asyncio.run(run())
+        self.assertEqual([[(0, 0, 0)], [(255, 255, 255)]], results)
+        self.assertEqual(1, converter.metrics.batches)
+
+    def test_errors(self):
+        async def run():
+            converter = BatchConverter(window=0.001)
+            responses = await asyncio.gather(
+                handle_request(converter, {'id': 1, 'from': 'hex', 'to': 'rgb', 'values': ['#000000']}),
+                handle_request(converter, {'id': 2, 'from': 'hex', 'to': 'rgb', 'values': ['#zzzzzz']}),
+                handle_request(converter, {'id': 3, 'from': 'hex', 'to': 'rgb', 'value': '#fff'}),
+                handle_request(converter, {'id': 4, 'from': 'hex', 'to': 'cmyk', 'values': []}),
+                handle_request(converter, {'id': 5, 'from': 'rgb', 'to': 'hex', 'values': 'red'}),
+                handle_request(converter, [1]),
+            )
+            return converter, responses
+
+        converter, responses = asyncio.run(run())
+        self.assertEqual({'id': 1, 'result': [(0, 0, 0)]}, responses[0])
+        self.assertIn('error', responses[1])
+        self.assertEqual({'id': 3, 'result': (255, 255, 255)}, responses[2])
+        self.assertEqual('Cannot convert from hex to cmyk', responses[3]['error'])
+        self.assertIn('error', responses[4])
+        self.assertEqual(None, responses[5]['id'])
+        self.assertEqual(1, converter.metrics.errors)
+
+        with self.assertRaises(ColorException):
+            BatchConverter(max_batch=0)
+
+    def _serve(self, **kwargs):
+        """ Run a server on a background event loop, returning its address. """
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(start_server(BatchConverter(), **kwargs))
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            server.close()
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
+        self.addCleanup(stop)
+        return server.sockets[0].getsockname()
+
+    def test_client(self):
+        host, port = self._serve(port=0)[:2]
+        rgbs = random_rgb_many(100, rng=5).rgb
+        with ConversionClient(host, port) as client:
+            self.assertEqual(convert.rgb_to_hsv_many(rgbs), client.convert(rgbs, 'rgb', 'hsv'))
+            self.assertEqual(convert.rgb_to_hex_many(rgbs), client.convert(rgbs, 'rgb', 'hex'))
+            with self.assertRaises(ColorException):
+                client.convert(['#000000'], 'hex', 'cmyk')
+            self.assertEqual(2, client.metrics()['batches'])
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are not supported on this platform')
+    def test_unix_socket(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path = os.path.join(tmp, 'colorutils.sock')
+        self._serve(path=path)
+        with ConversionClient(path=path) as client:
+            self.assertEqual(['SeaGreen'], client.convert([(46, 139, 87)], 'rgb', 'web'))
+
+    def test_pipelining(self):
+        host, port = self._serve(port=0)[:2]
+        with socket.create_connection((host, port)) as sock:
+            stream = sock.makefile('rwb')
+            stream.write(b'{"id": 1, "from": "web", "to": "hex", "values": ["red"]}\n\n'
+                         b'not json\n'
+                         b'{"id": 2, "from": "rgb", "to": "hex", "values": [[0, 0, 255]]}\n')
+            stream.flush()
+            lines = sorted(stream.readline() for _ in range(3))
+        self.assertEqual(b'{"id": 1, "result": ["#ff0000"]}\n', lines[0])
+        self.assertEqual(b'{"id": 2, "result": ["#0000ff"]}\n', lines[1])
+        self.assertTrue(lines[2].startswith(b'{"id": null, "error": "Invalid JSON'))
+
+    def test_oversized_request(self):
+        host, port = self._serve(port=0, limit=1024)[:2]
+        with socket.create_connection((host, port)) as sock:
+            stream = sock.makefile('rwb')
+            values = ['#{:06x}'.format(i) for i in range(1000)]
+            stream.write(b'{"id": 1, "from": "hex", "to": "rgb", "values": ' + json.dumps(values).encode() + b'}\n'
+                         b'{"id": 2, "from": "rgb", "to": "hex", "values": [[0, 0, 255]]}\n')
+            stream.flush()
+            error, response = stream.readline(), stream.readline()
+        self.assertEqual(b'{"id": null, "error": "Request line exceeds the limit of 1024 bytes"}\n', error)
+        self.assertEqual(b'{"id": 2, "result": ["#0000ff"]}\n', response)
+
+        with self.assertRaises(ColorException):
+            asyncio.run(start_server(BatchConverter(), port=0, limit=0))
+
+    def test_serve_command(self):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        process = subprocess.Popen([sys.executable, '-m', 'colorutils', 'serve', '--port', str(port), '-q'], cwd=root)
+        self.addCleanup(process.wait)
+        self.addCleanup(process.terminate)
+
+        deadline = time.time() + 10
+        while True:
+            try:
+                client = ConversionClient(port=port)
+                break
+            except OSError:
+                if time.time() > deadline:
+                    raise
+                time.sleep(0.05)
+        with client:
+            self.assertEqual([(0, 255, 255)], client.convert(['cyan'], 'web', 'rgb'))
@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from colorutils import *
+from colorutils import convert, tables
+from colorutils.nearest import nearest_web
+
+
+class ColorUtilsTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dir = tempfile.mkdtemp()
+        for kind in tables.kinds:
+            tables.build_table(kind, cls.dir, count=1 << 12)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.dir)
+
+    def tearDown(self):
+        tables.disable()
+
+    def test_build_table(self):
+        self.assertEqual(os.path.join(self.dir, 'rgb_to_hsv.table'), tables.table_path('hsv', self.dir))
+        self.assertTrue(os.path.exists(tables.table_path('hsv', self.dir)))
+
+        with self.assertRaises(ColorException):
+            tables.build_table('hsv', self.dir, count=1000)
+        with self.assertRaises(ColorException):
+            tables.build_table('lab', self.dir)
+
+    def test_lookup(self):
+        for kind in tables.kinds:
+            table = tables.load_table(kind, self.dir)
+            fn = nearest_web if kind == 'web' else getattr(convert, '_rgb_to_{}'.format(kind))
+            self.assertEqual(1 << 12, table.count)
+            for i in range(0, 1 << 12, 7):
+                rgb = (0, i >> 8, i & 0xff)
+                self.assertEqual(fn(rgb), table.lookup(rgb))
+                if kind != 'web':
+                    self.assertEqual(repr(fn(rgb)), repr(table.lookup(rgb)))
+
+            self.assertIsNone(table.lookup((0, 16, 0)))
+            self.assertIsNone(table.lookup((0, 0, 0.5)))
+            self.assertIsNone(table.lookup((0, 0, 256)))
+            self.assertIsNone(table.lookup((0, 0, -1)))
+            table.close()
+
+    def test_enable(self):
+        self.assertEqual(['hsv', 'web', 'yiq'], tables.enable(directory=self.dir))
+        self.assertEqual(set(tables.kinds), set(tables.enabled()))
+
+        self.assertEqual((210.0, 0.5, 0.016), rgb_to_hsv((2, 3, 4)))
+        self.assertEqual((0.011, -0.004, 0.0), rgb_to_yiq((2, 3, 4)))
+        self.assertEqual('Black', rgb_to_web((2, 3, 4), nearest=True))
+        self.assertEqual('#020304', rgb_to_web((2, 3, 4)))
+
+        # Negative zeros are kept
+        self.assertEqual('[0.006, -0.006, -0.0]', json.dumps(rgb_to_yiq((0, 2, 3))))
+        self.assertEqual(json.dumps(convert._rgb_to_yiq((0, 2, 3))), json.dumps(rgb_to_yiq((0, 2, 3))))
+
+        # Colors outside of the table fall back to the scalar conversion
+        self.assertEqual((146.452, 0.669, 0.545), rgb_to_hsv((46, 139, 87)))
+        self.assertEqual('SeaGreen', rgb_to_web((45, 139, 87), nearest=True))
+
+        tables.disable(['hsv'])
+        self.assertEqual(['web', 'yiq'], sorted(tables.enabled()))
+
+    def test_enable_absent(self):
+        empty = tempfile.mkdtemp()
+        try:
+            self.assertEqual([], tables.enable(directory=empty))
+            self.assertEqual({}, tables.enabled())
+            self.assertEqual((146.452, 0.669, 0.545), rgb_to_hsv((46, 139, 87)))
+        finally:
+            shutil.rmtree(empty)
+
+    def test_invalid_table(self):
+        bad = tempfile.mkdtemp()
+        try:
+            with open(tables.table_path('hsv', bad), 'wb') as f:
+                f.write(b'not a table')
+            shutil.copy(tables.table_path('yiq', self.dir), tables.table_path('web', bad))
+            self.assertIsNone(tables.load_table('hsv', bad))
+            self.assertIsNone(tables.load_table('web', bad))
+            self.assertEqual([], tables.enable(directory=bad))
+        finally:
+            shutil.rmtree(bad)
+
+    def test_bulk(self):
+        packed = bytes(bytearray([0, 1, 2, 0, 15, 255, 0, 0, 0]))
+        expected_hsv = rgb_to_hsv_many(packed)
+        expected_yiq = rgb_to_yiq_many(packed)
+
+        tables.enable(directory=self.dir)
+        self.assertEqual(expected_hsv, rgb_to_hsv_many(packed))
+        self.assertEqual(expected_yiq, rgb_to_yiq_many(packed))
+        self.assertEqual(expected_hsv, rgb_to_hsv_many([(0, 1, 2), (0, 15, 255), (0, 0, 0)]))
+        self.assertEqual('(0, 0, 0.0)', repr(rgb_to_hsv((0, 0, 0))))
+
+        # Buffers with colors outside of the table fall back to the scalar conversion
+        packed = bytes(bytearray([46, 139, 87, 0, 0, 0]))
+        self.assertEqual([(146.452, 0.669, 0.545), (0, 0, 0.0)], rgb_to_hsv_many(packed))
+        self.assertEqual([], rgb_to_hsv_many(b''))